@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import NoReturn
+import argparse
+from typing import NoReturn, Optional
 from src.agents.orchestrator_system import OrchestratorSystem
 from src.utils.exceptions import  AgentError, EvaluationError
 from src.utils.logger import logger
@@ -9,7 +10,18 @@ from datetime import datetime
 from logging import Logger
 from src.helpers.agent_helper import init
 
-def _system(log: Logger, orchestrator: OrchestratorSystem) -> None:
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Insurance Claim Assistant")
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="reuse cached evaluation responses (default: EVAL_CACHE_ENABLED); "
+             "use --no-cache after editing agents",
+    )
+    return parser.parse_args()
+
+def _system(log: Logger, orchestrator: OrchestratorSystem, use_cache: Optional[bool] = None) -> None:
     print("==============================================")
     print(" Insurance Claim Assistant")
     while True:
@@ -37,7 +49,7 @@ def _system(log: Logger, orchestrator: OrchestratorSystem) -> None:
         elif query.lower() in {"eval", "evaluation", "e"}:
             #evaluation mode
             print("enter evaluation mode")
-            _evaluation_mode(orchestrator, log)
+            _evaluation_mode(orchestrator, log, use_cache)
             continue
         else:
             #query mode
@@ -58,7 +70,7 @@ def _query_mode(orchestrator: OrchestratorSystem, query: str, log: Logger) -> No
     except Exception as e:
         log.error(f"Unexpected error while handling query: {e}", exc_info=True)
         print(f"Unexpected error while handling query: {e}")
-def _evaluation_mode(orchestrator: OrchestratorSystem, log: Logger) -> None:
+def _evaluation_mode(orchestrator: OrchestratorSystem, log: Logger, use_cache: Optional[bool] = None) -> None:
     """Run evaluation test suite and generate report."""
     print("\n" + "=" * 60)
     print("EVALUATION MODE")
@@ -83,9 +95,17 @@ def _evaluation_mode(orchestrator: OrchestratorSystem, log: Logger) -> None:
             print(f"Unexpected error initializing orchestrator: {e}")
             return
         
+        evaluation_dir = config.RESULTS_DIR / "evaluation"
+        evaluation_dir.mkdir(parents=True, exist_ok=True)
+        run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
         # Create test suite
         try:
-            test_suite = EvalSuite(orchestrator=orchestrator)
+            test_suite = EvalSuite(
+                orchestrator=orchestrator,
+                use_cache=use_cache,
+                results_path=evaluation_dir / f"evaluation_results_{run_timestamp}.jsonl",
+            )
             test_suite.load_test_cases(test_cases)
             log.info("Test suite initialized")
         except EvaluationError as e:
@@ -114,10 +134,7 @@ def _evaluation_mode(orchestrator: OrchestratorSystem, log: Logger) -> None:
         
         # Generate report
         try:
-            evaluation_dir = config.RESULTS_DIR / "evaluation"
-            evaluation_dir.mkdir(parents=True, exist_ok=True)
-            
-            report_filename = evaluation_dir / f"evaluation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            report_filename = evaluation_dir / f"evaluation_report_{run_timestamp}.json"
             
             report = test_suite.generate_report(
                 output_file=report_filename,
@@ -145,11 +162,13 @@ def _evaluation_mode(orchestrator: OrchestratorSystem, log: Logger) -> None:
         print(f"Unexpected error in evaluation mode: {e}")
 
 def main() -> NoReturn:
+    args = _parse_args()
+
     #initialize
     log, orchestrator = init()
 
     # Simple CLI loop
-    _system(log, orchestrator)
+    _system(log, orchestrator, args.cache)
 
 
 if __name__ == "__main__":
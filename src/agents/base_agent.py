@@ -21,7 +21,9 @@ from src.config.constants import AgentType
 from src.config.settings import config
 from src.utils.logger import logger
 from src.utils.exceptions import AgentError
+from src.utils.http_client import get_http_client
 from langchain_openai import ChatOpenAI
+import httpx
 from langchain_core.messages import (
     SystemMessage,
     HumanMessage,
@@ -57,7 +59,7 @@ class BaseAgent(AgentInterface, ABC):
 
     Responsibilities:
     - Store the AgentType
-    - Initialize an LLM client (required)
+    - Initialize an LLM client (required), on the shared HTTP connection pool
     - Provide a private helper for sending prompts to the LLM
 
     Concrete agents focus on:
@@ -72,6 +74,7 @@ class BaseAgent(AgentInterface, ABC):
         model: Optional[str] = None,
         api_key: Optional[str] = None,
         tools: Optional[List[callable]] = None,
+        http_client: Optional[httpx.Client] = None,
     ) -> None:
         self._agent_type = agent_type
         self.logger = logger
@@ -85,6 +88,7 @@ class BaseAgent(AgentInterface, ABC):
             self._llm = ChatOpenAI(
                 model=model_name,
                 api_key=key,
+                http_client=http_client or get_http_client(),
             )
             if self._tools:
                 self._llm = self._llm.bind_tools(self._tools)
@@ -11,10 +11,14 @@ This component wires the agent architecture together:
    - Sends the query to the RouterAgent for routing (summary vs needle)
    - Forwards the query to the chosen specialist agent
    - Returns the specialist agent's answer together with routing metadata.
+3. Exposes handle_query_verbose() returning the answer plus the handling
+   agent type and retrieval details from the same single pass.
 """
 
 from __future__ import annotations
 
+from typing import Any, Dict
+
 from src.agents.router_agent import RouterAgent
 from src.agents.summarization_agent import SummarizationExpertAgent
 from src.agents.needle_in_haystack_agent import NeedleInHaystackAgent
@@ -35,6 +39,14 @@ class OrchestratorSystem:
         self.summarization_agent = SummarizationExpertAgent()
         self.needle_agent = NeedleInHaystackAgent()
 
+        # Bind the per-query entry points once instead of resolving the
+        # attribute chains on every call.
+        self._route = self.router_agent.handle_query
+        self._specialists = {
+            AgentType.NEEDLE_IN_HAYSTACK: self.needle_agent.handle_query,
+            AgentType.SUMMARIZATION_EXPERT: self.summarization_agent.handle_query,
+        }
+
         self.logger.info("OrchestratorSystem initialized with Router, Summary, and Needle agents.")
 
     def handle_query(self, query: str) -> str:
@@ -45,13 +57,25 @@ class OrchestratorSystem:
         Returns:
             The answer string from the specialist agent.
         """
+        return self.handle_query_verbose(query)["answer"]
+
+    def handle_query_verbose(self, query: str) -> Dict[str, Any]:
+        """
+        Execute the routing + answering chain once and keep the details.
+
+        Returns:
+            Dict with keys:
+            - answer: answer string from the specialist agent
+            - agent_type: AgentType value of the agent that handled the query
+            - retrieval: the agent's retrieval info ({"result_count", "results"})
+        """
         if not isinstance(query, str) or not query.strip():
             raise ValueError("Query must be a non-empty string")
 
         self.logger.info("[OrchestratorSystem] Received query for processing.")
 
         # Step 1: Get routing decision from RouterAgent
-        routing_response = self.router_agent.handle_query(query)
+        routing_response = self._route(query)
         routing_decision = routing_response.get("routing_decision", {})
         primary_agent_value = routing_decision.get(
             "primary_agent_type",
@@ -68,19 +92,20 @@ class OrchestratorSystem:
             primary_agent_type = AgentType.SUMMARIZATION_EXPERT
 
         # Step 2: Forward query to the selected specialist agent
-        if primary_agent_type == AgentType.NEEDLE_IN_HAYSTACK:
-            agent = self.needle_agent
-        else:
-            agent = self.summarization_agent
-
-        agent_response = agent.handle_query(query)
+        handle_specialist = self._specialists.get(
+            primary_agent_type,
+            self._specialists[AgentType.SUMMARIZATION_EXPERT],
+        )
+        agent_response = handle_specialist(query)
 
-        # Step 3: Extract and return the answer string
+        # Step 3: Extract the answer string and retrieval details
         answer = agent_response.get("answer", "")
         
         self.logger.info(
             f"[OrchestratorSystem] Query handled by agent_type={primary_agent_type.value}"
         )
-        return answer
-
-
+        return {
+            "answer": answer,
+            "agent_type": primary_agent_type.value,
+            "retrieval": agent_response.get("retrieval", {}),
+        }
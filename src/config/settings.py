@@ -57,8 +57,11 @@ class Config:
         self.INDICES_DIR = self.DATA_DIR / "indices"
         self.HIERARCHICAL_INDEX_DIR = self.INDICES_DIR / "hierarchical_index"
         self.SUMMARY_INDEX_DIR = self.INDICES_DIR / "summary_index"
+        # SHA-256 of the source PDF the indices were built from
+        self.SOURCE_FINGERPRINT_FILE = self.INDICES_DIR / "source.sha256"
         self.RESULTS_DIR = project_root / "results"
         self.LOGS_DIR = self.RESULTS_DIR / "logs"
+        self.CACHE_DIR = self.DATA_DIR / "cache"
         
         # Ensure directories exist
         self._ensure_directories()
@@ -75,14 +78,61 @@ class Config:
         # ====================================================================
         # EMBEDDING & LLM SETTINGS
         # ====================================================================
-        self.EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+        # Embedding backend: "openai" (API) or "huggingface" (local model, no API
+        # round-trip). Changing backend or model requires rebuilding the indices.
+        self.EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "openai").lower()
+        self.EMBEDDING_MODEL = os.getenv(
+            "EMBEDDING_MODEL",
+            "BAAI/bge-small-en-v1.5" if self.EMBEDDING_BACKEND == "huggingface" else "text-embedding-3-small",
+        )
         self.LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4o-mini")
         self.JUDGE_LLM_MODEL = os.getenv("JUDGE_LLM_MODEL", "gpt-4o")  # For evaluation
+        # Size of the shared keep-alive connection pool used by all OpenAI clients
+        self.HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+        # Concurrent LLM summarization calls while building the summary index
+        self.LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+        # Context window of LLM_MODEL, in tokens (bounds summary reduce inputs)
+        self.LLM_CONTEXT_TOKENS = int(os.getenv("LLM_CONTEXT_TOKENS", "128000"))
+        # Target length of the document-level summary; chunk and section summary
+        # word limits are derived from it
+        self.SUMMARY_TARGET_WORDS = int(os.getenv("SUMMARY_TARGET_WORDS", "400"))
+        # Chunks shorter than this (in characters) are not sent to the LLM for summarization
+        self.MIN_SUMMARIZE_CHARS = int(os.getenv("MIN_SUMMARIZE_CHARS", "100"))
         
         # ====================================================================
         # INDEXING SETTINGS
         # ====================================================================
         self.TOP_K_RESULTS = int(os.getenv("TOP_K_RESULTS", "5"))  # Number of results to retrieve
+        # Query embeddings kept in the in-process LRU cache shared by the retrievers
+        self.QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024"))
+        # Max texts embedded per request (and stored per collection.add) when building indices
+        self.EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "1024"))
+        # Max total tokens per embedding request (the API caps a request at 300k)
+        self.EMBED_BATCH_MAX_TOKENS = int(os.getenv("EMBED_BATCH_MAX_TOKENS", "250000"))
+        # Embedding requests kept in flight concurrently while building indices
+        self.EMBED_MAX_IN_FLIGHT = int(os.getenv("EMBED_MAX_IN_FLIGHT", "5"))
+        # Max records per ChromaDB collection.add() call (Chroma recommends 50-250)
+        self.CHROMA_ADD_BATCH_SIZE = int(os.getenv("CHROMA_ADD_BATCH_SIZE", "200"))
+        # Put the ChromaDB SQLite file in WAL mode (faster bulk inserts; adds -wal and
+        # -shm files next to chroma.sqlite3)
+        self.CHROMA_SQLITE_WAL = os.getenv("CHROMA_SQLITE_WAL", "true").lower() == "true"
+        # Trade all SQLite durability for insert speed during index builds (off by
+        # default; only effective on ChromaDB's Python SQLite backend)
+        self.BULK_INDEXING = os.getenv("BULK_INDEXING", "false").lower() == "true"
+        
+        # ====================================================================
+        # EVALUATION SETTINGS
+        # ====================================================================
+        # Max test cases evaluated concurrently (bounded to avoid provider 429s)
+        self.EVAL_CONCURRENCY = int(os.getenv("EVAL_CONCURRENCY", "4"))
+        # Reuse cached answers for unchanged queries, source PDF and settings (opt-in: agent
+        # prompt or code changes are not detected; main.py --cache/--no-cache overrides)
+        self.EVAL_CACHE_ENABLED = os.getenv("EVAL_CACHE_ENABLED", "false").lower() == "true"
+        # Reuse judge verdicts for identical (whitespace-normalized) judge prompts, in memory and
+        # across runs under CACHE_DIR/judge (set to "false" to disable)
+        self.JUDGE_CACHE_ENABLED = os.getenv("JUDGE_CACHE_ENABLED", "true").lower() == "true"
+        # Max characters of each retrieved chunk included in judge prompts
+        self.JUDGE_MAX_CONTEXT_CHARS = int(os.getenv("JUDGE_MAX_CONTEXT_CHARS", "500"))
         
         # ====================================================================
         # LOGGING SETTINGS
@@ -110,6 +160,7 @@ class Config:
             self.SUMMARY_INDEX_DIR,
             self.RESULTS_DIR,
             self.LOGS_DIR,
+            self.CACHE_DIR,
         ]
         
         for directory in directories:
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvalCase:
     """
     Represents a single test case for evaluation.
@@ -20,6 +20,8 @@ class EvalCase:
         ground_truth: Additional ground truth information (e.g., metadata, timestamps, etc.)
         category: Optional category label (e.g., "needle", "summarization", "timeline")
         description: Optional description of what this test case validates
+        expected_score: Expected score for the case
+        smoke: Whether the case belongs to the quick smoke subset (pytest -m smoke)
     """
     query: str
     expected_answer: str
@@ -28,6 +30,7 @@ class EvalCase:
     category: Optional[str] = None
     description: Optional[str] = None
     expected_score: Optional[int] = 1
+    smoke: bool = False
     
     def __post_init__(self):
         """Validate test case data."""
@@ -4,18 +4,72 @@ EvalSuite implementation for running and evaluating test cases.
 
 from __future__ import annotations
 
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage
 
 from src.agents.orchestrator_system import OrchestratorSystem
 from src.config.constants import EvaluationMetric
+from src.config.settings import config
 from src.evaluation.judge_evaluator import JudgeEvaluator
 from src.evaluation.eval_case import EvalCase
+from src.evaluation.response_cache import ResponseCache
+from src.indexing.index_manager import IndexManager
 from src.utils.exceptions import EvaluationError
 from src.utils.logger import logger
 
+try:
+    import orjson
+except ImportError:  # optional speedup; reports fall back to the stdlib json module
+    orjson = None
+
+
+def _json_line(obj: Dict[str, Any]) -> str:
+    """Serialize a result entry as one JSON line (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8") + "\n"
+    return json.dumps(obj, ensure_ascii=False) + "\n"
+
+
+def _coerce_text(value: Any) -> str:
+    """Return an agent answer as text, unwrapping LangChain messages."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, BaseMessage):
+        value = value.content
+    return str(value) if value else ""
+
+
+@lru_cache(maxsize=256)
+def _answer_pattern(expected_answer: str) -> Optional[re.Pattern]:
+    """Compiled whole-word pattern for a normalized expected answer (None if empty), memoized."""
+    expected = " ".join(expected_answer.lower().split())
+    if not expected:
+        return None
+    return re.compile(rf"(?<!\w){re.escape(expected)}(?!\w)")
+
 
-@dataclass
+def _contains_answer(answer: str, expected_answer: str) -> bool:
+    """
+    Check whether the expected answer appears verbatim in the answer.
+    
+    Case and whitespace are ignored, and the match must not be part of a
+    longer word or number (so "£650" does not match "£6500"). Each expected
+    answer's pattern is compiled once and reused across runs and test cases.
+    """
+    pattern = _answer_pattern(expected_answer)
+    return pattern is not None and pattern.search(" ".join(answer.lower().split())) is not None
+
+
+@dataclass(slots=True, frozen=True)
 class EvalResult:
     """
     Result object containing evaluation results for a single test case.
@@ -44,16 +98,20 @@ class EvalResult:
 
 class EvalSuite:
     """
-    Test suite for evaluating individual test cases.
+    Test suite for evaluating test cases.
     
-    Evaluates a single test case at a time, running queries through the system,
-    evaluating responses, and returning evaluation results.
+    Evaluates individual test cases by running queries through the system,
+    evaluating responses, and returning evaluation results. Loaded test cases
+    can also be run as a batch with run_all().
     """
     
     def __init__(
         self,
         orchestrator: Optional[OrchestratorSystem] = None,
         evaluator: Optional[JudgeEvaluator] = None,
+        use_cache: Optional[bool] = None,
+        results_path: Optional[Path] = None,
+        lexical_match: bool = False,
     ) -> None:
         """
         Initialize the test suite.
@@ -61,10 +119,236 @@ class EvalSuite:
         Args:
             orchestrator: OrchestratorSystem instance (created if not provided)
             evaluator: JudgeEvaluator instance (created if not provided)
+            use_cache: Reuse cached orchestrator responses for unchanged queries,
+                source document and settings (defaults to EVAL_CACHE_ENABLED
+                from config)
+            results_path: Optional JSONL file that run_all() streams each
+                result to as it completes (read back by generate_report())
+            lexical_match: Also score correctness 1.0 without the judge when the
+                expected answer appears verbatim in the answer; meant for
+                exact-value (needle) cases, not paraphrased summaries
         """
         self.logger = logger
         self.orchestrator = orchestrator or OrchestratorSystem()
         self.evaluator = evaluator or JudgeEvaluator()
+        # Bound once; called per test case from the worker threads
+        self._handle_query_verbose = self.orchestrator.handle_query_verbose
+        if use_cache is None:
+            use_cache = config.EVAL_CACHE_ENABLED
+        self._response_cache: Optional[ResponseCache] = None
+        if use_cache:
+            source_fingerprint = IndexManager().load_source_fingerprint()
+            if source_fingerprint is None:
+                self.logger.warning(
+                    "Response cache disabled: no source fingerprint recorded for the indices"
+                )
+            else:
+                self._response_cache = ResponseCache(source_fingerprint)
+        self.results_path = Path(results_path) if results_path else None
+        self.lexical_match = lexical_match
+        self.test_cases: List[EvalCase] = []
+        self.results: List[EvalResult] = []
+        # Summary of the current results; reset whenever results change
+        self._summary_cache: Optional[Dict[str, Any]] = None
+    
+    def load_test_cases(self, test_cases: List[EvalCase]) -> None:
+        """
+        Load test cases to be run by run_all().
+        
+        Args:
+            test_cases: List of EvalCase objects
+        """
+        if not test_cases:
+            raise EvaluationError("No test cases provided")
+        self.test_cases = list(test_cases)
+        self.results = []
+        self._summary_cache = None
+        self.logger.info(f"Loaded {len(self.test_cases)} test cases")
+    
+    def run_all(
+        self,
+        get_retrieval_context: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[EvalResult]:
+        """
+        Evaluate all loaded test cases concurrently.
+        
+        Each case is dominated by blocking LLM/HTTP calls, so cases are run on a
+        bounded thread pool. Results keep the order of the loaded test cases;
+        cases that fail are logged and left out. If results_path is set, each
+        result is also appended to it as a JSON line as soon as it completes.
+        
+        Args:
+            get_retrieval_context: If True, get full agent response with retrieval context
+            max_workers: Max concurrent test cases (defaults to config.EVAL_CONCURRENCY)
+            
+        Returns:
+            List of EvalResult objects for the cases that were evaluated
+        """
+        if not self.test_cases:
+            raise EvaluationError("No test cases loaded. Call load_test_cases() first.")
+        
+        workers = max(1, max_workers or config.EVAL_CONCURRENCY)
+        ordered: List[Optional[EvalResult]] = [None] * len(self.test_cases)
+        
+        if self.results_path:
+            self.results_path.parent.mkdir(parents=True, exist_ok=True)
+            results_file = open(self.results_path, "w", encoding="utf-8")
+        else:
+            results_file = nullcontext()
+        
+        # Futures are drained on this thread, so the file needs no locking
+        with results_file, ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.evaluate, test_case, get_retrieval_context): i
+                for i, test_case in enumerate(self.test_cases)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    ordered[i] = future.result()
+                except Exception as e:
+                    self.logger.error("Test case %d/%d failed: %s", i + 1, len(self.test_cases), e)
+                    continue
+                if self.results_path:
+                    results_file.write(_json_line(self._result_to_dict(ordered[i])))
+                    results_file.flush()
+        
+        self.results = [result for result in ordered if result is not None]
+        self._summary_cache = None
+        self.logger.info("Evaluated %d/%d test cases", len(self.results), len(self.test_cases))
+        return self.results
+    
+    def generate_report(
+        self,
+        output_file: Optional[Path] = None,
+        include_details: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Generate an evaluation report for the last run_all() results.
+        
+        The summary is computed once per run (see _summary()). With
+        results_path set, include_details references the JSONL file instead
+        of embedding every result in the report.
+        
+        Args:
+            output_file: Optional path to save the report as JSON
+            include_details: Whether to include per-case results in the report
+            
+        Returns:
+            Report dictionary with a summary (average scores, category
+            distribution) and optionally the detailed results
+        """
+        report: Dict[str, Any] = {
+            "timestamp": datetime.now().isoformat(),
+            "summary": self._summary(),
+        }
+        if include_details:
+            if self.results_path:
+                report["detailed_results"] = str(self.results_path)
+            else:
+                report["detailed_results"] = [self._result_to_dict(r) for r in self.results]
+        
+        if output_file:
+            output_path = Path(output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                output_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    json.dump(report, f, indent=2, ensure_ascii=False)
+            self.logger.info(f"Evaluation report saved to: {output_path}")
+        
+        return report
+    
+    def print_summary(self) -> None:
+        """Print the summary of the last run_all() results to the console."""
+        summary = self._summary()
+        
+        print("\n" + "=" * 60)
+        print("EVALUATION SUMMARY")
+        print("=" * 60)
+        print(f"Total Test Cases: {summary['total_test_cases']}")
+        print()
+        print("Average Scores:")
+        for name, score in summary["average_scores"].items():
+            print(f"  {name}: {'N/A' if score is None else f'{score:.3f}'}")
+        print()
+        print("Category Distribution:")
+        for category, count in summary["category_distribution"].items():
+            print(f"  {category}: {count}")
+        print("=" * 60)
+    
+    def _summary(self) -> Dict[str, Any]:
+        """
+        Summarize the current results, computing it at most once per run.
+        
+        Results are read back one at a time (from results_path when set) and
+        folded into per-metric sums and counts, so no per-metric score lists
+        are built.
+        
+        Returns:
+            Dict with total_test_cases, average_scores and category_distribution
+        """
+        if self._summary_cache is not None:
+            return self._summary_cache
+        
+        metric_totals: Dict[str, List[float]] = {
+            metric.value: [0.0, 0] for metric in EvaluationMetric
+        }
+        category_distribution: Dict[str, int] = {}
+        total_test_cases = 0
+        
+        for result in self._iter_results():
+            total_test_cases += 1
+            for name, score in result["scores"].items():
+                if score is not None:
+                    metric_totals[name][0] += score
+                    metric_totals[name][1] += 1
+            category = result["test_case"].get("category") or "uncategorized"
+            category_distribution[category] = category_distribution.get(category, 0) + 1
+        
+        self._summary_cache = {
+            "total_test_cases": total_test_cases,
+            "average_scores": {
+                name: (total / count if count else None)
+                for name, (total, count) in metric_totals.items()
+            },
+            "category_distribution": category_distribution,
+        }
+        return self._summary_cache
+    
+    def _iter_results(self) -> Iterator[Dict[str, Any]]:
+        """Yield report entries for results, streaming from results_path when set."""
+        if self.results_path and self.results_path.exists():
+            with open(self.results_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield orjson.loads(line) if orjson is not None else json.loads(line)
+        else:
+            for result in self.results:
+                yield self._result_to_dict(result)
+    
+    @staticmethod
+    def _result_to_dict(result: EvalResult) -> Dict[str, Any]:
+        """Convert an EvalResult into a JSON-friendly report entry."""
+        return {
+            "test_case": {
+                "query": result.query,
+                "expected_answer": result.expected_answer,
+                "category": result.category,
+                "description": result.description,
+            },
+            "response": {
+                "answer": result.answer,
+                "retrieved_context_count": result.retrieved_context_count,
+            },
+            "scores": {
+                EvaluationMetric.ANSWER_CORRECTNESS.value: result.answer_correctness,
+                EvaluationMetric.CONTEXT_RELEVANCY.value: result.context_relevancy,
+                EvaluationMetric.CONTEXT_RECALL.value: result.context_recall,
+            },
+        }
     
     def evaluate(
         self,
@@ -81,83 +365,26 @@ class EvalSuite:
         Returns:
             EvalResult object containing evaluation results
         """
-        self.logger.info(f"Evaluating test case: {test_case.query[:60]}...")
+        self.logger.info("Evaluating test case: %.60s...", test_case.query)
         
         try:
-            # Get answer from orchestrator
-            answer = self.orchestrator.handle_query(test_case.query)
+            # Route and answer once; the response also carries the retrieval context
+            response = self._handle_query(test_case.query)
+            answer = response.get("answer", "")
             
             # Ensure answer is a string (handle AIMessage objects that might slip through)
-            if hasattr(answer, 'content'):
-                answer = str(answer.content) if answer.content else ""
-            else:
-                answer = str(answer) if answer else ""
+            answer = _coerce_text(answer)
             
-            # Get retrieval context if needed (for context evaluation metrics)
+            # Retrieval context comes from the same routed agent call (for context metrics)
             retrieved_context: List[Dict[str, Any]] = []
             if get_retrieval_context:
-                # Get routing decision to know which agent handled it
-                routing_response = self.orchestrator.router_agent.handle_query(test_case.query)
-                routing_decision = routing_response.get("routing_decision", {})
-                agent_type_value = routing_decision.get("primary_agent_type", "")
-                
-                # Get full agent response with retrieval info
-                if agent_type_value == "needle":
-                    agent_response = self.orchestrator.needle_agent.handle_query(test_case.query)
-                else:
-                    agent_response = self.orchestrator.summarization_agent.handle_query(test_case.query)
-                
-                # Extract retrieval context
-                retrieval_info = agent_response.get("retrieval", {})
-                retrieved_context = retrieval_info.get("results", [])
-            else:
-                # If we don't need retrieval context, create empty list
-                retrieved_context = []
-            
-            # Evaluate on all metrics
-            answer_correctness: float = 0.0
-            context_relevancy: float = 0.0
-            context_recall: Optional[float] = None
+                retrieved_context = response.get("retrieval", {}).get("results", [])
             
-            # Answer Correctness
-            try:
-                answer_correctness = self.evaluator.evaluate(
-                    metric=EvaluationMetric.ANSWER_CORRECTNESS,
-                    query=test_case.query,
-                    answer=answer,
-                    retrieved_context=retrieved_context,
-                    expected_answer=test_case.expected_answer,
-                    ground_truth=test_case.ground_truth,
-                )
-            except Exception as e:
-                self.logger.error(f"Error evaluating answer correctness: {e}")
-                answer_correctness = 0.0
-            
-            # Context Relevancy
-            try:
-                context_relevancy = self.evaluator.evaluate(
-                    metric=EvaluationMetric.CONTEXT_RELEVANCY,
-                    query=test_case.query,
-                    answer=answer,
-                    retrieved_context=retrieved_context,
-                )
-            except Exception as e:
-                self.logger.error(f"Error evaluating context relevancy: {e}")
-                context_relevancy = 0.0
-            
-            # Context Recall (only if expected_context is provided)
-            if test_case.expected_context:
-                try:
-                    context_recall = self.evaluator.evaluate(
-                        metric=EvaluationMetric.CONTEXT_RECALL,
-                        query=test_case.query,
-                        answer=answer,
-                        retrieved_context=retrieved_context,
-                        expected_context=test_case.expected_context,
-                    )
-                except Exception as e:
-                    self.logger.error(f"Error evaluating context recall: {e}")
-                    context_recall = 0.0
+            # Evaluate on all metrics with a single judge call
+            answer_correctness, context_relevancy, context_recall = self._score(
+                test_case, answer, retrieved_context,
+                context_str=self.evaluator.format_context(retrieved_context),
+            )
             
             # Create and return result object
             result = EvalResult(
@@ -173,8 +400,10 @@ class EvalSuite:
             )
             
             self.logger.info(
-                f"Evaluation completed. Scores: correctness={answer_correctness:.3f}, "
-                f"relevancy={context_relevancy:.3f}, recall={context_recall if context_recall is not None else 'N/A'}"
+                "Evaluation completed. Scores: correctness=%.3f, relevancy=%.3f, recall=%s",
+                answer_correctness,
+                context_relevancy,
+                "N/A" if context_recall is None else context_recall,
             )
             return result
             
@@ -187,6 +416,7 @@ class EvalSuite:
         test_case: EvalCase,
         num_runs: int = 10,
         get_retrieval_context: bool = True,
+        response: Optional[Dict[str, Any]] = None,
     ) -> EvalResult:
         """
         Evaluate a test case multiple times and return the average of all scores.
@@ -199,6 +429,9 @@ class EvalSuite:
             test_case: EvalCase to evaluate
             num_runs: Number of times to run the evaluation (default: 5)
             get_retrieval_context: If True, get full agent response with retrieval context
+            response: Verbose orchestrator response for the query, if already
+                computed (see run_queries in src.helpers.agent_helper); the
+                query is run here otherwise
             
         Returns:
             EvalResult object containing averaged evaluation results
@@ -210,105 +443,48 @@ class EvalSuite:
             raise ValueError("num_runs must be at least 1")
         
         self.logger.info(
-            f"Evaluating test case {num_runs} times for averaging: {test_case.query[:60]}..."
+            "Evaluating test case %d times for averaging: %.60s...", num_runs, test_case.query
         )
         
         try:
             # Get answer and retrieval context once (these don't change between runs)
-            answer = self.orchestrator.handle_query(test_case.query)
+            if response is None:
+                response = self._handle_query(test_case.query)
+            answer = response.get("answer", "")
             
             # Ensure answer is a string (handle AIMessage objects that might slip through)
-            if hasattr(answer, 'content'):
-                answer = str(answer.content) if answer.content else ""
-            else:
-                answer = str(answer) if answer else ""
+            answer = _coerce_text(answer)
             
-            # Get retrieval context if needed (for context evaluation metrics)
+            # Retrieval context comes from the same routed agent call (for context metrics)
             retrieved_context: List[Dict[str, Any]] = []
             if get_retrieval_context:
-                # Get routing decision to know which agent handled it
-                routing_response = self.orchestrator.router_agent.handle_query(test_case.query)
-                routing_decision = routing_response.get("routing_decision", {})
-                agent_type_value = routing_decision.get("primary_agent_type", "")
-                
-                # Get full agent response with retrieval info
-                if agent_type_value == "needle":
-                    agent_response = self.orchestrator.needle_agent.handle_query(test_case.query)
-                else:
-                    agent_response = self.orchestrator.summarization_agent.handle_query(test_case.query)
-                
-                # Extract retrieval context
-                retrieval_info = agent_response.get("retrieval", {})
-                retrieved_context = retrieval_info.get("results", [])
-            else:
-                # If we don't need retrieval context, create empty list
-                retrieved_context = []
+                retrieved_context = response.get("retrieval", {}).get("results", [])
             
-            # Collect scores from all runs
-            answer_correctness_scores: List[float] = []
-            context_relevancy_scores: List[float] = []
-            context_recall_scores: List[float] = []
+            # Render the judge's context block once for all runs
+            context_str = self.evaluator.format_context(retrieved_context)
+            
+            # Accumulate running (sum, count) per metric instead of score lists
+            correctness_total = relevancy_total = recall_total = 0.0
+            recall_count = 0
             
             # Run evaluation multiple times
             for run_num in range(1, num_runs + 1):
-                self.logger.info(f"Evaluation run {run_num}/{num_runs}")
-                
-                # Answer Correctness
-                try:
-                    answer_correctness = self.evaluator.evaluate(
-                        metric=EvaluationMetric.ANSWER_CORRECTNESS,
-                        query=test_case.query,
-                        answer=answer,
-                        retrieved_context=retrieved_context,
-                        expected_answer=test_case.expected_answer,
-                        ground_truth=test_case.ground_truth,
-                    )
-                    answer_correctness_scores.append(answer_correctness)
-                except Exception as e:
-                    self.logger.error(f"Error evaluating answer correctness in run {run_num}: {e}")
-                    answer_correctness_scores.append(0.0)
+                self.logger.info("Evaluation run %d/%d", run_num, num_runs)
                 
-                # Context Relevancy
-                try:
-                    context_relevancy = self.evaluator.evaluate(
-                        metric=EvaluationMetric.CONTEXT_RELEVANCY,
-                        query=test_case.query,
-                        answer=answer,
-                        retrieved_context=retrieved_context,
-                    )
-                    context_relevancy_scores.append(context_relevancy)
-                except Exception as e:
-                    self.logger.error(f"Error evaluating context relevancy in run {run_num}: {e}")
-                    context_relevancy_scores.append(0.0)
-                
-                # Context Recall (only if expected_context is provided)
-                if test_case.expected_context:
-                    try:
-                        context_recall = self.evaluator.evaluate(
-                            metric=EvaluationMetric.CONTEXT_RECALL,
-                            query=test_case.query,
-                            answer=answer,
-                            retrieved_context=retrieved_context,
-                            expected_context=test_case.expected_context,
-                        )
-                        context_recall_scores.append(context_recall)
-                    except Exception as e:
-                        self.logger.error(f"Error evaluating context recall in run {run_num}: {e}")
-                        context_recall_scores.append(0.0)
+                answer_correctness, context_relevancy, context_recall = self._score(
+                    test_case, answer, retrieved_context,
+                    context_str=context_str, run_num=run_num,
+                )
+                correctness_total += answer_correctness
+                relevancy_total += context_relevancy
+                if context_recall is not None:
+                    recall_total += context_recall
+                    recall_count += 1
             
             # Calculate averages
-            avg_answer_correctness = (
-                sum(answer_correctness_scores) / len(answer_correctness_scores)
-                if answer_correctness_scores else 0.0
-            )
-            avg_context_relevancy = (
-                sum(context_relevancy_scores) / len(context_relevancy_scores)
-                if context_relevancy_scores else 0.0
-            )
-            avg_context_recall = (
-                sum(context_recall_scores) / len(context_recall_scores)
-                if context_recall_scores else None
-            )
+            avg_answer_correctness = correctness_total / num_runs
+            avg_context_relevancy = relevancy_total / num_runs
+            avg_context_recall = recall_total / recall_count if recall_count else None
             
             # Create and return result object with averaged scores
             result = EvalResult(
@@ -324,10 +500,12 @@ class EvalSuite:
             )
             
             self.logger.info(
-                f"Average evaluation completed ({num_runs} runs). "
-                f"Average scores: correctness={avg_answer_correctness:.3f}, "
-                f"relevancy={avg_context_relevancy:.3f}, "
-                f"recall={avg_context_recall if avg_context_recall is not None else 'N/A'}"
+                "Average evaluation completed (%d runs). "
+                "Average scores: correctness=%.3f, relevancy=%.3f, recall=%s",
+                num_runs,
+                avg_answer_correctness,
+                avg_context_relevancy,
+                "N/A" if avg_context_recall is None else avg_context_recall,
             )
             return result
             
@@ -336,4 +514,85 @@ class EvalSuite:
             raise EvaluationError(
                 f"Failed to evaluate test case '{test_case.query[:50]}...' with averaging: {e}"
             ) from e
-
+    
+    def _handle_query(self, query: str) -> Dict[str, Any]:
+        """
+        Run a query through the orchestrator, using the response cache if enabled.
+        
+        Args:
+            query: The query string
+            
+        Returns:
+            Verbose orchestrator response (answer, agent_type, retrieval)
+        """
+        if self._response_cache is None:
+            return self._handle_query_verbose(query)
+        
+        response = self._response_cache.get(query)
+        if response is not None:
+            self.logger.info("Using cached response for query: %.60s...", query)
+            return response
+        
+        response = self._handle_query_verbose(query)
+        self._response_cache.put(query, response)
+        return response
+    
+    def _score(
+        self,
+        test_case: EvalCase,
+        answer: str,
+        retrieved_context: List[Dict[str, Any]],
+        context_str: Optional[str] = None,
+        run_num: Optional[int] = None,
+    ) -> Tuple[float, float, Optional[float]]:
+        """
+        Score an answer on all metrics with one combined judge call.
+        
+        Args:
+            test_case: EvalCase being evaluated
+            answer: The system's answer
+            retrieved_context: Retrieved chunks for the query
+            context_str: Pre-rendered judge context (see JudgeEvaluator.format_context)
+            run_num: Evaluation run number (for logging when averaging)
+            
+        Returns:
+            Tuple of (answer_correctness, context_relevancy, context_recall).
+            context_recall is None when the test case has no expected_context.
+            Scores default to 0.0 if the judge call fails.
+            An answer matching expected_answer exactly (ignoring case and
+            surrounding whitespace), or containing it verbatim when
+            lexical_match is set, scores 1.0 correctness without the judge.
+        """
+        expected_answer = test_case.expected_answer
+        exact_match = bool(expected_answer) and (
+            answer.strip().lower() == expected_answer.strip().lower()
+            or (self.lexical_match and _contains_answer(answer, expected_answer))
+        )
+        if exact_match and not retrieved_context:
+            # Without retrieved context the judge would score relevancy and
+            # recall 0.0 anyway, so skip the LLM call entirely
+            return 1.0, 0.0, 0.0 if test_case.expected_context else None
+        
+        try:
+            scores = self.evaluator.evaluate_all(
+                query=test_case.query,
+                answer=answer,
+                retrieved_context=retrieved_context,
+                expected_answer=test_case.expected_answer,
+                expected_context=test_case.expected_context,
+                context_str=context_str,
+                sample=run_num or 1,
+            )
+            return (
+                1.0 if exact_match else (scores.get(EvaluationMetric.ANSWER_CORRECTNESS) or 0.0),
+                scores.get(EvaluationMetric.CONTEXT_RELEVANCY) or 0.0,
+                scores.get(EvaluationMetric.CONTEXT_RECALL) if test_case.expected_context else None,
+            )
+        except Exception as e:
+            run_info = f" in run {run_num}" if run_num is not None else ""
+            self.logger.error(f"Error evaluating test case metrics{run_info}: {e}")
+            return (
+                1.0 if exact_match else 0.0,
+                0.0,
+                0.0 if test_case.expected_context else None,
+            )
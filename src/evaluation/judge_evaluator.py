@@ -9,17 +9,184 @@ Evaluates system responses on multiple metrics:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import hashlib
+import re
+import threading
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
+from pydantic import BaseModel, Field
 
 from src.config.constants import EvaluationMetric
 from src.config.settings import config
+from src.evaluation.verdict_cache import VerdictCache
 from src.utils.exceptions import EvaluationError
+from src.utils.http_client import get_http_client
 from src.utils.logger import logger
 
 
+# Output token budgets for judge calls. Judges are asked for a bare score,
+# a YES/NO or a small JSON verdict, so anything longer is wasted decode time.
+_SCORE_MAX_TOKENS = 8
+_YES_NO_MAX_TOKENS = 4
+_VERDICT_MAX_TOKENS = 256
+
+
+# Judge system prompts. These must stay byte-identical across calls: all
+# per-case values (query, answers, chunks) go in the user message after them,
+# so the provider's prompt-prefix cache can reuse the prefill between cases.
+_ALL_METRICS_SYSTEM_PROMPT = (
+    "You are an evaluator for an insurance claim document Q&A and retrieval system.\n\n"
+    "Score the system's response on the following metrics, each between 0.0 and 1.0:\n\n"
+    "1. correctness: Does the system answer correctly answer the query compared to the expected answer?\n"
+    "   - 1.0 if factually correct and complete, 0.0 if incorrect, in between for partial correctness\n"
+    "   - Consider semantic equivalence; exact values (amounts, IDs, dates) must match exactly\n"
+    "2. relevancy: For EACH retrieved chunk, in order, how relevant is it to the query?\n"
+    "   - 1.0 highly relevant, 0.5 somewhat relevant, 0.0 irrelevant\n"
+    "3. recall: What fraction of the expected context chunks were found in the retrieved chunks?\n"
+    "   - Consider semantic similarity and partial matches\n"
+    "   - Use null if no expected context chunks are given\n"
+)
+
+_ANSWER_CORRECTNESS_SYSTEM_PROMPT = (
+    "You are an evaluator for an insurance claim document Q&A system.\n\n"
+    "Your task is to determine if a system's answer correctly answers the user's query "
+    "compared to the expected answer.\n\n"
+    "EVALUATION CRITERIA:\n"
+    "- Score 1.0 if the answer is factually correct and fully addresses the query\n"
+    "- Score 0.0 if the answer is factually incorrect or does not address the query\n"
+    "- Score between 0.0-1.0 for partial correctness (e.g., correct but incomplete)\n\n"
+    "IMPORTANT:\n"
+    "- Consider semantic equivalence (same meaning, different wording is OK)\n"
+    "- For exact values (amounts, IDs, dates), they must match exactly\n"
+    "- For descriptive answers, focus on factual correctness, not wording\n"
+    "- Respond with ONLY a number between 0.0 and 1.0 (e.g., '0.8' or '1.0')\n"
+)
+
+_CONTEXT_RELEVANCY_SYSTEM_PROMPT = (
+    "You are an evaluator for an insurance claim document retrieval system.\n\n"
+    "Your task is to determine if retrieved context chunks are relevant to the user's query.\n\n"
+    "EVALUATION CRITERIA:\n"
+    "- Score 1.0 if the chunk is highly relevant and directly addresses the query\n"
+    "- Score 0.5 if the chunk is somewhat relevant but not directly related\n"
+    "- Score 0.0 if the chunk is irrelevant to the query\n\n"
+    "Respond with ONLY a number between 0.0 and 1.0 for each chunk.\n"
+)
+
+_CONTEXT_RECALL_SYSTEM_PROMPT = (
+    "You are an evaluator for an insurance claim document retrieval system.\n\n"
+    "Your task is to determine if expected context chunks were retrieved by the system.\n\n"
+    "EVALUATION CRITERIA:\n"
+    "- For each expected chunk, check if a similar/containing chunk exists in retrieved chunks\n"
+    "- Consider semantic similarity (same meaning, different wording is OK)\n"
+    "- Consider partial matches (if retrieved chunk contains expected content)\n"
+    "- Respond with the number of expected chunks that were found (e.g., '2 out of 3' or '3/3')\n"
+)
+
+
+# Raw combined-judge verdicts keyed by _verdict_key(), shared by all evaluators
+# in the process (the tests build a fresh EvalSuite and judge per case) and
+# persisted across runs; created on first use
+_verdict_cache: Optional[VerdictCache] = None
+_verdict_cache_lock = threading.Lock()
+# Bump when the cached verdict format or its meaning changes
+_VERDICT_CACHE_VERSION = "1"
+
+
+def _match_key(text: str) -> str:
+    """Normalize text (case and whitespace) for verbatim context matching."""
+    return re.sub(r"\s+", " ", text.strip().lower())
+
+
+@lru_cache(maxsize=1024)
+def _expected_match_key(text: str) -> Tuple[str, bytes]:
+    """
+    Normalized form and digest of an expected context chunk, memoized.
+    
+    Test cases score the same expected chunks on every run, so each is
+    normalized and hashed once per process rather than once per judgement.
+    """
+    key = _match_key(text)
+    return key, hashlib.blake2b(key.encode()).digest()
+
+
+def _verdict_key(model: str, sample: int, system_prompt: str, prompt: str) -> str:
+    """
+    Cache key of a combined judge verdict.
+    
+    Covers the cache format version, judge model, sample, system prompt
+    (rubric) and the user prompt with whitespace collapsed. Case is kept,
+    since values such as registration numbers are case-sensitive.
+    """
+    key = "\0".join([
+        _VERDICT_CACHE_VERSION,
+        model,
+        str(sample),
+        system_prompt,
+        " ".join(prompt.split()),
+    ])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _get_verdict_cache() -> VerdictCache:
+    """Get the process-wide judge verdict cache, creating it on first use."""
+    global _verdict_cache
+    if _verdict_cache is None:
+        with _verdict_cache_lock:
+            if _verdict_cache is None:
+                _verdict_cache = VerdictCache()
+    return _verdict_cache
+
+
+def _split_verbatim_matches(
+    retrieved_context: List[Dict[str, Any]],
+    expected_context: List[str],
+) -> Tuple[int, List[str]]:
+    """
+    Match expected context chunks against retrieved chunks without an LLM.
+    
+    An expected chunk counts as found when it is identical (by hash) to a
+    retrieved chunk or contained verbatim in one, after normalization.
+    
+    Returns:
+        Tuple of (number of expected chunks found, expected chunks still unmatched)
+    """
+    retrieved_keys = [_match_key(chunk.get("text", "")) for chunk in retrieved_context]
+    retrieved_hashes = {hashlib.blake2b(key.encode()).digest() for key in retrieved_keys}
+    
+    found_count = 0
+    unmatched: List[str] = []
+    for expected_text in expected_context:
+        key, digest = _expected_match_key(expected_text)
+        if not key:
+            continue
+        if digest in retrieved_hashes or any(
+            key in retrieved_key for retrieved_key in retrieved_keys
+        ):
+            found_count += 1
+        else:
+            unmatched.append(expected_text)
+    return found_count, unmatched
+
+
+class _AllMetricsVerdict(BaseModel):
+    """Structured verdict returned by the combined multi-metric judge call."""
+    correctness: float = Field(
+        description="Answer correctness score between 0.0 and 1.0",
+    )
+    relevancy: List[float] = Field(
+        default_factory=list,
+        description="Relevancy score between 0.0 and 1.0 for each retrieved chunk, in order",
+    )
+    recall: Optional[float] = Field(
+        default=None,
+        description="Fraction of expected context chunks found in the retrieved chunks (0.0-1.0)",
+    )
+
+
 class JudgeEvaluator:
     """
     LLM-based evaluator using the "LLM-as-a-judge" pattern.
@@ -32,6 +199,7 @@ class JudgeEvaluator:
         self,
         model: Optional[str] = None,
         api_key: Optional[str] = None,
+        http_client: Optional[httpx.Client] = None,
     ) -> None:
         """
         Initialize the judge evaluator.
@@ -39,26 +207,60 @@ class JudgeEvaluator:
         Args:
             model: LLM model to use for judging (defaults to JUDGE_LLM_MODEL from config)
             api_key: OpenAI API key (defaults to OPENAI_API_KEY from config)
+            http_client: HTTP client to send requests through (defaults to the
+                shared connection pool)
         """
         self.logger = logger
-        model_name = model or config.JUDGE_LLM_MODEL
-        key = api_key or config.OPENAI_API_KEY
+        self._model_name = model or config.JUDGE_LLM_MODEL
+        self._api_key = api_key or config.OPENAI_API_KEY
+        self._http_client = http_client
         
-        if not key:
+        if not self._api_key:
             raise EvaluationError(
                 "OPENAI_API_KEY is required for JudgeEvaluator. "
                 "Set it in environment variables or pass it as api_key."
             )
+    
+    @cached_property
+    def _llm(self) -> ChatOpenAI:
+        """
+        Lazily create the judge LLM client on first use.
         
+        Deferring construction keeps EvalSuite setup cheap when no evaluation
+        is run, and keeps the client (and its connection pool) out of pickled
+        state so evaluators can be shipped to worker processes.
+        """
+        llm = self._create_llm()
+        self.logger.info(f"JudgeEvaluator initialized with model: {self._model_name}")
+        return llm
+    
+    @cached_property
+    def _structured_llm(self):
+        """Judge LLM bound to the multi-metric verdict schema (see evaluate_all)."""
+        return self._create_llm(max_tokens=_VERDICT_MAX_TOKENS).with_structured_output(
+            _AllMetricsVerdict
+        )
+    
+    def _create_llm(self, max_tokens: Optional[int] = None) -> ChatOpenAI:
+        """Create a ChatOpenAI client for the judge model."""
         try:
-            self._llm = ChatOpenAI(
-                model=model_name,
-                api_key=key,
+            return ChatOpenAI(
+                model=self._model_name,
+                api_key=self._api_key,
+                max_tokens=max_tokens,
+                http_client=self._http_client or get_http_client(),
             )
-            self.logger.info(f"JudgeEvaluator initialized with model: {model_name}")
         except Exception as e:
             raise EvaluationError(f"Failed to initialize LLM for JudgeEvaluator: {e}") from e
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the cached LLM and HTTP clients so they are rebuilt lazily after unpickling."""
+        state = self.__dict__.copy()
+        state.pop("_llm", None)
+        state.pop("_structured_llm", None)
+        state["_http_client"] = None
+        return state
+    
     def evaluate(
         self,
         metric: EvaluationMetric,
@@ -104,15 +306,183 @@ class JudgeEvaluator:
         else:
             raise EvaluationError(f"Unknown evaluation metric: {metric}")
     
-    def _call_llm(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Call the LLM with error handling."""
+    def evaluate_all(
+        self,
+        query: str,
+        answer: str,
+        retrieved_context: List[Dict[str, Any]],
+        expected_answer: Optional[str] = None,
+        expected_context: Optional[List[str]] = None,
+        context_str: Optional[str] = None,
+        sample: int = 1,
+    ) -> Dict[EvaluationMetric, Optional[float]]:
+        """
+        Evaluate a response on all metrics with a single judge call.
+        
+        The three metrics share the same query/answer/context, so they are scored
+        together in one prompt returning a structured verdict instead of 2 + K
+        separate calls. Falls back to per-metric evaluate() calls if the
+        combined call fails.
+        
+        When JUDGE_CACHE_ENABLED is set, the judge's raw verdicts are cached
+        by the system and user prompts (whitespace-normalized), in memory and
+        on disk (see VerdictCache), so a response judged before (by another
+        test case or an earlier run) is not sent to the judge again. Scores
+        are still derived from the verdict on every call. Fallback scores
+        are not cached.
+        
+        Args:
+            query: The original user query
+            answer: The system's answer
+            retrieved_context: List of retrieved chunks (dicts with 'text' and 'metadata')
+            expected_answer: Expected answer (for ANSWER_CORRECTNESS)
+            expected_context: Expected context chunks (for CONTEXT_RECALL)
+            context_str: Retrieved context already rendered by format_context();
+                pass it when scoring the same context repeatedly
+            sample: Index of this judgement among repeated scorings of the same
+                response; each sample is cached separately so averaged runs
+                stay independent judgements
+            
+        Returns:
+            Dict mapping each EvaluationMetric to its score (0.0-1.0).
+            CONTEXT_RECALL is None when no expected_context is provided.
+        """
+        expected_context = [t for t in (expected_context or []) if t.strip()]
+        # Expected chunks retrieved verbatim are scored here; only the rest go to the judge
+        verbatim_found, unmatched_context = _split_verbatim_matches(
+            retrieved_context, expected_context
+        )
+        
+        system_prompt = _ALL_METRICS_SYSTEM_PROMPT
+        
+        retrieved_block = context_str if context_str is not None else self.format_context(
+            retrieved_context
+        )
+        expected_block = "\n\n---\n\n".join(
+            f"Expected Chunk {i + 1}:\n{text[:300]}"
+            for i, text in enumerate(unmatched_context)
+        ) or "(none)"
+        
+        prompt = (
+            "Query: {query}\n\n"
+            "Expected Answer: {expected_answer}\n\n"
+            "System Answer: {answer}\n\n"
+            "Retrieved Context Chunks:\n{retrieved_block}\n\n"
+            "Expected Context Chunks:\n{expected_block}\n\n"
+            "Score correctness, relevancy (one score per retrieved chunk) and recall:"
+        ).format(
+            query=query,
+            expected_answer=expected_answer or "",
+            answer=answer,
+            retrieved_block=retrieved_block,
+            expected_block=expected_block,
+        )
+        
+        cache_key: Optional[str] = None
+        cached: Optional[Dict[str, Any]] = None
+        if config.JUDGE_CACHE_ENABLED:
+            cache_key = _verdict_key(self._model_name, sample, system_prompt, prompt)
+            cached = _get_verdict_cache().get(cache_key)
+        
+        try:
+            if cached is not None:
+                self.logger.debug(f"Using cached judge verdict for query: {query[:50]}...")
+                verdict = _AllMetricsVerdict(**cached)
+            else:
+                messages = [SystemMessage(content=system_prompt), HumanMessage(content=prompt)]
+                verdict = self._structured_llm.invoke(messages)
+                if cache_key is not None:
+                    _get_verdict_cache().put(cache_key, verdict.model_dump())
+        except Exception as e:
+            self.logger.warning(f"Combined judge call failed, falling back to per-metric evaluation: {e}")
+            return {
+                metric: (
+                    None
+                    if metric == EvaluationMetric.CONTEXT_RECALL and not expected_context
+                    else self.evaluate(
+                        metric=metric,
+                        query=query,
+                        answer=answer,
+                        retrieved_context=retrieved_context,
+                        expected_answer=expected_answer,
+                        expected_context=expected_context,
+                    )
+                )
+                for metric in EvaluationMetric
+            }
+        
+        # Empty chunks score 0.0; chunks the judge skipped default to neutral
+        relevancy_scores = [
+            0.0 if not chunk.get("text") else (
+                verdict.relevancy[i] if i < len(verdict.relevancy) else 0.5
+            )
+            for i, chunk in enumerate(retrieved_context)
+        ]
+        context_relevancy = (
+            sum(max(0.0, min(1.0, s)) for s in relevancy_scores) / len(relevancy_scores)
+            if relevancy_scores else 0.0
+        )
+        
+        context_recall: Optional[float] = None
+        if expected_context:
+            judged_fraction = (
+                max(0.0, min(1.0, verdict.recall or 0.0)) if unmatched_context and retrieved_context else 0.0
+            )
+            context_recall = (
+                verbatim_found + judged_fraction * len(unmatched_context)
+            ) / len(expected_context)
+        
+        scores = {
+            EvaluationMetric.ANSWER_CORRECTNESS: max(0.0, min(1.0, verdict.correctness)),
+            EvaluationMetric.CONTEXT_RELEVANCY: context_relevancy,
+            EvaluationMetric.CONTEXT_RECALL: context_recall,
+        }
+        self.logger.debug(f"Combined judge scores: {scores} for query: {query[:50]}...")
+        return scores
+    
+    @staticmethod
+    def format_context(retrieved_context: List[Dict[str, Any]]) -> str:
+        """
+        Render retrieved chunks into the compact block used in judge prompts.
+        
+        Each chunk is truncated to JUDGE_MAX_CONTEXT_CHARS. Callers scoring the
+        same context several times can render it once and pass it to
+        evaluate_all() as context_str.
+        
+        Args:
+            retrieved_context: List of retrieved chunks (dicts with 'text')
+            
+        Returns:
+            Numbered, separator-joined chunk texts, or "(none)" if empty
+        """
+        max_chars = config.JUDGE_MAX_CONTEXT_CHARS
+        return "\n\n---\n\n".join(
+            f"Chunk {i + 1}:\n{chunk.get('text', '')[:max_chars]}"
+            for i, chunk in enumerate(retrieved_context)
+        ) or "(none)"
+    
+    def _call_llm(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Call the LLM with error handling.
+        
+        When max_tokens is given, the response is capped at that many tokens and
+        stopped at the first newline, since judge answers are single-line.
+        """
         try:
             messages = []
             if system_prompt:
                 messages.append(SystemMessage(content=system_prompt))
             messages.append(HumanMessage(content=prompt))
             
-            response = self._llm.invoke(messages)
+            if max_tokens:
+                response = self._llm.invoke(messages, max_tokens=max_tokens, stop=["\n"])
+            else:
+                response = self._llm.invoke(messages)
             
             # Extract text content from AIMessage object
             if hasattr(response, 'content'):
@@ -127,8 +497,6 @@ class JudgeEvaluator:
         
         Looks for a number between 0 and 1 in the output.
         """
-        import re
-        
         # Try to find a number between 0 and 1
         patterns = [
             r"\b(0\.\d+)\b",  # 0.0 to 0.9
@@ -169,20 +537,7 @@ class JudgeEvaluator:
         
         Score: 1.0 if answer is correct, 0.0 if incorrect, 0.0-1.0 for partial matches.
         """
-        system_prompt = (
-            "You are an evaluator for an insurance claim document Q&A system.\n\n"
-            "Your task is to determine if a system's answer correctly answers the user's query "
-            "compared to the expected answer.\n\n"
-            "EVALUATION CRITERIA:\n"
-            "- Score 1.0 if the answer is factually correct and fully addresses the query\n"
-            "- Score 0.0 if the answer is factually incorrect or does not address the query\n"
-            "- Score between 0.0-1.0 for partial correctness (e.g., correct but incomplete)\n\n"
-            "IMPORTANT:\n"
-            "- Consider semantic equivalence (same meaning, different wording is OK)\n"
-            "- For exact values (amounts, IDs, dates), they must match exactly\n"
-            "- For descriptive answers, focus on factual correctness, not wording\n"
-            "- Respond with ONLY a number between 0.0 and 1.0 (e.g., '0.8' or '1.0')\n"
-        )
+        system_prompt = _ANSWER_CORRECTNESS_SYSTEM_PROMPT
         
         prompt = (
             "Query: {query}\n\n"
@@ -196,7 +551,7 @@ class JudgeEvaluator:
         )
         
         try:
-            output = self._call_llm(prompt, system_prompt=system_prompt)
+            output = self._call_llm(prompt, system_prompt=system_prompt, max_tokens=_SCORE_MAX_TOKENS)
             score = self._parse_score(output)
             self.logger.debug(f"Answer correctness score: {score} for query: {query[:50]}...")
             return score
@@ -217,15 +572,7 @@ class JudgeEvaluator:
         if not retrieved_context:
             return 0.0
         
-        system_prompt = (
-            "You are an evaluator for an insurance claim document retrieval system.\n\n"
-            "Your task is to determine if retrieved context chunks are relevant to the user's query.\n\n"
-            "EVALUATION CRITERIA:\n"
-            "- Score 1.0 if the chunk is highly relevant and directly addresses the query\n"
-            "- Score 0.5 if the chunk is somewhat relevant but not directly related\n"
-            "- Score 0.0 if the chunk is irrelevant to the query\n\n"
-            "Respond with ONLY a number between 0.0 and 1.0 for each chunk.\n"
-        )
+        system_prompt = _CONTEXT_RELEVANCY_SYSTEM_PROMPT
         
         scores = []
         for i, chunk in enumerate(retrieved_context):
@@ -245,7 +592,7 @@ class JudgeEvaluator:
             )
             
             try:
-                output = self._call_llm(prompt, system_prompt=system_prompt)
+                output = self._call_llm(prompt, system_prompt=system_prompt, max_tokens=_SCORE_MAX_TOKENS)
                 score = self._parse_score(output)
                 scores.append(score)
             except Exception as e:
@@ -277,22 +624,20 @@ class JudgeEvaluator:
         # Extract text from retrieved chunks
         retrieved_texts = [chunk.get("text", "").strip() for chunk in retrieved_context]
         
-        system_prompt = (
-            "You are an evaluator for an insurance claim document retrieval system.\n\n"
-            "Your task is to determine if expected context chunks were retrieved by the system.\n\n"
-            "EVALUATION CRITERIA:\n"
-            "- For each expected chunk, check if a similar/containing chunk exists in retrieved chunks\n"
-            "- Consider semantic similarity (same meaning, different wording is OK)\n"
-            "- Consider partial matches (if retrieved chunk contains expected content)\n"
-            "- Respond with the number of expected chunks that were found (e.g., '2 out of 3' or '3/3')\n"
+        system_prompt = _CONTEXT_RECALL_SYSTEM_PROMPT
+        
+        # Expected chunks retrieved verbatim are found without asking the LLM
+        found_count, unmatched_context = _split_verbatim_matches(
+            retrieved_context, expected_context
         )
         
-        # For each expected chunk, check if it's in retrieved chunks
-        found_count = 0
-        for expected_text in expected_context:
-            if not expected_text.strip():
-                continue
-            
+        # The retrieved chunks are the same for every expected chunk; render them once
+        retrieved_block = "\n\n---\n\n".join(
+            [f"Chunk {i+1}:\n{t[:300]}" for i, t in enumerate(retrieved_texts)]
+        )
+        
+        # For each remaining expected chunk, check if it's in retrieved chunks
+        for expected_text in unmatched_context:
             prompt = (
                 "Query: {query}\n\n"
                 "Expected Context Chunk:\n{expected_text}\n\n"
@@ -302,13 +647,13 @@ class JudgeEvaluator:
             ).format(
                 query=query,
                 expected_text=expected_text[:300],
-                retrieved_texts="\n\n---\n\n".join(
-                    [f"Chunk {i+1}:\n{t[:300]}" for i, t in enumerate(retrieved_texts)]
-                ),
+                retrieved_texts=retrieved_block,
             )
             
             try:
-                output = self._call_llm(prompt, system_prompt=system_prompt).strip().upper()
+                output = self._call_llm(
+                    prompt, system_prompt=system_prompt, max_tokens=_YES_NO_MAX_TOKENS
+                ).strip().upper()
                 if "YES" in output or ("FOUND" in output and "NOT" not in output):
                     found_count += 1
             except Exception as e:
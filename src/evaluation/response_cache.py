@@ -0,0 +1,115 @@
+"""
+On-disk cache of orchestrator responses for evaluation runs.
+
+Re-running the evaluation suite re-executes every query end-to-end even when
+neither the query nor the indices changed. ResponseCache stores each verbose
+orchestrator response as a JSON file keyed by a SHA-256 of the query, the
+digest of the source document the indices were built from and the model,
+chunking and retrieval settings, so exact reruns become file reads.
+
+Agent prompts and code are not part of the key, which is why the cache is
+opt-in (EVAL_CACHE_ENABLED or main.py --cache).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.config.settings import config
+from src.utils.logger import logger
+
+
+# Settings the orchestrator's answers depend on, included in every cache key
+_KEY_SETTINGS = (
+    "LLM_MODEL",
+    "EMBEDDING_BACKEND",
+    "EMBEDDING_MODEL",
+    "SMALL_CHUNK_SIZE",
+    "MEDIUM_CHUNK_SIZE",
+    "LARGE_CHUNK_SIZE",
+    "CHUNK_OVERLAP",
+    "SUMMARY_TARGET_WORDS",
+    "MIN_SUMMARIZE_CHARS",
+    "TOP_K_RESULTS",
+)
+
+
+class ResponseCache:
+    """
+    Exact-match cache of orchestrator responses, persisted as JSON files.
+    
+    Entries are invalidated implicitly: a changed source document or model,
+    chunking or retrieval setting produces different keys, so stale entries
+    are simply never read.
+    """
+    
+    def __init__(self, source_fingerprint: str, cache_dir: Optional[Path] = None) -> None:
+        """
+        Initialize the response cache.
+        
+        Args:
+            source_fingerprint: Digest of the source document the indices were
+                built from (see IndexManager.load_source_fingerprint)
+            cache_dir: Directory for cache files (defaults to CACHE_DIR/eval)
+        """
+        self.logger = logger
+        self.source_fingerprint = source_fingerprint
+        self.cache_dir = cache_dir or config.CACHE_DIR / "eval"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Query-independent part of every key, fixed for the life of the cache
+        self._key_prefix = "\0".join(
+            [source_fingerprint, *(str(getattr(config, name)) for name in _KEY_SETTINGS)]
+        )
+    
+    def _path(self, query: str) -> Path:
+        """Return the cache file path for a query."""
+        key = f"{self._key_prefix}\0{query}"
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+    
+    def get(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+        
+        Args:
+            query: The query string
+            
+        Returns:
+            The cached response dict, or None on a miss
+        """
+        path = self._path(query)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable response cache entry {path.name}: {e}")
+            return None
+    
+    def put(self, query: str, response: Dict[str, Any]) -> None:
+        """
+        Store a response for a query.
+        
+        The file is written to a temporary path and renamed into place so
+        concurrent evaluations never observe a partially written entry.
+        
+        Args:
+            query: The query string
+            response: JSON-serializable response dict
+        """
+        path = self._path(query)
+        tmp_path: Optional[str] = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(response, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not write response cache entry {path.name}: {e}")
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
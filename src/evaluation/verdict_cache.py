@@ -0,0 +1,104 @@
+"""
+On-disk cache of LLM-judge verdicts for evaluation runs.
+
+Re-running the tests or the evaluation suite re-pays every judge call even
+when the agents produced the same answers as last time. VerdictCache stores
+each raw combined judge verdict as a JSON file keyed by a hash of a format
+version, the judge model, the judge rubric (system prompt) and the
+whitespace-normalized judge prompt, which contains everything the judge
+sees (query, expected and actual answers, retrieved and expected context).
+Unchanged judgements are therefore read back instead of re-judged, across
+processes and runs, while any change to an answer or its context produces
+a new key.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.config.settings import config
+from src.utils.logger import logger
+
+
+class VerdictCache:
+    """
+    Content-addressed cache of judge verdicts, kept in memory and persisted
+    as JSON files.
+    
+    Entries are never invalidated explicitly: a changed prompt or judge model
+    produces a different key, so stale entries are simply never read.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        """
+        Initialize the verdict cache.
+        
+        Args:
+            cache_dir: Directory for cache files (defaults to CACHE_DIR/judge)
+        """
+        self.logger = logger
+        self.cache_dir = cache_dir or config.CACHE_DIR / "judge"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Verdicts read or written by this process, so repeats skip the file read
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached verdict.
+        
+        Args:
+            key: Verdict key (hex digest)
+        
+        Returns:
+            Copy of the cached verdict fields, or None on a miss
+        """
+        with self._lock:
+            verdict = self._memory.get(key)
+        if verdict is not None:
+            return dict(verdict)
+        
+        path = self.cache_dir / f"{key}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                verdict = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable judge cache entry {path.name}: {e}")
+            return None
+        
+        with self._lock:
+            self._memory[key] = verdict
+        return dict(verdict)
+    
+    def put(self, key: str, verdict: Dict[str, Any]) -> None:
+        """
+        Store a verdict.
+        
+        The file is written to a temporary path and renamed into place so
+        concurrent test workers never observe a partially written entry.
+        
+        Args:
+            key: Verdict key (hex digest)
+            verdict: Verdict fields (JSON-serializable)
+        """
+        with self._lock:
+            self._memory[key] = dict(verdict)
+        
+        path = self.cache_dir / f"{key}.json"
+        tmp_path: Optional[str] = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(verdict, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not write judge cache entry {path.name}: {e}")
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
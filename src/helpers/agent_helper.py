@@ -1,5 +1,8 @@
 from logging import Logger
+import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 
 from src.indexing.index_manager import IndexManager
 from src.agents.orchestrator_system import OrchestratorSystem
@@ -8,7 +11,7 @@ from src.utils.logger import logger
 from src.data.pdf_loader import PDFLoader
 from src.config.settings import config
 from src.data.chunker import HierarchicalChunker
-from src.evaluation import EvalSuite
+from src.evaluation import EvalSuite, JudgeEvaluator
 from src.evaluation.eval_case import EvalCase
 
 
@@ -18,10 +21,23 @@ def _load_pdf(index_manager: IndexManager, log: Logger) -> None:
         message = f"PDF not found at {pdf_path}"
         log.error(message)
         raise Exception(message)
+
+    # Skip parsing and chunking entirely when the indices were built from this exact PDF
+    pdf_digest = hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+    indices_exist = index_manager.check_indices_exist()
+    stored_digest = index_manager.load_source_fingerprint()
+    if indices_exist and stored_digest is None:
+        # Indices predate fingerprinting; trust them and record the current PDF
+        index_manager.save_source_fingerprint(pdf_digest)
+        stored_digest = pdf_digest
+    if indices_exist and stored_digest == pdf_digest:
+        log.info("✓ Indices are up to date with the PDF; skipping load and chunking")
+        return
+
     try:
         loader = PDFLoader()
         document = loader.load(pdf_path)
-        log.info(f"✓ Loaded PDF: {pdf_path}")
+        log.info("✓ Loaded PDF: %s", pdf_path)
     except Exception as e:
         log.error(f"✗ Error loading PDF from {pdf_path}: {e}")
         raise e
@@ -37,14 +53,17 @@ def _load_pdf(index_manager: IndexManager, log: Logger) -> None:
     except Exception as e:
         log.error(f"✗ Error chunking document: {e}")
         raise e
-    indices_exist = index_manager.check_indices_exist()
-    if not indices_exist:
-        try:
+    try:
+        if indices_exist:
+            # The PDF changed since the indices were built
+            index_manager.rebuild_indices(hierarchical_structure)
+        else:
             index_manager.build_indices(hierarchical_structure)
-            log.info("✓ Indices built successfully")
-        except Exception as e:
-            log.error(f"✗ Error building indices: {e}")
-            raise e
+        index_manager.save_source_fingerprint(pdf_digest)
+        log.info("✓ Indices built successfully")
+    except Exception as e:
+        log.error(f"✗ Error building indices: {e}")
+        raise e
 def init() -> tuple[Logger, OrchestratorSystem]:
     log: Logger = logger
 
@@ -76,13 +95,37 @@ def assert_hard_query(orchestrator: OrchestratorSystem, test_case: EvalCase) ->
     result = orchestrator.handle_query(test_case.query)
     assert result.lower() == test_case.expected_answer.lower(), f"Answer does not match expected value. query: {test_case.query}, expected: {test_case.expected_answer.lower()}, actual: {result.lower()}"
 def assert_hard_queries(orchestrator: OrchestratorSystem, test_cases: list[EvalCase]) -> None:
-    for test_case in test_cases:
-        assert_hard_query(orchestrator, test_case)
+    _run_concurrently(lambda test_case: assert_hard_query(orchestrator, test_case), test_cases)
 
-def assert_llm_based_query(orchestrator: OrchestratorSystem, test_case: EvalCase, expected_result: float, logger: Logger) -> None:
-    test_suite = EvalSuite(orchestrator=orchestrator)
-    result = test_suite.evaluate_average(test_case, get_retrieval_context=False)
+def assert_llm_based_query(orchestrator: OrchestratorSystem, test_case: EvalCase, expected_result: float, logger: Logger, lexical_match: bool = False, response: dict | None = None, evaluator: JudgeEvaluator | None = None) -> None:
+    # Tests must exercise the live agents, so cached responses are not reused here
+    test_suite = EvalSuite(orchestrator=orchestrator, evaluator=evaluator, use_cache=False, lexical_match=lexical_match)
+    result = test_suite.evaluate_average(test_case, get_retrieval_context=False, response=response)
     assert result.answer_correctness >= expected_result, f"Answer does not match expected score. query: {test_case.query}, expected: {test_case.expected_score}, actual: {result.answer_correctness}"
-def assert_llm_based_queries(orchestrator: OrchestratorSystem, test_cases: list[EvalCase], expected_result: float, logger: Logger) -> None:
-    for test_case in test_cases:
-        assert_llm_based_query(orchestrator, test_case, expected_result, logger)
\ No newline at end of file
+def assert_llm_based_queries(orchestrator: OrchestratorSystem, test_cases: list[EvalCase], expected_result: float, logger: Logger, lexical_match: bool = False) -> None:
+    # One judge (and judge LLM client) for the whole batch
+    evaluator = JudgeEvaluator()
+    _run_concurrently(
+        lambda test_case: assert_llm_based_query(orchestrator, test_case, expected_result, logger, lexical_match, evaluator=evaluator),
+        test_cases,
+    )
+
+def run_queries(orchestrator: OrchestratorSystem, queries: list[str], log: Logger) -> dict[str, dict]:
+    """Run queries through the agents concurrently; returns verbose responses by query, omitting failed ones."""
+    responses: dict[str, dict] = {}
+    with ThreadPoolExecutor(max_workers=max(1, config.EVAL_CONCURRENCY)) as executor:
+        futures = {executor.submit(orchestrator.handle_query_verbose, query): query for query in dict.fromkeys(queries)}
+        for future, query in futures.items():
+            try:
+                responses[query] = future.result()
+            except Exception as e:
+                # The test for this query runs it again and reports the error itself
+                log.warning(f"Pre-running query failed: {query[:50]}... ({e})")
+    return responses
+
+def _run_concurrently(assert_case: Callable[[EvalCase], None], test_cases: list[EvalCase]) -> None:
+    # The queries are I/O bound; result() re-raises each case's AssertionError in input order
+    with ThreadPoolExecutor(max_workers=max(1, config.EVAL_CONCURRENCY)) as executor:
+        futures = [executor.submit(assert_case, test_case) for test_case in test_cases]
+        for future in futures:
+            future.result()
@@ -13,13 +13,194 @@ Template Method Pattern allows:
 - Consistent indexing behavior across different index types
 """
 
+from __future__ import annotations
+
+import hashlib
+import random
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Deque, Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from pathlib import Path
+from src.config.settings import config
+from src.config.constants import METADATA_KEYS
 from src.utils.exceptions import IndexingError
 from src.utils.logger import logger
 
 
+# Upper bound of the random delay before each embedding request (avoids 429 bursts)
+_EMBED_JITTER_SECONDS = 0.05
+
+# Per-input token limit of the OpenAI embedding models
+_EMBED_MAX_INPUT_TOKENS = 8191
+
+# (id, text, metadata) record produced by BaseIndexer.to_record()
+_Record = Tuple[str, str, Dict[str, Any]]
+
+# Metadata keys of the record locality sort key
+_K_DOCUMENT_ID = METADATA_KEYS["document_id"]
+_K_SECTION_ID = METADATA_KEYS["section_id"]
+_K_LEVEL = METADATA_KEYS["level"]
+
+
+def _record_locality_key(record: _Record) -> Tuple[str, str, str]:
+    """Sort key grouping records of the same document and section together."""
+    metadata = record[2]
+    return (
+        str(metadata.get(_K_DOCUMENT_ID, "")),
+        str(metadata.get(_K_SECTION_ID, "")),
+        str(metadata.get(_K_LEVEL, "")),
+    )
+
+
+# One ChromaDB client per persist directory, shared by every indexer in the process
+_chroma_clients: Dict[str, Any] = {}
+_chroma_clients_lock = threading.Lock()
+
+
+def get_chroma_client(persist_directory: Path):
+    """
+    Get the shared ChromaDB PersistentClient for a persist directory.
+    
+    Indexers call initialize_index() on every load and build, so the client
+    (and its SQLite connections and background threads) is created once per
+    directory and reused instead of being reopened each time.
+    
+    Args:
+        persist_directory: Directory the client persists to (created if missing)
+    
+    Returns:
+        chromadb.PersistentClient: Shared client for the directory
+    """
+    key = str(Path(persist_directory).resolve())
+    with _chroma_clients_lock:
+        client = _chroma_clients.get(key)
+        if client is None:
+            import chromadb
+            from chromadb.config import Settings
+            
+            Path(persist_directory).mkdir(parents=True, exist_ok=True)
+            client = chromadb.PersistentClient(
+                path=str(persist_directory),
+                settings=Settings(
+                    anonymized_telemetry=False,
+                    allow_reset=True
+                )
+            )
+            if config.CHROMA_SQLITE_WAL:
+                _enable_sqlite_wal(Path(persist_directory))
+            _chroma_clients[key] = client
+        return client
+
+
+def _enable_sqlite_wal(persist_directory: Path) -> None:
+    """
+    Switch a ChromaDB SQLite file to write-ahead logging.
+    
+    WAL avoids rewriting the rollback journal and fsyncing the main database
+    on every commit, the dominant cost of large collection.add() calls. The
+    journal mode is stored in the database file, so it also applies to the
+    connections ChromaDB opens itself. ChromaDB keeps synchronous=FULL, so
+    committed transactions stay durable; the cost is the extra -wal and
+    -shm files next to the database.
+    
+    Args:
+        persist_directory: Directory holding ChromaDB's chroma.sqlite3
+    """
+    db_file = persist_directory / "chroma.sqlite3"
+    if not db_file.exists():
+        return
+    try:
+        conn = sqlite3.connect(str(db_file), timeout=1.0)
+        try:
+            mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        finally:
+            conn.close()
+        logger.debug("SQLite journal_mode=%s for %s", mode, db_file)
+    except sqlite3.Error as e:
+        logger.warning(f"Could not enable WAL for {db_file}: {e}")
+
+
+# PRAGMAs for one-shot bulk builds: no rollback journal, no fsync, exclusive
+# file lock. A crash mid-build can corrupt the index, which is then rebuilt.
+_BULK_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA locking_mode = EXCLUSIVE",
+)
+
+
+def _default_sqlite_pragmas() -> Tuple[str, ...]:
+    """
+    PRAGMAs undoing _BULK_SQLITE_PRAGMAS once a bulk build is done.
+    
+    locking_mode=NORMAL only releases the exclusive lock on the next access,
+    so the final read makes the connection give it up immediately.
+    """
+    return (
+        "PRAGMA locking_mode = NORMAL",
+        f"PRAGMA journal_mode = {'WAL' if config.CHROMA_SQLITE_WAL else 'DELETE'}",
+        "PRAGMA synchronous = FULL",
+        "PRAGMA temp_store = DEFAULT",
+        "SELECT count(*) FROM sqlite_master",
+    )
+
+
+def _apply_sqlite_pragmas(client: Any, pragmas: Iterable[str]) -> bool:
+    """
+    Run PRAGMA statements on the calling thread's ChromaDB connection.
+    
+    Only possible when the client runs on ChromaDB's Python SQLite backend
+    (chromadb < 0.6); its connections are per thread, so this must run on
+    the thread that performs the inserts. The Rust backend used by newer
+    releases manages its own connections and is left untouched.
+    
+    Args:
+        client: ChromaDB client returned by get_chroma_client()
+        pragmas: Statements to execute, in order
+    
+    Returns:
+        bool: True if the PRAGMAs were applied
+    """
+    instances = getattr(getattr(client, "_system", None), "_instances", {})
+    sqlite_db = next(
+        (inst for inst in instances.values() if hasattr(inst, "_conn_pool")), None
+    )
+    if sqlite_db is None:
+        return False
+    pool = sqlite_db._conn_pool
+    conn = pool.connect()
+    try:
+        for pragma in pragmas:
+            conn.execute(pragma).fetchall()
+    finally:
+        pool.return_to_pool(conn)
+    return True
+
+
+def reset_chroma_clients() -> None:
+    """Forget the shared ChromaDB clients (e.g. after index directories are replaced)."""
+    with _chroma_clients_lock:
+        _chroma_clients.clear()
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Tokenizer of the configured embedding model, compiled once per process."""
+    import tiktoken
+    
+    try:
+        return tiktoken.encoding_for_model(config.EMBEDDING_MODEL)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 class BaseIndexer(ABC):
     """
     Abstract base class for all indexers (Template Method Pattern).
@@ -27,13 +208,16 @@ class BaseIndexer(ABC):
     This class defines the template method pattern for indexing:
     1. Initialize index (abstract)
     2. Prepare data (abstract)
-    3. Generate embeddings (common)
-    4. Store in index (abstract)
-    5. Persist index (common)
+    3. Store in index (common): embed items in batches and bulk-insert them
+    4. Persist index (common)
     
     Subclasses implement specific steps while inheriting common functionality.
+    Storage is customized through the to_record() and embed_batch() hooks.
     """
     
+    # Shared by all indexers so concurrent builds stay within the provider's rate limits
+    _embed_slots = threading.BoundedSemaphore(max(1, config.EMBED_MAX_IN_FLIGHT))
+    
     def __init__(self, collection_name: str, persist_directory: Path = None):
         """
         Initialize the base indexer.
@@ -47,6 +231,7 @@ class BaseIndexer(ABC):
         self.logger = logger
         self.collection = None
         self.embedding_model = None
+        self.embedding_function = None
     
     @abstractmethod
     def initialize_index(self):
@@ -82,13 +267,121 @@ class BaseIndexer(ABC):
         """
         pass
     
-    @abstractmethod
+    def to_record(self, item: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Convert a prepared item into an (id, text, metadata) record.
+        
+        The default expects items shaped as {"id", "text", "metadata"};
+        subclasses whose prepare_data() yields other shapes override this.
+        
+        Args:
+            item: Prepared data item
+        
+        Returns:
+            Tuple[str, str, Dict[str, Any]]: Record ID, document text and metadata
+        """
+        return item["id"], item["text"], item["metadata"]
+    
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for a batch of texts in a single request.
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            List[List[float]]: One embedding vector per text
+        """
+        return self.embedding_function.get_text_embedding_batch(texts)
+    
+    def _pack_batches(
+        self,
+        groups: Iterable[List[_Record]],
+    ) -> Iterator[Tuple[List[str], List[List[_Record]]]]:
+        """
+        Greedily pack text groups into batches bounded by item count and token budget.
+        
+        Texts longer than the embedding model's per-input limit are truncated
+        for embedding only; the stored document keeps the full text.
+        
+        Args:
+            groups: Lists of (id, text, metadata) records sharing one text,
+                in input order
+        
+        Yields:
+            (texts, groups) per embedding request: the text to embed for each
+            group, and the groups themselves
+        """
+        max_items = max(1, config.EMBED_BATCH_SIZE)
+        max_tokens = config.EMBED_BATCH_MAX_TOKENS
+        encoding = _get_encoding()
+        
+        texts: List[str] = []
+        batch: List[List[_Record]] = []
+        batch_tokens = 0
+        for group in groups:
+            text = group[0][1]
+            tokens = encoding.encode_ordinary(text)
+            if len(tokens) > _EMBED_MAX_INPUT_TOKENS:
+                tokens = tokens[:_EMBED_MAX_INPUT_TOKENS]
+                text = encoding.decode(tokens)
+            if batch and (len(batch) >= max_items or batch_tokens + len(tokens) > max_tokens):
+                yield texts, batch
+                texts, batch, batch_tokens = [], [], 0
+            texts.append(text)
+            batch.append(group)
+            batch_tokens += len(tokens)
+        if batch:
+            yield texts, batch
+    
+    def _add_batch(self, batch_num: int, batch: List[List[_Record]], future: Future) -> None:
+        """Insert every record of one packed batch once its embeddings are ready."""
+        import numpy as np
+        
+        # Transpose the batch's records into columns in one pass
+        ids, documents, metadatas = zip(*chain.from_iterable(batch))
+        # float32 is what the HNSW index stores, at a quarter of the size of
+        # Python float lists; the API response lists are dropped right away
+        embeddings = np.asarray(future.result(), dtype=np.float32)
+        if len(ids) > len(batch):
+            # Repeat each vector for every record sharing its text
+            embeddings = np.repeat(embeddings, [len(group) for group in batch], axis=0)
+        # Insert in slices of CHROMA_ADD_BATCH_SIZE: very large add() calls slow
+        # down super-linearly in ChromaDB's SQLite layer
+        step = max(1, config.CHROMA_ADD_BATCH_SIZE)
+        for start in range(0, len(ids), step):
+            end = start + step
+            self.collection.add(
+                ids=list(ids[start:end]),
+                embeddings=embeddings[start:end],
+                metadatas=list(metadatas[start:end]),
+                documents=list(documents[start:end]),
+            )
+        self.logger.debug("Stored batch %d (%d items, %d embedded)", batch_num, len(ids), len(batch))
+    
+    def _embed_batch_staggered(self, texts: List[str]) -> List[List[float]]:
+        """Call embed_batch() after a small random delay, within the shared request cap."""
+        time.sleep(random.uniform(0.0, _EMBED_JITTER_SECONDS))
+        with BaseIndexer._embed_slots:
+            return self.embed_batch(texts)
+    
     def store_in_index(self, items: List[Dict[str, Any]]):
         """
-        Store items in the index.
+        Store items in the index (common functionality).
         
-        This method handles the actual storage of items in ChromaDB.
-        Each subclass implements its own storage logic.
+        Items with identical text are embedded once and the vector is shared
+        by all of them. Unique texts are packed into groups of at most
+        config.EMBED_BATCH_SIZE texts and config.EMBED_BATCH_MAX_TOKENS
+        tokens: each group is embedded with one embed_batch() call and
+        bulk-inserted into the ChromaDB collection in collection.add() calls
+        of at most config.CHROMA_ADD_BATCH_SIZE records. Records are ordered
+        by document, section and level first, so neighbouring inserts land
+        near each other in the HNSW graph. Up to config.EMBED_MAX_IN_FLIGHT
+        embedding requests run concurrently, since they are network-bound;
+        groups are still inserted in input order. With config.BULK_INDEXING
+        the inserting connection runs with _BULK_SQLITE_PRAGMAS for the
+        duration of the call and is restored to normal locking and
+        durability afterwards.
         
         Args:
             items: List of items to store, each containing text and metadata
@@ -96,7 +389,76 @@ class BaseIndexer(ABC):
         Raises:
             IndexingError: If storage fails
         """
-        pass
+        try:
+            if not items:
+                self.logger.warning(f"No items to store in index '{self.collection_name}'")
+                return
+            
+            self.logger.info(f"Storing {len(items)} items in index '{self.collection_name}'")
+            started = time.perf_counter()
+            
+            bulk_pragmas = config.BULK_INDEXING and _apply_sqlite_pragmas(
+                getattr(self, "chroma_client", None), _BULK_SQLITE_PRAGMAS
+            )
+            self.logger.debug("Bulk SQLite PRAGMAs applied: %s", bool(bulk_pragmas))
+            try:
+                self._store_records(items, started)
+            finally:
+                # The pooled connection outlives the build; give back the exclusive
+                # lock and durability so later queries in this process still work
+                if bulk_pragmas:
+                    _apply_sqlite_pragmas(self.chroma_client, _default_sqlite_pragmas())
+        
+        except Exception as e:
+            error_msg = f"Error storing items in index '{self.collection_name}': {str(e)}"
+            self.logger.error(error_msg)
+            raise IndexingError(error_msg) from e
+    
+    def _store_records(self, items: List[Dict[str, Any]], started: float) -> None:
+        """
+        Embed items and insert them into the collection (see store_in_index).
+        
+        Args:
+            items: Non-empty list of items to store
+            started: perf_counter() value when storing began (for logging)
+        """
+        # Insert records ordered by document/section/level so consecutive HNSW
+        # inserts are neighbours, instead of in small/medium/large order
+        records = sorted(map(self.to_record, items), key=_record_locality_key)
+        
+        # Group records by a 128-bit hash of their text, keeping first-seen order
+        text_groups: Dict[bytes, List[_Record]] = {}
+        for record in records:
+            key = hashlib.blake2b(record[1].encode("utf-8"), digest_size=16).digest()
+            text_groups.setdefault(key, []).append(record)
+        if len(text_groups) < len(items):
+            self.logger.info(
+                f"Embedding {len(text_groups)} unique texts for {len(items)} items"
+            )
+        
+        # Submission is windowed so at most max_in_flight batches of embeddings
+        # are held at once; each is inserted from this thread, in input order,
+        # and released as soon as it has been added.
+        max_in_flight = max(1, config.EMBED_MAX_IN_FLIGHT)
+        pending: Deque[Tuple[int, List[List[_Record]], Future]] = deque()
+        batch_num = 0
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for batch_num, (texts, batch) in enumerate(
+                self._pack_batches(text_groups.values()), start=1
+            ):
+                pending.append(
+                    (batch_num, batch, executor.submit(self._embed_batch_staggered, texts))
+                )
+                if len(pending) >= max_in_flight:
+                    self._add_batch(*pending.popleft())
+            while pending:
+                self._add_batch(*pending.popleft())
+        
+        self.logger.info(
+            "Embedded %d texts for %d items in %d batches (%.1fs)",
+            len(text_groups), len(items), batch_num, time.perf_counter() - started,
+        )
+        self.logger.info(f"Successfully stored {len(items)} items in index '{self.collection_name}'")
     
     def persist_index(self):
         """
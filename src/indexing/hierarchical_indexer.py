@@ -11,21 +11,17 @@ This module implements HierarchicalIndexer which:
 Extends BaseIndexer and implements the template method steps.
 """
 
+from __future__ import annotations
+
+from itertools import chain
 from typing import List, Dict, Any
 from pathlib import Path
-import chromadb
-from chromadb.config import Settings
-from llama_index.embeddings.openai import OpenAIEmbedding
-from llama_index.core import Document as LlamaIndexDocument
-from src.indexing.base_indexer import BaseIndexer
-from src.indexing.index_schema import (
-    create_hierarchical_metadata,
-    validate_hierarchical_metadata,
-    get_hierarchical_metadata_keys,
-)
+from src.indexing.base_indexer import BaseIndexer, get_chroma_client
+from src.indexing.index_schema import VALID_LEVELS, create_hierarchical_metadata
 from src.config.constants import HIERARCHICAL_COLLECTION_NAME
 from src.config.settings import config
 from src.utils.exceptions import IndexingError
+from src.utils.embeddings import create_embedding_model
 from src.utils.logger import logger
 
 
@@ -76,38 +72,23 @@ class HierarchicalIndexer(BaseIndexer):
             self.logger.info("Initializing hierarchical index")
             
             # Initialize ChromaDB client with persistence
-            # Note: We use PersistentClient to save to disk
-            # For Windows compatibility, ensure path exists
-            self.persist_directory.mkdir(parents=True, exist_ok=True)
-            
-            self.chroma_client = chromadb.PersistentClient(
-                path=str(self.persist_directory),
-                settings=Settings(
-                    anonymized_telemetry=False,
-                    allow_reset=True
-                )
-            )
+            # Note: We use PersistentClient to save to disk; the client is
+            # shared per directory and creates the path if missing
+            self.chroma_client = get_chroma_client(self.persist_directory)
             
-            # Initialize embedding model (OpenAI)
-            self.embedding_function = OpenAIEmbedding(
-                model_name=config.EMBEDDING_MODEL,
-                api_key=config.OPENAI_API_KEY
-            )
+            # Initialize embedding model (configured backend; the embedding
+            # client library is imported lazily by the factory)
+            self.embedding_function = create_embedding_model()
             
             # Create or get collection
             # ChromaDB will create the collection if it doesn't exist
-            try:
-                self.collection = self.chroma_client.get_collection(
-                    name=self.collection_name
-                )
-                self.logger.info(f"Loaded existing collection '{self.collection_name}'")
-            except Exception:
-                # Collection doesn't exist, create it
-                self.collection = self.chroma_client.create_collection(
-                    name=self.collection_name,
-                    metadata={"description": "Hierarchical index with small, medium, and large chunks"}
-                )
-                self.logger.info(f"Created new collection '{self.collection_name}'")
+            self.collection = self.chroma_client.get_or_create_collection(
+                name=self.collection_name,
+                metadata={"description": "Hierarchical index with small, medium, and large chunks"}
+            )
+            self.logger.info(
+                f"Using collection '{self.collection_name}' ({self.collection.count()} items)"
+            )
             
             self.logger.info("Hierarchical index initialized successfully")
         
@@ -138,30 +119,27 @@ class HierarchicalIndexer(BaseIndexer):
         try:
             self.logger.info("Preparing hierarchical chunks for indexing")
             
-            items = []
             chunks = hierarchical_structure.get("chunks", {})
             
-            # Process chunks at all three levels
-            for level in ["small", "medium", "large"]:
-                level_chunks = chunks.get(level, [])
-                
-                for chunk in level_chunks:
-                    # Create metadata using schema helper
-                    metadata = create_hierarchical_metadata(chunk)
-                    
-                    # Validate metadata
-                    if not validate_hierarchical_metadata(metadata):
-                        self.logger.warning(f"Invalid metadata for chunk {chunk.get('chunk_id')}, skipping")
-                        continue
-                    
-                    # Create item for indexing
-                    item = {
-                        "id": chunk.get("chunk_id", ""),
-                        "text": chunk.get("text", ""),
-                        "metadata": metadata,
-                    }
-                    
-                    items.append(item)
+            # Flatten all three levels and build items in one pass, validating
+            # inline: the level is the only field validate_hierarchical_metadata
+            # can reject, since chunk_id/document_id are always filled in
+            all_chunks = list(chain.from_iterable(
+                chunks.get(level, []) for level in ("small", "medium", "large")
+            ))
+            items = [
+                {
+                    "id": chunk.get("chunk_id", ""),
+                    "text": chunk.get("text", ""),
+                    "metadata": create_hierarchical_metadata(chunk),
+                }
+                for chunk in all_chunks
+                if chunk.get("level") in VALID_LEVELS
+            ]
+            if len(items) < len(all_chunks):
+                self.logger.warning(
+                    f"Skipping {len(all_chunks) - len(items)} chunks with an invalid level"
+                )
             
             self.logger.info(f"Prepared {len(items)} chunks for indexing")
             return items
@@ -171,68 +149,6 @@ class HierarchicalIndexer(BaseIndexer):
             self.logger.error(error_msg)
             raise IndexingError(error_msg) from e
     
-    def store_in_index(self, items: List[Dict[str, Any]]):
-        """
-        Store items in the ChromaDB hierarchical index.
-        
-        This method:
-        1. Generates embeddings for all chunk texts
-        2. Stores chunks with embeddings and metadata in ChromaDB
-        3. Preserves all hierarchical relationships
-        
-        Args:
-            items: List of items to store
-        
-        Raises:
-            IndexingError: If storage fails
-        """
-        try:
-            if not items:
-                self.logger.warning("No items to store in hierarchical index")
-                return
-            
-            self.logger.info(f"Storing {len(items)} chunks in hierarchical index")
-            
-            # Extract texts, ids, and metadata
-            texts = [item["text"] for item in items]
-            ids = [item["id"] for item in items]
-            metadatas = [item["metadata"] for item in items]
-            
-            # Generate embeddings using OpenAI
-            # Note: ChromaDB can generate embeddings automatically, but we use
-            # OpenAI embeddings explicitly for consistency with llama-index
-            self.logger.info("Generating embeddings for chunks")
-            embeddings = []
-            
-            # Batch embeddings for efficiency
-            batch_size = 100
-            for i in range(0, len(texts), batch_size):
-                batch_texts = texts[i:i + batch_size]
-                batch_embeddings = self.embedding_function.get_text_embedding_batch(batch_texts)
-                embeddings.extend(batch_embeddings)
-                self.logger.debug(f"Generated embeddings for batch {i//batch_size + 1}")
-            
-            # Store in ChromaDB collection
-            # ChromaDB expects:
-            # - ids: List of unique IDs
-            # - embeddings: List of embedding vectors (or None if using ChromaDB's embedding function)
-            # - metadatas: List of metadata dictionaries
-            # - documents: List of text documents
-            
-            self.collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                metadatas=metadatas,
-                documents=texts
-            )
-            
-            self.logger.info(f"Successfully stored {len(items)} chunks in hierarchical index")
-        
-        except Exception as e:
-            error_msg = f"Error storing items in hierarchical index: {str(e)}"
-            self.logger.error(error_msg)
-            raise IndexingError(error_msg) from e
-    
     def get_collection(self):
         """
         Get the ChromaDB collection.
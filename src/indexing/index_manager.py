@@ -10,8 +10,15 @@ This module implements IndexManager which:
 Uses Factory Pattern to create and manage indexer instances.
 """
 
+import hashlib
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 from pathlib import Path
+from src.indexing.base_indexer import reset_chroma_clients
 from src.indexing.hierarchical_indexer import HierarchicalIndexer
 from src.indexing.summary_indexer import SummaryIndexer
 from src.config.settings import config
@@ -19,6 +26,42 @@ from src.utils.exceptions import IndexingError, ConfigurationError
 from src.utils.logger import logger
 
 
+# SQLite WAL side files, rewritten on every open of the database
+_SQLITE_SIDE_FILE_SUFFIXES = ("-wal", "-shm")
+
+
+def _dir_nonempty(path: Path) -> bool:
+    """Return True if path is a directory with at least one entry (reads one entry only)."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _discard_dir(path: Path) -> None:
+    """
+    Remove a directory without blocking on the delete.
+    
+    The directory is renamed to a sibling first, so the original path is free
+    immediately, and the renamed copy is deleted on a daemon thread. Falls
+    back to a synchronous delete if the rename fails (e.g. files held open
+    on Windows).
+    """
+    stale = path.with_name(f"{path.name}.old-{os.getpid()}-{time.time_ns()}")
+    try:
+        os.replace(path, stale)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(stale,),
+        kwargs={"ignore_errors": True},
+        daemon=True,
+    ).start()
+
+
 class IndexManager:
     """
     Manager for coordinating indexing operations (Factory Pattern + Singleton).
@@ -41,13 +84,23 @@ class IndexManager:
     """
 
     _instance: Optional["IndexManager"] = None
+    # config.validate() only needs to pass once per process
+    _config_validated: bool = False
+    # Guards instance creation and construction against concurrent callers
+    _lock = threading.Lock()
+    # Guards initialize() so concurrent callers create the indexers only once
+    _init_lock = threading.RLock()
 
     def __new__(cls, *args, **kwargs):
         """
         Ensure only one IndexManager instance exists (Singleton).
+        
+        Thread-safe: the instance is checked and created under a class lock.
         """
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self):
@@ -60,39 +113,56 @@ class IndexManager:
         if getattr(self, "_constructed", False):
             return
 
-        self._constructed = True
-        self.logger = logger
-        self.hierarchical_indexer: Optional[HierarchicalIndexer] = None
-        self.summary_indexer: Optional[SummaryIndexer] = None
-        self._initialized = False
-        # Caches whether indices have already been loaded from disk
-        self._indices_loaded: bool = False
+        with IndexManager._lock:
+            if getattr(self, "_constructed", False):
+                return
+            self.logger = logger
+            self.hierarchical_indexer: Optional[HierarchicalIndexer] = None
+            self.summary_indexer: Optional[SummaryIndexer] = None
+            self._initialized = False
+            # Caches whether indices have already been loaded from disk
+            self._indices_loaded: bool = False
+            self._constructed = True
     
-    def initialize(self):
+    def initialize(self, force: bool = False):
         """
         Initialize both indexers.
         
         This method creates instances of both indexers and prepares them
         for use. It should be called before any indexing operations.
+        Repeated calls are no-ops once initialized, unless force is set.
+        Concurrent callers are serialized, so the indexers are created once.
+        
+        Args:
+            force: Recreate the indexers even if already initialized
         """
-        try:
-            self.logger.info("Initializing IndexManager")
-            
-            # Validate configuration
-            if not config.validate():
-                raise ConfigurationError("Invalid configuration. Check API keys and settings.")
+        if self._initialized and not force:
+            return
+        
+        with IndexManager._init_lock:
+            if self._initialized and not force:
+                return
             
-            # Create indexer instances (Factory Pattern)
-            self.hierarchical_indexer = HierarchicalIndexer()
-            self.summary_indexer = SummaryIndexer()
+            try:
+                self.logger.info("Initializing IndexManager")
+                
+                # Validate configuration
+                if not IndexManager._config_validated:
+                    if not config.validate():
+                        raise ConfigurationError("Invalid configuration. Check API keys and settings.")
+                    IndexManager._config_validated = True
+                
+                # Create indexer instances (Factory Pattern)
+                self.hierarchical_indexer = HierarchicalIndexer()
+                self.summary_indexer = SummaryIndexer()
+                
+                self._initialized = True
+                self.logger.info("IndexManager initialized successfully")
             
-            self._initialized = True
-            self.logger.info("IndexManager initialized successfully")
-        
-        except Exception as e:
-            error_msg = f"Error initializing IndexManager: {str(e)}"
-            self.logger.error(error_msg)
-            raise IndexingError(error_msg) from e
+            except Exception as e:
+                error_msg = f"Error initializing IndexManager: {str(e)}"
+                self.logger.error(error_msg)
+                raise IndexingError(error_msg) from e
     
     def load_indices(self) -> bool:
         """
@@ -146,6 +216,9 @@ class IndexManager:
         1. Builds hierarchical index from chunks
         2. Builds summary index using MapReduce strategy
         
+        The two builds are independent and network-bound, so they run
+        concurrently; BaseIndexer caps embedding requests across both.
+        
         Args:
             hierarchical_structure: Hierarchical chunk structure from chunker
         
@@ -161,17 +234,24 @@ class IndexManager:
         try:
             self.logger.info("Building indices from hierarchical structure")
             
-            # Build hierarchical index
-            if self.hierarchical_indexer:
-                self.logger.info("Building hierarchical index...")
-                self.hierarchical_indexer.build_index(hierarchical_structure)
-                self.logger.info("Hierarchical index built successfully")
-            
-            # Build summary index
-            if self.summary_indexer:
-                self.logger.info("Building summary index...")
-                self.summary_indexer.build_index(hierarchical_structure)
-                self.logger.info("Summary index built successfully")
+            indexers = [
+                (name, indexer)
+                for name, indexer in (
+                    ("Hierarchical", self.hierarchical_indexer),
+                    ("Summary", self.summary_indexer),
+                )
+                if indexer
+            ]
+            with ThreadPoolExecutor(max_workers=max(1, len(indexers))) as executor:
+                futures = []
+                for name, indexer in indexers:
+                    self.logger.info(f"Building {name.lower()} index...")
+                    futures.append(
+                        (name, executor.submit(indexer.build_index, hierarchical_structure))
+                    )
+                for name, future in futures:
+                    future.result()
+                    self.logger.info(f"{name} index built successfully")
             
             self.logger.info("All indices built successfully")
             return True
@@ -258,30 +338,57 @@ class IndexManager:
         Check if indices exist on disk.
         
         Returns:
-            Dict[str, bool]: Dictionary indicating which indices exist:
-                - hierarchical: True if hierarchical index exists
-                - summary: True if summary index exists
+            bool: True if both the hierarchical and summary index directories
+                exist and are non-empty (contain ChromaDB files)
+        """
+        return _dir_nonempty(config.HIERARCHICAL_INDEX_DIR) and _dir_nonempty(
+            config.SUMMARY_INDEX_DIR
+        )
+    
+    def fingerprint(self) -> str:
         """
-        result = {
-            "hierarchical": False,
-            "summary": False,
-        }
+        Compute a fingerprint of the indices currently on disk.
         
-        # Check if index directories exist and contain collections
-        hierarchical_path = config.HIERARCHICAL_INDEX_DIR
-        summary_path = config.SUMMARY_INDEX_DIR
+        The fingerprint changes whenever an index file is added, removed or
+        rewritten, so it can be used to invalidate caches of query results.
+        SQLite's -wal and -shm files are skipped: they are touched whenever a
+        process opens the database, not only when the index changes.
         
-        if hierarchical_path.exists():
-            # Check if ChromaDB collection exists (look for chroma.sqlite3 or similar)
-            collection_files = list(hierarchical_path.glob("*"))
-            if not len(collection_files) > 0:
-                return False
+        Returns:
+            str: Hex digest identifying the current on-disk index state
+        """
+        digest = hashlib.sha256()
+        for index_dir in (config.HIERARCHICAL_INDEX_DIR, config.SUMMARY_INDEX_DIR):
+            if not index_dir.exists():
+                continue
+            for path in sorted(index_dir.rglob("*")):
+                if path.is_file() and not path.name.endswith(_SQLITE_SIDE_FILE_SUFFIXES):
+                    stat = path.stat()
+                    relative = path.relative_to(config.INDICES_DIR).as_posix()
+                    digest.update(f"{relative}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        return digest.hexdigest()
+    
+    def load_source_fingerprint(self) -> Optional[str]:
+        """
+        Load the fingerprint of the source document the indices were built from.
         
-        if summary_path.exists():
-            collection_files = list(summary_path.glob("*"))
-            if not len(collection_files) > 0:
-                return False        
-        return True
+        Returns:
+            Optional[str]: Stored SHA-256 hex digest, or None if not recorded
+        """
+        try:
+            return config.SOURCE_FINGERPRINT_FILE.read_text(encoding="utf-8").strip() or None
+        except FileNotFoundError:
+            return None
+    
+    def save_source_fingerprint(self, digest: str) -> None:
+        """
+        Record the fingerprint of the source document the indices were built from.
+        
+        Args:
+            digest: SHA-256 hex digest of the source document
+        """
+        config.SOURCE_FINGERPRINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        config.SOURCE_FINGERPRINT_FILE.write_text(digest, encoding="utf-8")
     
     def rebuild_indices(self, hierarchical_structure: Dict[str, Any]) -> bool:
         """
@@ -300,18 +407,19 @@ class IndexManager:
         try:
             self.logger.info("Rebuilding indices from scratch")
             
-            # Delete existing indices
-            import shutil
+            # Move existing indices aside; they are deleted in the background
             if config.HIERARCHICAL_INDEX_DIR.exists():
-                shutil.rmtree(config.HIERARCHICAL_INDEX_DIR)
+                _discard_dir(config.HIERARCHICAL_INDEX_DIR)
                 self.logger.info("Deleted existing hierarchical index")
             
             if config.SUMMARY_INDEX_DIR.exists():
-                shutil.rmtree(config.SUMMARY_INDEX_DIR)
+                _discard_dir(config.SUMMARY_INDEX_DIR)
                 self.logger.info("Deleted existing summary index")
             
-            # Reinitialize indexers
-            self.initialize()
+            # Reinitialize indexers on fresh clients for the new directories
+            reset_chroma_clients()
+            self.initialize(force=True)
+            self._indices_loaded = False
             
             # Build indices
             return self.build_indices(hierarchical_structure)
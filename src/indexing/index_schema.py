@@ -14,6 +14,28 @@ from src.config.constants import (
 )
 
 
+# Metadata key names resolved once at import (used on every chunk)
+_K_CHUNK_ID = METADATA_KEYS["chunk_id"]
+_K_PARENT_ID = METADATA_KEYS["parent_id"]
+_K_LEVEL = METADATA_KEYS["level"]
+_K_SECTION = METADATA_KEYS["section"]
+_K_TIMESTAMP = METADATA_KEYS["timestamp"]
+_K_CHUNK_TEXT = METADATA_KEYS["chunk_text"]
+_K_POSITION_INDEX = METADATA_KEYS["position_index"]
+_K_DOCUMENT_ID = METADATA_KEYS["document_id"]
+_K_SECTION_ID = METADATA_KEYS["section_id"]
+_K_CLAIM_ID = METADATA_KEYS["claim_id"]
+_K_SUMMARY_LEVEL = METADATA_KEYS["summary_level"]
+
+# Chunk levels accepted into the hierarchical index
+VALID_LEVELS = frozenset(cs.value for cs in ChunkSize)
+
+# Validation constants, built once at import instead of on every call
+_VALID_SUMMARY_LEVELS = frozenset({"chunk", "section", "document"})
+_REQUIRED_HIERARCHICAL_KEYS = (_K_CHUNK_ID, _K_LEVEL, _K_DOCUMENT_ID)
+_REQUIRED_SUMMARY_KEYS = (_K_CHUNK_ID, _K_SUMMARY_LEVEL)
+
+
 def get_hierarchical_metadata_keys() -> List[str]:
     """
     Get list of metadata keys for hierarchical index.
@@ -62,22 +84,10 @@ def validate_hierarchical_metadata(metadata: Dict[str, Any]) -> bool:
     Returns:
         bool: True if metadata is valid, False otherwise
     """
-    required_keys = [
-        METADATA_KEYS["chunk_id"],
-        METADATA_KEYS["level"],
-        METADATA_KEYS["document_id"],
-    ]
-    
-    for key in required_keys:
-        if key not in metadata:
-            return False
-    
-    # Validate level value
-    level = metadata.get(METADATA_KEYS["level"])
-    if level not in [cs.value for cs in ChunkSize]:
-        return False
-    
-    return True
+    return (
+        all(key in metadata for key in _REQUIRED_HIERARCHICAL_KEYS)
+        and metadata.get(_K_LEVEL) in VALID_LEVELS
+    )
 
 
 def validate_summary_metadata(metadata: Dict[str, Any]) -> bool:
@@ -90,21 +100,10 @@ def validate_summary_metadata(metadata: Dict[str, Any]) -> bool:
     Returns:
         bool: True if metadata is valid, False otherwise
     """
-    required_keys = [
-        METADATA_KEYS["chunk_id"],
-        METADATA_KEYS["summary_level"],
-    ]
-    
-    for key in required_keys:
-        if key not in metadata:
-            return False
-    
-    # Validate summary_level value
-    summary_level = metadata.get(METADATA_KEYS["summary_level"])
-    if summary_level not in ["chunk", "section", "document"]:
-        return False
-    
-    return True
+    return (
+        all(key in metadata for key in _REQUIRED_SUMMARY_KEYS)
+        and metadata.get(_K_SUMMARY_LEVEL) in _VALID_SUMMARY_LEVELS
+    )
 
 
 def create_hierarchical_metadata(chunk: Dict[str, Any]) -> Dict[str, Any]:
@@ -118,24 +117,24 @@ def create_hierarchical_metadata(chunk: Dict[str, Any]) -> Dict[str, Any]:
         Dict[str, Any]: Metadata dictionary for ChromaDB
     """
     metadata = {
-        METADATA_KEYS["chunk_id"]: chunk.get("chunk_id", ""),
-        METADATA_KEYS["level"]: chunk.get("level", ""),
-        METADATA_KEYS["document_id"]: chunk.get("document_id", ""),
-        METADATA_KEYS["chunk_text"]: chunk.get("text", ""),
+        _K_CHUNK_ID: chunk.get("chunk_id", ""),
+        _K_LEVEL: chunk.get("level", ""),
+        _K_DOCUMENT_ID: chunk.get("document_id", ""),
+        _K_CHUNK_TEXT: chunk.get("text", ""),
     }
     
     # Add optional fields if present
     if "parent_id" in chunk:
-        metadata[METADATA_KEYS["parent_id"]] = chunk["parent_id"]
+        metadata[_K_PARENT_ID] = chunk["parent_id"]
     if "section_id" in chunk:
-        metadata[METADATA_KEYS["section_id"]] = chunk["section_id"]
-        metadata[METADATA_KEYS["section"]] = chunk.get("section_id", "")
+        metadata[_K_SECTION_ID] = metadata[_K_SECTION] = chunk["section_id"]
     if "claim_id" in chunk:
-        metadata[METADATA_KEYS["claim_id"]] = chunk["claim_id"]
+        metadata[_K_CLAIM_ID] = chunk["claim_id"]
     if "chunk_index" in chunk:
-        metadata[METADATA_KEYS["position_index"]] = chunk["chunk_index"]
-    if "timestamp" in chunk.get("metadata", {}):
-        metadata[METADATA_KEYS["timestamp"]] = chunk["metadata"]["timestamp"]
+        metadata[_K_POSITION_INDEX] = chunk["chunk_index"]
+    timestamp = (chunk.get("metadata") or {}).get("timestamp")
+    if timestamp is not None:
+        metadata[_K_TIMESTAMP] = timestamp
     
     return metadata
 
@@ -151,18 +150,18 @@ def create_summary_metadata(summary_data: Dict[str, Any]) -> Dict[str, Any]:
         Dict[str, Any]: Metadata dictionary for ChromaDB
     """
     metadata = {
-        METADATA_KEYS["chunk_id"]: summary_data.get("summary_id", ""),
-        METADATA_KEYS["summary_level"]: summary_data.get("summary_level", ""),
-        METADATA_KEYS["chunk_text"]: summary_data.get("summary_text", ""),
+        _K_CHUNK_ID: summary_data.get("summary_id", ""),
+        _K_SUMMARY_LEVEL: summary_data.get("summary_level", ""),
+        _K_CHUNK_TEXT: summary_data.get("summary_text", ""),
     }
     
     # Add optional fields if present
     if "section_id" in summary_data:
-        metadata[METADATA_KEYS["section_id"]] = summary_data["section_id"]
+        metadata[_K_SECTION_ID] = summary_data["section_id"]
     if "document_id" in summary_data:
-        metadata[METADATA_KEYS["document_id"]] = summary_data["document_id"]
+        metadata[_K_DOCUMENT_ID] = summary_data["document_id"]
     if "claim_id" in summary_data:
-        metadata[METADATA_KEYS["claim_id"]] = summary_data["claim_id"]
+        metadata[_K_CLAIM_ID] = summary_data["claim_id"]
     
     return metadata
 
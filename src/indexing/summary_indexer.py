@@ -15,14 +15,13 @@ MapReduce Strategy:
 Extends BaseIndexer and implements the template method steps.
 """
 
-from typing import List, Dict, Any
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
-import chromadb
-from chromadb.config import Settings
-from llama_index.embeddings.openai import OpenAIEmbedding
-from llama_index.llms.openai import OpenAI
-from llama_index.core import Document as LlamaIndexDocument
-from src.indexing.base_indexer import BaseIndexer
+from src.indexing.base_indexer import BaseIndexer, _get_encoding, get_chroma_client
 from src.indexing.index_schema import (
     create_summary_metadata,
     validate_summary_metadata,
@@ -31,9 +30,52 @@ from src.indexing.index_schema import (
 from src.config.constants import SUMMARY_COLLECTION_NAME
 from src.config.settings import config
 from src.utils.exceptions import IndexingError
+from src.utils.embeddings import create_embedding_model
+from src.utils.http_client import get_http_client
 from src.utils.logger import logger
 
 
+# Prompt templates, built once. The chunk instructions go in a fixed system
+# message so every Map-phase request starts with the same prefix.
+_CHUNK_SUMMARY_SYSTEM_PROMPT = """Summarize the following text chunk from an insurance claim document.
+Focus on key facts, dates, amounts, and events."""
+
+_CHUNK_SUMMARY_USER_PROMPT = """Text chunk:
+{chunk_text}
+
+Summary (at most {max_words} words):"""
+
+_SECTION_SUMMARY_PROMPT = """Create a comprehensive summary for the following section of an insurance claim document.
+Combine the individual chunk summaries into a coherent section overview.
+Include a timeline of events, key entities, and important details.
+
+Section: {section_header}
+
+Chunk summaries:
+{combined_chunk_summaries}
+
+Section summary (at most {max_words} words):"""
+
+_DOCUMENT_SUMMARY_PROMPT = """Create a comprehensive document-level summary for this insurance claim.
+Combine all section summaries into a high-level overview.
+
+Claim ID: {claim_id}
+Time Period: {first_date} to {last_date}
+
+Section summaries:
+{combined_section_summaries}
+
+Document summary (include overall timeline, major events, key entities, total costs, and claim status; at most {max_words} words):"""
+
+# Floors for the per-summary word limits derived from SUMMARY_TARGET_WORDS
+_MIN_CHUNK_SUMMARY_WORDS = 30
+_MIN_SECTION_SUMMARY_WORDS = 60
+# Context tokens kept free for the reduce prompt's instructions and the answer
+_REDUCE_RESERVED_TOKENS = 4096
+# Max rounds of group summarization when a reduce input is too long
+_MAX_COLLAPSE_ROUNDS = 3
+
+
 class SummaryIndexer(BaseIndexer):
     """
     Indexer for summary index using MapReduce strategy.
@@ -82,42 +124,36 @@ class SummaryIndexer(BaseIndexer):
         try:
             self.logger.info("Initializing summary index")
             
-            # Initialize ChromaDB client with persistence
-            self.persist_directory.mkdir(parents=True, exist_ok=True)
+            # Initialize ChromaDB client with persistence (shared per directory)
+            self.chroma_client = get_chroma_client(self.persist_directory)
             
-            self.chroma_client = chromadb.PersistentClient(
-                path=str(self.persist_directory),
-                settings=Settings(
-                    anonymized_telemetry=False,
-                    allow_reset=True
-                )
-            )
+            # Heavy client libraries are imported here, not at module scope, so
+            # processes that only probe the index directories never load them
+            from llama_index.core.llms import ChatMessage
+            from llama_index.llms.openai import OpenAI
             
-            # Initialize embedding model (OpenAI)
-            self.embedding_function = OpenAIEmbedding(
-                model_name=config.EMBEDDING_MODEL,
-                api_key=config.OPENAI_API_KEY
-            )
+            # Initialize embedding model (configured backend)
+            self.embedding_function = create_embedding_model()
             
             # Initialize LLM for summarization
             self.llm = OpenAI(
                 model=config.LLM_MODEL,
-                api_key=config.OPENAI_API_KEY
+                api_key=config.OPENAI_API_KEY,
+                http_client=get_http_client(),
+            )
+            # Map-phase messages share one fixed system message
+            self._chunk_system_message = ChatMessage(
+                role="system", content=_CHUNK_SUMMARY_SYSTEM_PROMPT
             )
             
             # Create or get collection
-            try:
-                self.collection = self.chroma_client.get_collection(
-                    name=self.collection_name
-                )
-                self.logger.info(f"Loaded existing collection '{self.collection_name}'")
-            except Exception:
-                # Collection doesn't exist, create it
-                self.collection = self.chroma_client.create_collection(
-                    name=self.collection_name,
-                    metadata={"description": "Summary index with chunk, section, and document summaries"}
-                )
-                self.logger.info(f"Created new collection '{self.collection_name}'")
+            self.collection = self.chroma_client.get_or_create_collection(
+                name=self.collection_name,
+                metadata={"description": "Summary index with chunk, section, and document summaries"}
+            )
+            self.logger.info(
+                f"Using collection '{self.collection_name}' ({self.collection.count()} items)"
+            )
             
             self.logger.info("Summary index initialized successfully")
         
@@ -151,25 +187,35 @@ class SummaryIndexer(BaseIndexer):
             chunks = hierarchical_structure.get("chunks", {})
             sections = hierarchical_structure.get("sections", [])
             
-            # MAP PHASE: Generate chunk-level summaries
+            # MAP PHASE + REDUCE PHASE 1: Generate chunk-level summaries, and each
+            # section's summary as soon as all of its chunks are summarized
             self.logger.info("Map Phase: Generating chunk-level summaries")
-            chunk_summaries = {}
+            self.logger.info("Reduce Phase 1: Generating section-level summaries as sections complete")
             
             # Process small chunks for summarization (they have the finest granularity)
             small_chunks = chunks.get("small", [])
-            for chunk in small_chunks:
+            
+            # Length budgets: k chunk summaries of s/k words and section summaries
+            # of s/sqrt(k) words keep every reduce input near the document target s
+            target_words = config.SUMMARY_TARGET_WORDS
+            k = max(1, len(small_chunks))
+            chunk_words = max(_MIN_CHUNK_SUMMARY_WORDS, target_words // k)
+            section_words = max(_MIN_SECTION_SUMMARY_WORDS, int(target_words / math.sqrt(k)))
+            
+            # One event loop for every async LLM call: the LLM's async client
+            # keeps a connection pool bound to the loop it first ran on
+            chunk_texts, section_texts, combined_section_summaries = asyncio.run(
+                self._summarize_async(small_chunks, sections, chunk_words, section_words)
+            )
+            
+            chunk_summaries = {}
+            for chunk, chunk_summary in zip(small_chunks, chunk_texts):
                 chunk_id = chunk.get("chunk_id", "")
-                chunk_text = chunk.get("text", "")
-                section_id = chunk.get("section_id", "")
-                
-                # Generate summary for chunk
-                chunk_summary = self._generate_chunk_summary(chunk_text)
-                
                 chunk_summaries[chunk_id] = {
                     "summary_id": f"summary_{chunk_id}",
                     "summary_level": "chunk",
                     "summary_text": chunk_summary,
-                    "section_id": section_id,
+                    "section_id": chunk.get("section_id", ""),
                     "document_id": chunk.get("document_id", ""),
                     "claim_id": chunk.get("claim_id", ""),
                     "original_chunk_id": chunk_id,
@@ -180,33 +226,8 @@ class SummaryIndexer(BaseIndexer):
             # Add chunk summaries to results
             summaries.extend(chunk_summaries.values())
             
-            # REDUCE PHASE 1: Generate section-level summaries
-            self.logger.info("Reduce Phase 1: Generating section-level summaries")
             section_summaries = {}
-            
-            for section in sections:
-                section_id = section.get("section_id", "")
-                
-                # Get all chunk summaries for this section
-                section_chunk_summaries = [
-                    cs for cs in chunk_summaries.values()
-                    if cs.get("section_id") == section_id
-                ]
-                
-                if not section_chunk_summaries:
-                    continue
-                
-                # Combine chunk summaries
-                combined_chunk_summaries = "\n\n".join(
-                    [cs["summary_text"] for cs in section_chunk_summaries]
-                )
-                
-                # Generate section-level summary
-                section_summary = self._generate_section_summary(
-                    combined_chunk_summaries,
-                    section.get("header", "")
-                )
-                
+            for section_id, section_summary in section_texts.items():
                 section_summaries[section_id] = {
                     "summary_id": f"summary_section_{section_id}",
                     "summary_level": "section",
@@ -225,15 +246,12 @@ class SummaryIndexer(BaseIndexer):
             self.logger.info("Reduce Phase 2: Generating document-level summary")
             
             if section_summaries:
-                # Combine all section summaries
-                combined_section_summaries = "\n\n".join(
-                    [ss["summary_text"] for ss in section_summaries.values()]
-                )
-                
-                # Generate document-level summary
+                # Generate document-level summary from the combined section
+                # summaries (merged in groups by _summarize_async if too long)
                 document_summary = self._generate_document_summary(
                     combined_section_summaries,
-                    hierarchical_structure.get("metadata", {})
+                    hierarchical_structure.get("metadata", {}),
+                    target_words,
                 )
                 
                 doc_summary = {
@@ -255,87 +273,266 @@ class SummaryIndexer(BaseIndexer):
             self.logger.error(error_msg)
             raise IndexingError(error_msg) from e
     
-    def _generate_chunk_summary(self, chunk_text: str) -> str:
+    async def _summarize_async(
+        self,
+        small_chunks: List[Dict[str, Any]],
+        sections: List[Dict[str, Any]],
+        chunk_words: int,
+        section_words: int,
+    ) -> Tuple[List[str], Dict[str, str], Optional[str]]:
+        """
+        Run the async Map and Reduce steps in a single event loop.
+        
+        Summarizes chunks and sections (see _summarize_chunks_and_sections),
+        then combines the section summaries into the document-level reduce
+        input, merging them in groups first if too long. All steps share one
+        semaphore, so at most config.LLM_CONCURRENCY LLM calls are in flight.
+        
+        Args:
+            small_chunks: Chunks to summarize
+            sections: Section dictionaries (section_id, header)
+            chunk_words: Word limit for each chunk summary
+            section_words: Word limit for each section summary
+        
+        Returns:
+            Tuple[List[str], Dict[str, str], Optional[str]]: Chunk summaries,
+                section summaries by section_id, and the combined document
+                reduce input (None if there are no section summaries)
+        """
+        semaphore = asyncio.Semaphore(max(1, config.LLM_CONCURRENCY))
+        chunk_texts, section_texts = await self._summarize_chunks_and_sections(
+            small_chunks, sections, chunk_words, section_words, semaphore
+        )
+        
+        combined_section_summaries: Optional[str] = None
+        if section_texts:
+            combined_section_summaries = await self._fit_reduce_input(
+                list(section_texts.values()), "Document overview", section_words, semaphore
+            )
+        return chunk_texts, section_texts, combined_section_summaries
+    
+    async def _summarize_chunks_and_sections(
+        self,
+        small_chunks: List[Dict[str, Any]],
+        sections: List[Dict[str, Any]],
+        chunk_words: int,
+        section_words: int,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Summarize chunks and sections, starting each section as soon as it can.
+        
+        Every chunk summary runs as its own task; when the last chunk of a
+        section finishes, that section's summary is scheduled immediately
+        instead of waiting for the whole Map phase. Chunks shorter than
+        config.MIN_SUMMARIZE_CHARS are their own summary (no LLM call). The
+        semaphore bounds the LLM calls in flight.
+        
+        Args:
+            small_chunks: Chunks to summarize
+            sections: Section dictionaries (section_id, header)
+            chunk_words: Word limit for each chunk summary
+            section_words: Word limit for each section summary
+            semaphore: Limits the LLM calls in flight (see LLM_CONCURRENCY)
+        
+        Returns:
+            Tuple[List[str], Dict[str, str]]: Chunk summaries in chunk order,
+                and section summaries by section_id in section order (only
+                sections that have chunks)
+        """
+        headers: Dict[str, str] = {}
+        for section in sections:
+            headers[section.get("section_id", "")] = section.get("header", "")
+        members: Dict[str, List[int]] = {}
+        for i, chunk in enumerate(small_chunks):
+            section_id = chunk.get("section_id", "")
+            if section_id in headers:
+                members.setdefault(section_id, []).append(i)
+        
+        section_ids = [section_id for section_id in headers if section_id in members]
+        remaining = {section_id: len(members[section_id]) for section_id in section_ids}
+        chunk_texts: List[str] = [""] * len(small_chunks)
+        section_texts: Dict[str, str] = dict.fromkeys(section_ids, "")
+        
+        async with asyncio.TaskGroup() as tasks:
+            async def summarize_section(section_id: str) -> None:
+                combined = await self._fit_reduce_input(
+                    [chunk_texts[i] for i in members[section_id]],
+                    headers[section_id],
+                    section_words,
+                    semaphore,
+                )
+                async with semaphore:
+                    section_texts[section_id] = await self._generate_section_summary(
+                        combined, headers[section_id], section_words
+                    )
+            
+            async def summarize_chunk(i: int) -> None:
+                chunk_text = small_chunks[i].get("text", "")
+                stripped = chunk_text.strip()
+                if len(stripped) < config.MIN_SUMMARIZE_CHARS:
+                    # Too short to be worth an LLM call; the text is its own summary
+                    chunk_texts[i] = stripped
+                else:
+                    async with semaphore:
+                        chunk_texts[i] = await self._generate_chunk_summary(
+                            chunk_text, chunk_words
+                        )
+                section_id = small_chunks[i].get("section_id", "")
+                if section_id in remaining:
+                    remaining[section_id] -= 1
+                    if not remaining[section_id]:
+                        tasks.create_task(summarize_section(section_id))
+            
+            for i in range(len(small_chunks)):
+                tasks.create_task(summarize_chunk(i))
+        
+        return chunk_texts, section_texts
+    
+    async def _fit_reduce_input(
+        self,
+        texts: List[str],
+        header: str,
+        max_words: int,
+        semaphore: asyncio.Semaphore,
+    ) -> str:
+        """
+        Join summaries for a reduce step, merging them in groups first if too long.
+        
+        If the joined text would not fit config.LLM_CONTEXT_TOKENS (less room
+        for the prompt and the answer), consecutive summaries are packed into
+        groups that fit and each group is summarized with the section prompt.
+        This repeats, as a hierarchical merge, until the input fits. Each group
+        call takes the shared semaphore, so merges count against
+        config.LLM_CONCURRENCY like every other LLM call (the caller must not
+        hold it).
+        
+        Args:
+            texts: Summaries to combine, in order
+            header: Header used in the group-summary prompts
+            max_words: Word limit for each group summary
+            semaphore: Limits the LLM calls in flight (see LLM_CONCURRENCY)
+        
+        Returns:
+            str: Combined text for the reduce prompt
+        """
+        encoding = _get_encoding()
+        budget = config.LLM_CONTEXT_TOKENS - _REDUCE_RESERVED_TOKENS
+        
+        for _ in range(_MAX_COLLAPSE_ROUNDS):
+            counts = [len(encoding.encode_ordinary(text)) for text in texts]
+            if len(texts) <= 1 or sum(counts) <= budget:
+                break
+            
+            groups: List[List[str]] = [[]]
+            group_tokens = 0
+            for text, count in zip(texts, counts):
+                if groups[-1] and group_tokens + count > budget:
+                    groups.append([])
+                    group_tokens = 0
+                groups[-1].append(text)
+                group_tokens += count
+            
+            self.logger.info(
+                "Reduce input for '%s' exceeds %d tokens; merging %d summaries in %d groups",
+                header, budget, len(texts), len(groups),
+            )
+            
+            async def merge_group(group: List[str]) -> str:
+                async with semaphore:
+                    return await self._generate_section_summary(
+                        "\n\n".join(group), header, max_words
+                    )
+            
+            texts = await asyncio.gather(*(merge_group(group) for group in groups))
+        
+        return "\n\n".join(texts)
+    
+    async def _generate_chunk_summary(self, chunk_text: str, max_words: int) -> str:
         """
         Generate a summary for a single chunk (Map phase).
         
         Args:
             chunk_text: Text content of the chunk
+            max_words: Word limit for the summary
         
         Returns:
             str: Summary of the chunk
         """
-        prompt = f"""Summarize the following text chunk from an insurance claim document.
-Focus on key facts, dates, amounts, and events.
-
-Text chunk:
-{chunk_text}
-
-Summary:"""
+        from llama_index.core.llms import ChatMessage
+        
+        messages = [
+            self._chunk_system_message,
+            ChatMessage(
+                role="user",
+                content=_CHUNK_SUMMARY_USER_PROMPT.format(
+                    chunk_text=chunk_text, max_words=max_words
+                ),
+            ),
+        ]
         
         try:
-            response = self.llm.complete(prompt)
-            return response.text.strip()
+            response = await self.llm.achat(messages)
+            return (response.message.content or "").strip()
         except Exception as e:
             self.logger.warning(f"Error generating chunk summary: {str(e)}")
             # Return truncated version as fallback
             return chunk_text[:200] + "..." if len(chunk_text) > 200 else chunk_text
     
-    def _generate_section_summary(self, combined_chunk_summaries: str, section_header: str) -> str:
+    async def _generate_section_summary(
+        self,
+        combined_chunk_summaries: str,
+        section_header: str,
+        max_words: int,
+    ) -> str:
         """
         Generate a summary for a section from chunk summaries (Reduce phase 1).
         
         Args:
             combined_chunk_summaries: Combined summaries of all chunks in the section
             section_header: Header/title of the section
+            max_words: Word limit for the summary
         
         Returns:
             str: Summary of the section
         """
-        prompt = f"""Create a comprehensive summary for the following section of an insurance claim document.
-Combine the individual chunk summaries into a coherent section overview.
-Include a timeline of events, key entities, and important details.
-
-Section: {section_header}
-
-Chunk summaries:
-{combined_chunk_summaries}
-
-Section summary:"""
+        prompt = _SECTION_SUMMARY_PROMPT.format(
+            section_header=section_header,
+            combined_chunk_summaries=combined_chunk_summaries,
+            max_words=max_words,
+        )
         
         try:
-            response = self.llm.complete(prompt)
+            response = await self.llm.acomplete(prompt)
             return response.text.strip()
         except Exception as e:
             self.logger.warning(f"Error generating section summary: {str(e)}")
             return combined_chunk_summaries[:500] + "..." if len(combined_chunk_summaries) > 500 else combined_chunk_summaries
     
-    def _generate_document_summary(self, combined_section_summaries: str, metadata: Dict[str, Any]) -> str:
+    def _generate_document_summary(
+        self,
+        combined_section_summaries: str,
+        metadata: Dict[str, Any],
+        max_words: int,
+    ) -> str:
         """
         Generate a document-level summary from section summaries (Reduce phase 2).
         
         Args:
             combined_section_summaries: Combined summaries of all sections
             metadata: Document metadata (claim_id, timestamps, etc.)
+            max_words: Word limit for the summary
         
         Returns:
             str: Document-level summary
         """
-        claim_id = metadata.get("claim_id", "Unknown")
-        timestamps = metadata.get("timestamps", [])
-        first_date = metadata.get("first_timestamp", "")
-        last_date = metadata.get("last_timestamp", "")
-        
-        prompt = f"""Create a comprehensive document-level summary for this insurance claim.
-Combine all section summaries into a high-level overview.
-
-Claim ID: {claim_id}
-Time Period: {first_date} to {last_date}
-
-Section summaries:
-{combined_section_summaries}
-
-Document summary (include overall timeline, major events, key entities, total costs, and claim status):"""
+        prompt = _DOCUMENT_SUMMARY_PROMPT.format(
+            claim_id=metadata.get("claim_id", "Unknown"),
+            first_date=metadata.get("first_timestamp", ""),
+            last_date=metadata.get("last_timestamp", ""),
+            combined_section_summaries=combined_section_summaries,
+            max_words=max_words,
+        )
         
         try:
             response = self.llm.complete(prompt)
@@ -344,53 +541,17 @@ Document summary (include overall timeline, major events, key entities, total co
             self.logger.warning(f"Error generating document summary: {str(e)}")
             return combined_section_summaries[:1000] + "..." if len(combined_section_summaries) > 1000 else combined_section_summaries
     
-    def store_in_index(self, summaries: List[Dict[str, Any]]):
+    def to_record(self, summary: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
         """
-        Store summaries in the ChromaDB summary index.
+        Convert a summary dictionary into an (id, text, metadata) record.
         
         Args:
-            summaries: List of summary dictionaries
+            summary: Summary dictionary from prepare_data()
         
-        Raises:
-            IndexingError: If storage fails
+        Returns:
+            Tuple[str, str, Dict[str, Any]]: Summary ID, summary text and metadata
         """
-        try:
-            if not summaries:
-                self.logger.warning("No summaries to store in summary index")
-                return
-            
-            self.logger.info(f"Storing {len(summaries)} summaries in summary index")
-            
-            # Extract texts, ids, and metadata
-            texts = [summary["summary_text"] for summary in summaries]
-            ids = [summary["summary_id"] for summary in summaries]
-            metadatas = [create_summary_metadata(summary) for summary in summaries]
-            
-            # Generate embeddings
-            self.logger.info("Generating embeddings for summaries")
-            embeddings = []
-            
-            batch_size = 100
-            for i in range(0, len(texts), batch_size):
-                batch_texts = texts[i:i + batch_size]
-                batch_embeddings = self.embedding_function.get_text_embedding_batch(batch_texts)
-                embeddings.extend(batch_embeddings)
-                self.logger.debug(f"Generated embeddings for summary batch {i//batch_size + 1}")
-            
-            # Store in ChromaDB
-            self.collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                metadatas=metadatas,
-                documents=texts
-            )
-            
-            self.logger.info(f"Successfully stored {len(summaries)} summaries in summary index")
-        
-        except Exception as e:
-            error_msg = f"Error storing summaries in summary index: {str(e)}"
-            self.logger.error(error_msg)
-            raise IndexingError(error_msg) from e
+        return summary["summary_id"], summary["summary_text"], create_summary_metadata(summary)
     
     def get_collection(self):
         """
@@ -1,10 +1,27 @@
 import re
 import warnings
 from datetime import datetime
+from functools import lru_cache
 from dateutil import parser
 from typing import Union
 
 
+# Common date patterns, tried in order before fuzzy parsing (compiled once),
+# each with the strptime format of the text it matches
+_DATE_PATTERNS = [
+    (re.compile(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}'), '%Y-%m-%d %H:%M:%S'),
+    (re.compile(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}'), '%Y-%m-%d %H:%M'),
+    (re.compile(r'\d{4}-\d{2}-\d{2}'), '%Y-%m-%d'),
+    (re.compile(r'\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}'), '%m/%d/%Y %H:%M:%S'),
+    (re.compile(r'\d{2}/\d{2}/\d{4}'), '%m/%d/%Y'),
+]
+
+# Abbreviations that cause timezone warnings in dateutil:
+# ETA (Estimated Time of Arrival), FNOL (First Notice of Loss),
+# GP (General Practitioner or other insurance term)
+_ABBREV_RE = re.compile(r'\b(?:ETA|FNOL|GP)\b', re.IGNORECASE)
+
+
 def get_date_diff(date1: Union[str, datetime], date2: Union[str, datetime]) -> str:
     """
     MCP tool: Calculate absolute time difference between two dates/times.
@@ -51,18 +68,7 @@ def _preprocess_date_string(text: str) -> str:
     Returns:
         Preprocessed date string
     """
-    # Common abbreviations that cause timezone warnings
-    problematic_abbreviations = [
-        r'\bETA\b',      # Estimated Time of Arrival
-        r'\bFNOL\b',     # First Notice of Loss
-        r'\bGP\b',       # General Practitioner or other insurance term
-    ]
-    
-    preprocessed = text
-    for pattern in problematic_abbreviations:
-        preprocessed = re.sub(pattern, ' ', preprocessed, flags=re.IGNORECASE)
-    
-    return preprocessed
+    return _ABBREV_RE.sub(' ', text)
 
 
 def _normalize_datetime(value: Union[str, datetime]) -> datetime:
@@ -76,21 +82,31 @@ def _normalize_datetime(value: Union[str, datetime]) -> datetime:
     if not isinstance(value, str):
         raise TypeError(f"Unsupported type: {type(value)}")
 
+    return _parse_date_string(value)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_string(value: str) -> datetime:
+    """
+    Parse a date/time string into a datetime object.
+
+    Parsing is deterministic, and agents often repeat the same date strings
+    across tool calls, so results are memoized (datetimes are immutable).
+    """
+
     # Try common date patterns first (no fuzzy needed)
-    patterns = [
-        r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}',  # YYYY-MM-DD HH:MM:SS
-        r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}',         # YYYY-MM-DD HH:MM
-        r'\d{4}-\d{2}-\d{2}',                       # YYYY-MM-DD
-        r'\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}',   # MM/DD/YYYY HH:MM:SS
-        r'\d{2}/\d{2}/\d{4}',                       # MM/DD/YYYY
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, value)
+    for pattern, date_format in _DATE_PATTERNS:
+        match = pattern.search(value)
         if match:
+            # The format is known, so try strptime before the much slower dateutil
+            matched = ' '.join(match.group().split())
+            try:
+                return datetime.strptime(matched, date_format)
+            except ValueError:
+                pass
             try:
                 # Parse matched pattern directly (no fuzzy needed)
-                return parser.parse(match.group(), fuzzy=False)
+                return parser.parse(matched, fuzzy=False)
             except (ValueError, parser.ParserError):
                 continue
     
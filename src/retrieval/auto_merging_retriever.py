@@ -10,11 +10,18 @@ This module implements AutoMergingRetriever which:
 This is used by HierarchicalRetriever to provide broader context when needed.
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
 from llama_index.embeddings.openai import OpenAIEmbedding
 from src.utils.logger import logger
 
 
+def _score_of(result: Dict[str, Any]) -> float:
+    """Sort key: a result's relevance score."""
+    return result.get("score", 0.0)
+
+
 class AutoMergingRetriever:
     """
     Handles automatic merging of adjacent chunks for broader context.
@@ -68,96 +75,84 @@ class AutoMergingRetriever:
         if not chunks:
             return []
 
-        # Group chunks by section_id
-        sections: Dict[str, List[Dict[str, Any]]] = {}
+        # Read each chunk's section and position once up front instead of on
+        # every comparison
+        section_ids: List[str] = []
+        entries: List[Tuple[int, Dict[str, Any]]] = []
         for chunk in chunks:
-            section_id = chunk.get("metadata", {}).get("section_id", "unknown")
-            sections.setdefault(section_id, []).append(chunk)
+            metadata = chunk.get("metadata") or {}
+            section_ids.append(metadata.get("section_id", "unknown"))
+            entries.append((metadata.get("position_index", 0), chunk))
+
+        # Group chunks by section_id; the common case of a single section
+        # needs no grouping at all
+        if section_ids.count(section_ids[0]) == len(section_ids):
+            section_groups = [entries]
+        else:
+            sections: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+            for section_id, entry in zip(section_ids, entries):
+                sections.setdefault(section_id, []).append(entry)
+            section_groups = list(sections.values())
 
         merged_results: List[Dict[str, Any]] = []
 
         # Process each section independently
-        for section_id, section_chunks in sections.items():
+        for section_entries in section_groups:
             # Sort chunks by position_index within the section
-            section_chunks.sort(
-                key=lambda c: c.get("metadata", {}).get("position_index", 0)
-            )
+            section_entries.sort(key=itemgetter(0))
 
             # Merge adjacent chunks in this section (structure-based, ignore score threshold)
-            merged_section_chunks = self._merge_adjacent_in_section(section_chunks)
-            merged_results.extend(merged_section_chunks)
+            merged_results.extend(self._merge_adjacent_in_section(section_entries))
 
-        # Sort merged results by score (descending)
-        merged_results.sort(key=lambda x: x.get("score", 0.0), reverse=True)
-
-        # Limit to max_results if specified
+        # Sort merged results by score (descending), keeping only the top
+        # max_results if specified (a partial heap selection, same order)
         if max_results:
-            merged_results = merged_results[:max_results]
+            merged_results = heapq.nlargest(max_results, merged_results, key=_score_of)
+        else:
+            merged_results.sort(key=_score_of, reverse=True)
 
         self.logger.debug(
-            f"Merged {len(chunks)} chunks into {len(merged_results)} merged results"
+            "Merged %d chunks into %d merged results", len(chunks), len(merged_results)
         )
         return merged_results
 
     def _merge_adjacent_in_section(
         self,
-        chunks: List[Dict[str, Any]],
+        entries: List[Tuple[int, Dict[str, Any]]],
     ) -> List[Dict[str, Any]]:
         """
         Merge adjacent chunks within a single section.
 
         Args:
-            chunks: Chunks from the same section, sorted by position_index
+            entries: (position_index, chunk) pairs from the same section,
+                sorted by position_index
 
         Returns:
             List[Dict[str, Any]]: Merged chunks
         """
-        if not chunks:
-            return []
-
         merged: List[Dict[str, Any]] = []
-        i = 0
-
-        while i < len(chunks):
-            current_chunk = chunks[i]
-
-            # Always try to merge with adjacent chunks from the same section,
-            # based purely on structural adjacency (ignore score thresholds).
-            merged_chunks = [current_chunk]
-            current_pos = current_chunk.get("metadata", {}).get("position_index", 0)
-            total_score = current_chunk.get("score", 0.0)
-            j = i + 1
-
-            # Look for adjacent chunks to merge
-            while j < len(chunks):
-                next_chunk = chunks[j]
-                next_pos = next_chunk.get("metadata", {}).get("position_index", 0)
-                next_score = next_chunk.get("score", 0.0)
-
-                # Check if chunks are adjacent (position difference <= 1)
-                # and from same section
-                if (
-                    next_pos - current_pos <= 1
-                    and next_chunk.get("metadata", {}).get("section_id")
-                    == current_chunk.get("metadata", {}).get("section_id")
-                ):
-                    merged_chunks.append(next_chunk)
-                    total_score += next_score
-                    current_pos = next_pos
-                    j += 1
-                else:
-                    break
-
-            # Create merged result if we merged more than one chunk
-            if len(merged_chunks) > 1:
-                merged_result = self._create_merged_chunk(merged_chunks, total_score)
-                merged.append(merged_result)
-            else:
-                merged.append(current_chunk)
-
-            i = j
+        run: List[Dict[str, Any]] = []
+        previous_pos = 0
+
+        # Structural adjacency only (position difference <= 1); scores are ignored
+        for pos, chunk in entries:
+            if run and pos - previous_pos > 1:
+                merged.append(self._finish_run(run))
+                run = []
+            run.append(chunk)
+            previous_pos = pos
+        if run:
+            merged.append(self._finish_run(run))
 
         return merged
+
+    def _finish_run(self, run: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Return a run's single chunk as-is, or the merged chunk for longer runs."""
+        if len(run) == 1:
+            return run[0]
+        return self._create_merged_chunk(
+            run, sum(chunk.get("score", 0.0) for chunk in run)
+        )
     
     def _create_merged_chunk(
         self,
@@ -167,31 +162,33 @@ class AutoMergingRetriever:
         """
         Create a single merged chunk from multiple chunks.
         
+        The merged chunk shares the first chunk's metadata dictionary.
+        
         Args:
-            chunks: List of chunks to merge
+            chunks: Non-empty list of chunks to merge
             total_score: Sum of scores from all chunks
         
         Returns:
             Dict[str, Any]: Merged chunk dictionary
         """
-        # Use metadata from first chunk
-        first_metadata = chunks[0].get("metadata", {}).copy()
-        
-        # Combine text from all chunks
-        combined_text = "\n\n".join(
-            chunk.get("text", "") for chunk in chunks if chunk.get("text")
-        )
-        
-        # Average score
-        avg_score = total_score / len(chunks) if chunks else 0.0
+        # Collect texts and ids in a single pass
+        texts: List[str] = []
+        ids: List[str] = []
+        for chunk in chunks:
+            text = chunk.get("text")
+            if text:
+                texts.append(text)
+            ids.append(chunk.get("id", ""))
         
         return {
-            "id": chunks[0].get("id", ""),
-            "text": combined_text,
-            "metadata": first_metadata,
-            "score": avg_score,
+            "id": ids[0],
+            "text": "\n\n".join(texts),
+            # The first chunk's metadata is shared, not copied; treat it as read-only
+            "metadata": chunks[0].get("metadata", {}),
+            # Average score
+            "score": total_score / len(chunks),
             "merged": True,
             "merged_count": len(chunks),
-            "merged_ids": [chunk.get("id", "") for chunk in chunks],
+            "merged_ids": ids,
         }
 
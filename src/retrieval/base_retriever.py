@@ -9,11 +9,56 @@ Uses Dependency Inversion: High-level modules (agents) depend on abstractions
 (RetrieverInterface) rather than concrete implementations.
 """
 
+import asyncio
+import threading
+from array import array
+import unicodedata
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+from src.config.settings import config
+from src.utils.embeddings import create_embedding_model
 from src.utils.logger import logger
 
 
+# LRU of query embeddings keyed by (embedding model, query), shared by all retrievers.
+# Embeddings are stored as packed float32 arrays (4 bytes per value rather than
+# a boxed Python float each), so the cache holds ~8x more queries per byte.
+_query_embeddings: "OrderedDict[Tuple[str, str], array]" = OrderedDict()
+_query_embeddings_lock = threading.Lock()
+
+# Embedding clients keyed by (backend, embedding model, API key), shared by all retrievers
+_embedding_models: Dict[Tuple[str, str, str], Any] = {}
+_embedding_models_lock = threading.Lock()
+
+
+def _canonicalize_query(query: str) -> str:
+    """Canonical form of a query for embedding: NFKC, lowercased, single-spaced."""
+    return " ".join(unicodedata.normalize("NFKC", query).lower().split())
+
+
+def get_embedding_model(model_name: str) -> Any:
+    """
+    Get the process-wide embedding client for a model, creating it on first use.
+    
+    Retrievers over different collections share one embedding client per
+    model instead of each constructing (and warming up) their own.
+    
+    Args:
+        model_name: Embedding model name
+    
+    Returns:
+        BaseEmbedding: Shared embedding client for config.EMBEDDING_BACKEND
+    """
+    key = (config.EMBEDDING_BACKEND, model_name, config.OPENAI_API_KEY)
+    with _embedding_models_lock:
+        embedding_model = _embedding_models.get(key)
+        if embedding_model is None:
+            embedding_model = create_embedding_model(model_name)
+            _embedding_models[key] = embedding_model
+    return embedding_model
+
+
 class RetrieverInterface(ABC):
     """
     Abstract interface for all retrievers (Dependency Inversion Principle).
@@ -72,6 +117,34 @@ class RetrieverInterface(ABC):
         """
         pass
     
+    async def retrieve_async(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run retrieve() in a worker thread so concurrent queries overlap.
+        
+        Each retrieval mostly waits on the embedding API and ChromaDB, so
+        several queries awaited together (e.g. with asyncio.gather) overlap
+        those waits instead of running back to back.
+        
+        Args:
+            query: Search query string
+            top_k: Number of results to return (None = use default)
+            filters: Optional metadata filters
+            **kwargs: Retriever-specific options passed through to retrieve()
+        
+        Returns:
+            List[Dict[str, Any]]: Same results as retrieve()
+        
+        Raises:
+            RetrievalError: If retrieval fails
+        """
+        return await asyncio.to_thread(self.retrieve, query, top_k, filters, **kwargs)
+    
     def validate_query(self, query: str) -> bool:
         """
         Validate that a query is acceptable for retrieval.
@@ -88,6 +161,42 @@ class RetrieverInterface(ABC):
             return False
         return True
     
+    def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a query, reusing the embedding of an equivalent earlier query.
+        
+        The query is canonicalized first (Unicode NFKC, lowercase, collapsed
+        whitespace), so queries differing only in case or spacing share one
+        embedding. Query embeddings are deterministic per model, and eval
+        loops, agent retries and rerank pipelines repeat queries, so up to
+        config.QUERY_EMBEDDING_CACHE_SIZE embeddings are kept in a process-wide
+        LRU cache and cache hits skip the embedding API round-trip.
+        Requires the retriever to set embedding_fn and embedding_model.
+        
+        Args:
+            query: Query string to embed
+        
+        Returns:
+            List[float]: Query embedding
+        """
+        query = _canonicalize_query(query)
+        key = (self.embedding_model, query)
+        with _query_embeddings_lock:
+            cached = _query_embeddings.get(key)
+            if cached is not None:
+                _query_embeddings.move_to_end(key)
+                return cached.tolist()
+        
+        # Misses return the packed values too, so a query embeds identically
+        # whether or not it was cached (Chroma compares in float32 anyway)
+        embedding = array("f", self.embedding_fn.get_query_embedding(query))
+        with _query_embeddings_lock:
+            _query_embeddings[key] = embedding
+            _query_embeddings.move_to_end(key)
+            while len(_query_embeddings) > max(0, config.QUERY_EMBEDDING_CACHE_SIZE):
+                _query_embeddings.popitem(last=False)
+        return embedding.tolist()
+    
     def format_results(
         self,
         results: List[Dict[str, Any]],
@@ -103,15 +212,22 @@ class RetrieverInterface(ABC):
         Returns:
             List[Dict[str, Any]]: Formatted results with consistent structure
         """
-        formatted = []
-        for result in results:
-            formatted_result = {
+        if include_metadata:
+            return [
+                {
+                    "text": result.get("text", result.get("chunk_text", "")),
+                    "score": result.get("score", 0.0),
+                    "id": result.get("id", ""),
+                    "metadata": result.get("metadata", {}),
+                }
+                for result in results
+            ]
+        return [
+            {
                 "text": result.get("text", result.get("chunk_text", "")),
                 "score": result.get("score", 0.0),
                 "id": result.get("id", ""),
             }
-            if include_metadata:
-                formatted_result["metadata"] = result.get("metadata", {})
-            formatted.append(formatted_result)
-        return formatted
+            for result in results
+        ]
 
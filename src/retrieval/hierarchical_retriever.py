@@ -11,10 +11,12 @@ This module implements HierarchicalRetriever which:
 Implements RetrieverInterface and uses AutoMergingRetriever for merging logic.
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
 import re
-from llama_index.embeddings.openai import OpenAIEmbedding
-from src.retrieval.base_retriever import RetrieverInterface
+from src.retrieval.base_retriever import RetrieverInterface, get_embedding_model
 from src.retrieval.auto_merging_retriever import AutoMergingRetriever
 from src.config.settings import config
 from src.config.constants import IndexType, ChunkSize
@@ -22,6 +24,33 @@ from src.utils.exceptions import RetrievalError
 from src.utils.logger import logger
 
 
+# Query patterns used by the rerankers (compiled once)
+# HH:MM or HH:MM:SS (single or double digit hour)
+_TIME_RE = re.compile(r"\b\d{1,2}:\d{2}(?::\d{2})?\b")
+# Simple "DD Month YYYY" pattern (e.g. 03 March 2025)
+_DATE_RE = re.compile(r"\b\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\b")
+# e.g. "section 3", "Section 16"
+_SECTION_RE = re.compile(r"\bsection\s+(\d+)\b", re.IGNORECASE)
+
+# Shared stand-in for a missing metadata dict (read-only)
+_EMPTY_METADATA: Dict[str, Any] = {}
+
+
+@lru_cache(maxsize=128)
+def _time_tokens_of(query: str) -> Tuple[str, ...]:
+    """Distinct time/date tokens in a query, memoized since queries repeat."""
+    times = _TIME_RE.findall(query)
+    dates = _DATE_RE.findall(query)
+    return tuple({t.strip() for t in (times + dates) if t.strip()})
+
+
+@lru_cache(maxsize=128)
+def _section_ids_of(query: str) -> Tuple[str, ...]:
+    """Distinct section ids referenced by a query (in order), memoized."""
+    # dict.fromkeys deduplicates while preserving order
+    return tuple(dict.fromkeys(f"section_{m}" for m in _SECTION_RE.findall(query)))
+
+
 class HierarchicalRetriever(RetrieverInterface):
     """
     Retriever for querying the Hierarchical Index with auto-merging support.
@@ -67,16 +96,17 @@ class HierarchicalRetriever(RetrieverInterface):
         self.embedding_model = embedding_model or config.EMBEDDING_MODEL
         self.enable_auto_merge = enable_auto_merge
         self.logger = logger
+        # Set once the collection is seen non-empty; until then retrieve()
+        # checks the count so an empty index skips embedding and the query
+        self._collection_has_data = False
         
         # Initialize embedding function
         try:
-            self.embedding_fn = OpenAIEmbedding(
-                model_name=self.embedding_model,
-                api_key=config.OPENAI_API_KEY,
-            )
+            self.embedding_fn = get_embedding_model(self.embedding_model)
             self.logger.info(
-                f"HierarchicalRetriever initialized with model: {self.embedding_model}, "
-                f"auto_merge: {enable_auto_merge}"
+                "HierarchicalRetriever initialized with model: %s, auto_merge: %s",
+                self.embedding_model,
+                enable_auto_merge,
             )
         except Exception as e:
             error_msg = f"Failed to initialize embedding model: {str(e)}"
@@ -128,68 +158,100 @@ class HierarchicalRetriever(RetrieverInterface):
         if not self.validate_query(query):
             raise RetrievalError("Invalid query: query must be a non-empty string")
         
+        # Fast path: queries with nothing to search for cannot match anything,
+        # so skip the embedding call and the query
+        if len(query.strip()) < 2 or not any(c.isalnum() for c in query):
+            self.logger.debug("Trivial query; skipping hierarchical retrieval")
+            return []
+        
         top_k = top_k or config.TOP_K_RESULTS
         
         try:
             self.logger.debug(
-                f"Retrieving hierarchical chunks for query: '{query[:50]}...' "
-                f"(top_k={top_k}, start_level={start_level})"
+                "Retrieving hierarchical chunks for query: '%s...' (top_k=%d, start_level=%s)",
+                query[:50],
+                top_k,
+                start_level,
             )
             
-            # Prepare filters: start with small chunks by default
+            # Likewise for an empty index
+            if not self._collection_has_data:
+                if self.collection.count() == 0:
+                    self.logger.debug("Hierarchical collection is empty; skipping retrieval")
+                    return []
+                self._collection_has_data = True
+            
+            # Prepare filters: start with small chunks by default. A plain level
+            # match is applied in Python after the query rather than as a Chroma
+            # `where` clause, whose SQLite metadata join is far slower than the
+            # vector search itself; the candidate pool is widened to compensate.
             query_filters = filters.copy() if filters else {}
-            if "level" not in query_filters:
-                query_filters["level"] = start_level
+            level = query_filters.get("level", start_level)
+            if isinstance(level, str):
+                query_filters.pop("level", None)
+            else:
+                level = None
             
             # Generate query embedding
-            query_embedding = self.embedding_fn.get_query_embedding(query)
+            query_embedding = self.embed_query(query)
+            
+            # Rerank tokens are extracted once up front: a rerank is only applied
+            # (and worth a wider candidate pool) when the query contains some
+            time_tokens = self._extract_time_tokens(query) if use_time_rerank else []
+            section_ids = self._extract_section_ids(query) if use_section_rerank else []
             
             # Decide how many candidates to fetch BEFORE reranking/merging.
-            # When we plan to rerank (time/section), we want a wider candidate pool.
-            if use_time_rerank or use_section_rerank:
+            # When we will rerank (time/section), we want a wider candidate pool.
+            if time_tokens or section_ids:
                 candidate_multiplier = 4
             else:
                 candidate_multiplier = 2
             n_candidates = top_k * candidate_multiplier
-            print(f"n_candidates: {n_candidates}")
+            if level is not None:
+                n_candidates *= len(ChunkSize)
+            self.logger.debug("n_candidates=%d", n_candidates)
             
             # Query ChromaDB collection
             results = self.collection.query(
                 query_embeddings=[query_embedding],
                 n_results=n_candidates,
-                where=query_filters,
+                where=query_filters or None,
                 include=["metadatas", "documents", "distances"],
             )
             
-            # Format initial results
+            # Format initial results, keeping only chunks at the requested level.
+            # Chroma returns parallel columns; rows are built in one zipped pass.
             formatted_results = []
             if results and results.get("ids") and len(results["ids"][0]) > 0:
-                for i in range(len(results["ids"][0])):
-                    result = {
-                        "id": results["ids"][0][i],
-                        "text": results["documents"][0][i] if results.get("documents") else "",
-                        "metadata": results["metadatas"][0][i] if results.get("metadatas") else {},
-                        "score": 1.0 - results["distances"][0][i] if results.get("distances") else 0.0,
+                ids = results["ids"][0]
+                documents = results["documents"][0] if results.get("documents") else [""] * len(ids)
+                metadatas = results["metadatas"][0] if results.get("metadatas") else [{}] * len(ids)
+                if results.get("distances"):
+                    scores = [1.0 - distance for distance in results["distances"][0]]
+                else:
+                    scores = [0.0] * len(ids)
+                check_level = level is not None and bool(results.get("metadatas"))
+                formatted_results = [
+                    {
+                        "id": chunk_id,
+                        "text": document,
+                        "metadata": metadata,
+                        "score": score,
                         "merged": False,
                     }
-                    formatted_results.append(result)
+                    for chunk_id, document, metadata, score in zip(ids, documents, metadatas, scores)
+                    if not check_level or (metadata or _EMPTY_METADATA).get("level") == level
+                ]
             
             # Optionally apply reranking based on time/section metadata
             # BEFORE auto-merging and final top_k truncation.
-            if use_time_rerank and formatted_results:
-                self.logger.debug("Applying time-aware reranking to hierarchical results")
-                formatted_results = self._rerank_by_time(
-                    query,
-                    formatted_results,
-                    top_k=None,
+            # Time and section boosts are applied together in one pass.
+            if (time_tokens or section_ids) and formatted_results:
+                self.logger.debug(
+                    "Applying time/section-aware reranking to hierarchical results"
                 )
-            
-            if use_section_rerank and formatted_results:
-                self.logger.debug("Applying section-aware reranking to hierarchical results")
-                formatted_results = self._rerank_by_section(
-                    query,
-                    formatted_results,
-                    top_k=None,
+                formatted_results = self._rerank_combined(
+                    formatted_results, time_tokens, section_ids, top_k=top_k
                 )
             
             # Limit to top_k results first, then apply auto-merging only on the
@@ -197,8 +259,16 @@ class HierarchicalRetriever(RetrieverInterface):
             # only the chunks that are actually going back to the caller.
             final_results = formatted_results[:top_k]
 
-            # Apply auto-merging if enabled
-            if self.enable_auto_merge and self.auto_merger and len(final_results) > 0:
+            # Apply auto-merging if enabled. Merging exists to widen fragmented
+            # small chunks, so results that are already medium/large skip it.
+            if (
+                self.enable_auto_merge
+                and self.auto_merger
+                and any(
+                    (res["metadata"] or _EMPTY_METADATA).get("level") == ChunkSize.SMALL.value
+                    for res in final_results
+                )
+            ):
                 self.logger.debug("Applying auto-merging to final hierarchical results")
                 final_results = self.auto_merger.merge_chunks(
                     final_results,
@@ -206,8 +276,9 @@ class HierarchicalRetriever(RetrieverInterface):
                 )
             
             self.logger.info(
-                f"Retrieved {len(final_results)} hierarchical chunks "
-                f"({'with' if self.enable_auto_merge else 'without'} auto-merging)"
+                "Retrieved %d hierarchical chunks (%s auto-merging)",
+                len(final_results),
+                "with" if self.enable_auto_merge else "without",
             )
             return self.format_results(final_results, include_metadata=True)
         
@@ -249,87 +320,7 @@ class HierarchicalRetriever(RetrieverInterface):
         - Times like 8:11:02, 08:18:41, 08:20:05, 8:20:31
         - Dates like 03 March 2025
         """
-        # HH:MM or HH:MM:SS (single or double digit hour)
-        time_pattern = r"\b\d{1,2}:\d{2}(?::\d{2})?\b"
-        # Simple "DD Month YYYY" pattern (e.g. 03 March 2025)
-        date_pattern = r"\b\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\b"
-
-        times = re.findall(time_pattern, query)
-        dates = re.findall(date_pattern, query)
-
-        tokens = list({t.strip() for t in (times + dates) if t.strip()})
-        return tokens
-
-    def _rerank_by_time(
-        self,
-        query: str,
-        results: List[Dict[str, Any]],
-        top_k: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        """
-        Rerank retrieval results by matching timestamps/dates between query and chunks.
-
-        This is useful for timeline-style queries where the user mentions specific
-        times/dates and we want chunks containing those exact values to be promoted.
-
-        Args:
-            query: Original user query
-            results: List of results from retrieve() (already formatted)
-            top_k: Number of results to keep after reranking (None = keep all)
-
-        Returns:
-            List[Dict[str, Any]]: Reranked results (same structure as input)
-        """
-        if not results:
-            return results
-
-        time_tokens = self._extract_time_tokens(query)
-        if not time_tokens:
-            # No explicit time/date patterns in query; return as-is
-            self.logger.debug(
-                "rerank_by_time: no time/date tokens found in query; skipping rerank"
-            )
-            return results[:top_k] if top_k else results
-
-        self.logger.debug(
-            f"rerank_by_time: found time/date tokens in query: {time_tokens}"
-        )
-
-        reranked: List[Dict[str, Any]] = []
-        for res in results:
-            text = res.get("text", "") or ""
-            meta = res.get("metadata", {}) or {}
-            chunk_text = meta.get("chunk_text", "")
-
-            combined = f"{text} {chunk_text}"
-
-            # Count how many of the explicit query time tokens appear in this chunk
-            match_count = sum(
-                1 for token in time_tokens if token in combined
-            )
-
-            base_score = res.get("score", 0.0)
-
-            # Strongly boost chunks that contain explicit time tokens from query.
-            # We add +1.0 per match so a chunk containing several of the
-            # specified times will dominate others.
-            adjusted_score = base_score + match_count * 1.0
-
-            new_res = dict(res)
-            new_res["time_match_count"] = match_count
-            new_res["time_reranked_score"] = adjusted_score
-            reranked.append(new_res)
-
-        # Sort by adjusted score (falling back to original score)
-        reranked.sort(
-            key=lambda r: r.get("time_reranked_score", r.get("score", 0.0)),
-            reverse=True,
-        )
-
-        if top_k:
-            reranked = reranked[:top_k]
-
-        return reranked
+        return list(_time_tokens_of(query))
 
     # ------------------------------------------------------------------
     # Section-aware reranking helpers
@@ -346,84 +337,78 @@ class HierarchicalRetriever(RetrieverInterface):
         - 'section_3'
         - 'section_16'
         """
-        # e.g. "section 3", "Section 16"
-        pattern = r"\bsection\s+(\d+)\b"
-        matches = re.findall(pattern, query, flags=re.IGNORECASE)
-        section_ids = [f"section_{m}" for m in matches]
-        # Deduplicate while preserving order
-        seen = set()
-        unique_section_ids: List[str] = []
-        for sid in section_ids:
-            if sid not in seen:
-                seen.add(sid)
-                unique_section_ids.append(sid)
-        return unique_section_ids
+        return list(_section_ids_of(query))
 
-    def _rerank_by_section(
+    def _rerank_combined(
         self,
-        query: str,
         results: List[Dict[str, Any]],
+        time_tokens: List[str],
+        section_ids: List[str],
         top_k: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Rerank retrieval results by matching section_id metadata with the query.
+        Apply time- and section-aware boosts in a single pass and sort once.
 
-        This is useful when the user explicitly mentions a section, e.g.:
-        - "In section 3, what happened at ...?"
-        - "According to Section 16 ..."
-
-        In that case, we want chunks whose metadata.section_id matches the referenced
-        section(s) to be promoted.
+        Each result gets +1.0 per occurrence of a query time/date token in its
+        text and +2.0 if its section_id is one of the referenced sections.
+        An empty token or section list disables that boost.
 
         Args:
-            query: Original user query
             results: List of results from retrieve() (already formatted)
+            time_tokens: Time/date tokens extracted from the query
+            section_ids: Section ids extracted from the query
             top_k: Number of results to keep after reranking (None = keep all)
 
         Returns:
-            List[Dict[str, Any]]: Reranked results (same structure as input)
+            List[Dict[str, Any]]: The input dicts, annotated in place and sorted
+                by their boosted score
         """
-        if not results:
-            return results
-
-        section_ids = self._extract_section_ids(query)
-        if not section_ids:
-            # No explicit section references; return as-is
-            self.logger.debug(
-                "rerank_by_section: no section ids found in query; skipping rerank"
+        # One alternation scans each chunk once for all tokens (longest first,
+        # so a full HH:MM:SS wins over its HH:MM prefix)
+        token_re = None
+        if time_tokens:
+            token_re = re.compile(
+                "|".join(re.escape(token) for token in sorted(time_tokens, key=len, reverse=True))
             )
-            return results[:top_k] if top_k else results
-
-        self.logger.debug(
-            f"rerank_by_section: found section ids in query: {section_ids}"
-        )
+        # Hashed once so each candidate's membership test is O(1)
+        section_set = frozenset(section_ids)
 
-        reranked: List[Dict[str, Any]] = []
         for res in results:
-            meta = res.get("metadata", {}) or {}
-            chunk_section_id = meta.get("section_id") or meta.get("section")
-
-            # Count matches across all referenced sections
-            match_count = 1 if chunk_section_id in section_ids else 0
-
             base_score = res.get("score", 0.0)
-
-            # Strongly boost chunks whose section_id matches the query reference.
-            # We add +2.0 if the chunk is from a referenced section.
-            adjusted_score = base_score + match_count * 2.0
-
-            new_res = dict(res)
-            new_res["section_match"] = bool(match_count)
-            new_res["section_reranked_score"] = adjusted_score
-            reranked.append(new_res)
-
-        # Sort by adjusted score (falling back to original score)
-        reranked.sort(
-            key=lambda r: r.get("section_reranked_score", r.get("score", 0.0)),
-            reverse=True,
-        )
-
+            adjusted_score = base_score
+            meta = res.get("metadata") or _EMPTY_METADATA
+
+            if token_re is not None:
+                # The document and metadata chunk_text hold the same chunk, so
+                # only one of them is scanned (scanning both double-counts)
+                text = res.get("text") or meta.get("chunk_text", "")
+
+                # Count every occurrence of the query time tokens in this chunk,
+                # so repeated mentions boost it further
+                match_count = len(token_re.findall(text))
+
+                # Strongly boost chunks that contain explicit time tokens from query.
+                # We add +1.0 per match so a chunk containing several of the
+                # specified times will dominate others.
+                res["time_match_count"] = match_count
+                res["time_reranked_score"] = base_score + match_count * 1.0
+                adjusted_score += match_count * 1.0
+
+            if section_ids:
+                chunk_section_id = meta.get("section_id") or meta.get("section")
+                section_match = chunk_section_id in section_set
+
+                # Strongly boost chunks whose section_id matches the query reference.
+                # We add +2.0 if the chunk is from a referenced section.
+                res["section_match"] = section_match
+                res["section_reranked_score"] = base_score + section_match * 2.0
+                adjusted_score += section_match * 2.0
+
+            res["reranked_score"] = adjusted_score
+
+        # Sort by combined adjusted score; when only the top_k are kept, a
+        # partial heap selection gives the same order without a full sort
         if top_k:
-            reranked = reranked[:top_k]
-
-        return reranked
\ No newline at end of file
+            return heapq.nlargest(top_k, results, key=itemgetter("reranked_score"))
+        results.sort(key=itemgetter("reranked_score"), reverse=True)
+        return results
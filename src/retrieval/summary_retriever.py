@@ -10,17 +10,30 @@ This module implements SummaryRetriever which:
 Implements RetrieverInterface for Dependency Inversion.
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
 import re
 
-from llama_index.embeddings.openai import OpenAIEmbedding
-from src.retrieval.base_retriever import RetrieverInterface
+from src.retrieval.base_retriever import RetrieverInterface, get_embedding_model
 from src.config.settings import config
 from src.config.constants import IndexType
 from src.utils.exceptions import RetrievalError
 from src.utils.logger import logger
 
 
+# e.g. "section 3", "Section 16" (compiled once)
+_SECTION_RE = re.compile(r"\bsection\s+(\d+)\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _section_ids_of(query: str) -> Tuple[str, ...]:
+    """Distinct section ids referenced by a query (in order), memoized."""
+    # dict.fromkeys deduplicates while preserving order
+    return tuple(dict.fromkeys(f"section_{m}" for m in _SECTION_RE.findall(query)))
+
+
 class SummaryRetriever(RetrieverInterface):
     """
     Retriever for querying the Summary Index.
@@ -63,10 +76,7 @@ class SummaryRetriever(RetrieverInterface):
         
         # Initialize embedding function
         try:
-            self.embedding_fn = OpenAIEmbedding(
-                model_name=self.embedding_model,
-                api_key=config.OPENAI_API_KEY,
-            )
+            self.embedding_fn = get_embedding_model(self.embedding_model)
             self.logger.info(f"SummaryRetriever initialized with model: {self.embedding_model}")
         except Exception as e:
             error_msg = f"Failed to initialize embedding model: {str(e)}"
@@ -110,72 +120,110 @@ class SummaryRetriever(RetrieverInterface):
             
             # If section reranking is enabled, check if query explicitly mentions a section.
             # If so, add it as a filter to narrow the search to that section only.
-            where_clause = filters.copy() if filters else {}
-            if use_section_rerank:
-                section_ids = self._extract_section_ids(query)
-                if section_ids and len(section_ids) == 1:
+            # The caller's filters are only copied when a section filter is added.
+            where_clause = filters or None
+            section_ids = self._extract_section_ids(query) if use_section_rerank else []
+            if section_ids:
+                if len(section_ids) == 1:
                     # User explicitly asked for ONE specific section - filter to that section
-                    where_clause["section_id"] = section_ids[0]
+                    where_clause = {**(filters or {}), "section_id": section_ids[0]}
                     self.logger.debug(
                         f"Filtering summaries to section_id={section_ids[0]} based on explicit query reference"
                     )
                     # Since we're filtering to one section, we don't need reranking anymore
                     # but we'll keep it enabled in case there are multiple summaries from that section
-                elif section_ids and len(section_ids) > 1:
+                else:
                     # Multiple sections mentioned - use OR logic or just rerank
                     # For simplicity, we'll just rerank (no filter)
                     self.logger.debug(
                         f"Multiple sections mentioned in query: {section_ids}; will rerank instead of filter"
                     )
             
-            # Generate query embedding
-            query_embedding = self.embedding_fn.get_query_embedding(query)
+            # Generate query embedding (cached across retrievers and calls)
+            query_embedding = self.embed_query(query)
             
             # Decide how many candidates to fetch BEFORE optional reranking.
             n_candidates = top_k
-            if use_section_rerank and not where_clause.get("section_id"):
+            if use_section_rerank and not (where_clause and where_clause.get("section_id")):
                 # Use a wider pool when we plan to rerank by section (but not when filtering)
                 n_candidates = top_k * 4
             
+            # Summary text is stored twice (as the document and as metadata
+            # chunk_text), so the wide rerank pool skips documents to roughly
+            # halve the response; rows take their text from chunk_text instead.
+            include = ["metadatas", "documents", "distances"]
+            if n_candidates > top_k:
+                include = ["metadatas", "distances"]
+            
             # Query ChromaDB collection
             results = self.collection.query(
                 query_embeddings=[query_embedding],
                 n_results=n_candidates,
-                where=where_clause if where_clause else None,
-                include=["metadatas", "documents", "distances"],
+                where=where_clause,
+                include=include,
             )
             
             # Format results
-            formatted_results: List[Dict[str, Any]] = []
-            if results and results.get("ids") and len(results["ids"][0]) > 0:
-                for i in range(len(results["ids"][0])):
-                    result = {
-                        "id": results["ids"][0][i],
-                        "text": results["documents"][0][i] if results.get("documents") else "",
-                        "metadata": results["metadatas"][0][i] if results.get("metadatas") else {},
-                        "score": 1.0 - results["distances"][0][i] if results.get("distances") else 0.0,
-                    }
-                    formatted_results.append(result)
+            formatted_results = self._format_query_results(results)
 
             # Optionally apply section-aware reranking similar to HierarchicalRetriever
-            if use_section_rerank and formatted_results:
+            # (only when the query references a section; otherwise it is a no-op)
+            if section_ids and formatted_results:
                 self.logger.debug("Applying section-aware reranking to summary results")
                 formatted_results = self._rerank_by_section(
                     query,
                     formatted_results,
                     top_k=None,
+                    section_ids=section_ids,
                 )
 
             final_results = formatted_results[:top_k]
             
+            # Rows are built in the output schema already; only reranked rows
+            # carry annotation keys that format_results strips
+            if section_ids:
+                final_results = self.format_results(final_results, include_metadata=True)
+            
             self.logger.info(f"Retrieved {len(final_results)} summaries for query")
-            return self.format_results(final_results, include_metadata=True)
+            return final_results
         
         except Exception as e:
             error_msg = f"Error retrieving summaries: {str(e)}"
             self.logger.error(error_msg)
             raise RetrievalError(error_msg) from e
     
+    def _format_query_results(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build result rows from a single-query ChromaDB query response.
+        
+        Rows are built directly in the format_results() output schema, from
+        Chroma's parallel columns in one zipped pass. When documents were not
+        included in the query, the text comes from metadata chunk_text.
+        
+        Args:
+            results: Response of collection.query()
+        
+        Returns:
+            List[Dict[str, Any]]: Rows with text, score, id and metadata
+        """
+        if not (results and results.get("ids") and len(results["ids"][0]) > 0):
+            return []
+        
+        ids = results["ids"][0]
+        metadatas = results["metadatas"][0] if results.get("metadatas") else [{}] * len(ids)
+        if results.get("documents"):
+            documents = results["documents"][0]
+        else:
+            documents = [(metadata or {}).get("chunk_text", "") for metadata in metadatas]
+        if results.get("distances"):
+            scores = [1.0 - distance for distance in results["distances"][0]]
+        else:
+            scores = [0.0] * len(ids)
+        return [
+            {"text": document, "score": score, "id": summary_id, "metadata": metadata}
+            for summary_id, document, metadata, score in zip(ids, documents, metadatas, scores)
+        ]
+    
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get metadata about this retriever.
@@ -211,35 +259,27 @@ class SummaryRetriever(RetrieverInterface):
         - 'section_3'
         - 'section_16'
         """
-        pattern = r"\bsection\s+(\d+)\b"
-        matches = re.findall(pattern, query, flags=re.IGNORECASE)
-        section_ids = [f"section_{m}" for m in matches]
-
-        # Deduplicate while preserving order
-        seen = set()
-        unique_section_ids: List[str] = []
-        for sid in section_ids:
-            if sid not in seen:
-                seen.add(sid)
-                unique_section_ids.append(sid)
-        return unique_section_ids
+        return list(_section_ids_of(query))
 
     def _rerank_by_section(
         self,
         query: str,
         results: List[Dict[str, Any]],
         top_k: Optional[int] = None,
+        section_ids: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Rerank summary results by matching section_id metadata with the query.
 
         This mirrors the section-aware reranking used in HierarchicalRetriever,
-        but operates on summary-level results.
+        but operates on summary-level results. Section ids already extracted
+        from the query can be passed in to avoid parsing it again.
         """
         if not results:
             return results
 
-        section_ids = self._extract_section_ids(query)
+        if section_ids is None:
+            section_ids = self._extract_section_ids(query)
         if not section_ids:
             self.logger.debug(
                 "SummaryRetriever._rerank_by_section: no section ids in query; skipping rerank"
@@ -250,29 +290,24 @@ class SummaryRetriever(RetrieverInterface):
             f"SummaryRetriever._rerank_by_section: found section ids in query: {section_ids}"
         )
 
-        reranked: List[Dict[str, Any]] = []
+        # Hashed once so each candidate's membership test is O(1)
+        section_set = frozenset(section_ids)
+
         for res in results:
             meta = res.get("metadata", {}) or {}
             chunk_section_id = meta.get("section_id") or meta.get("section")
 
-            match_count = 1 if chunk_section_id in section_ids else 0
+            match_count = 1 if chunk_section_id in section_set else 0
             base_score = res.get("score", 0.0)
 
             # Boost summaries whose section_id matches the query reference.
-            adjusted_score = base_score + match_count * 2.0
-
-            new_res = dict(res)
-            new_res["section_match"] = bool(match_count)
-            new_res["section_reranked_score"] = adjusted_score
-            reranked.append(new_res)
-
-        reranked.sort(
-            key=lambda r: r.get("section_reranked_score", r.get("score", 0.0)),
-            reverse=True,
-        )
+            # The result dicts are annotated in place rather than copied.
+            res["section_match"] = bool(match_count)
+            res["section_reranked_score"] = base_score + match_count * 2.0
 
+        # Sort by adjusted score; a partial heap selection when only top_k are kept
         if top_k:
-            reranked = reranked[:top_k]
-
-        return reranked
+            return heapq.nlargest(top_k, results, key=itemgetter("section_reranked_score"))
+        results.sort(key=itemgetter("section_reranked_score"), reverse=True)
+        return results
 
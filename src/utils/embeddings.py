@@ -0,0 +1,60 @@
+"""
+Embedding model factory shared by the indexers and the retrievers.
+
+The index and the queries against it must be embedded by the same model,
+so both sides construct their embedding client here, from the configured
+EMBEDDING_BACKEND and EMBEDDING_MODEL:
+- "openai": OpenAI embedding API (default)
+- "huggingface": local sentence-transformers model (e.g. BAAI/bge-small-en-v1.5),
+  which removes the API round-trip; requires llama-index-embeddings-huggingface
+"""
+
+from typing import Any, Optional
+
+from src.config.settings import config
+from src.utils.exceptions import ConfigurationError
+from src.utils.http_client import get_http_client
+
+
+EMBEDDING_BACKENDS = ("openai", "huggingface")
+
+
+def create_embedding_model(model_name: Optional[str] = None) -> Any:
+    """
+    Create an embedding client for the configured backend.
+
+    Args:
+        model_name: Embedding model name (defaults to config.EMBEDDING_MODEL)
+
+    Returns:
+        BaseEmbedding: LlamaIndex embedding model (OpenAIEmbedding or
+            HuggingFaceEmbedding)
+
+    Raises:
+        ConfigurationError: If the backend is unknown or its package is not installed
+    """
+    model_name = model_name or config.EMBEDDING_MODEL
+    backend = config.EMBEDDING_BACKEND
+
+    if backend == "openai":
+        from llama_index.embeddings.openai import OpenAIEmbedding
+
+        return OpenAIEmbedding(
+            model_name=model_name,
+            api_key=config.OPENAI_API_KEY,
+            http_client=get_http_client(),
+        )
+
+    if backend == "huggingface":
+        try:
+            from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+        except ImportError as e:
+            raise ConfigurationError(
+                "EMBEDDING_BACKEND=huggingface requires the "
+                "llama-index-embeddings-huggingface package"
+            ) from e
+        return HuggingFaceEmbedding(model_name=model_name)
+
+    raise ConfigurationError(
+        f"Unknown EMBEDDING_BACKEND '{backend}'; expected one of {EMBEDDING_BACKENDS}"
+    )
@@ -9,47 +9,46 @@ This module contains common utility functions used throughout the application:
 """
 
 import re
-import warnings
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from dateutil import parser as date_parser
 
 
-def _preprocess_text_for_parsing(text: str) -> str:
-    """
-    Preprocess text to remove common abbreviations that cause timezone warnings.
-    
-    Removes insurance/document-specific abbreviations that dateutil might
-    misinterpret as timezone names (e.g., ETA, FNOL, GP).
-    
-    Args:
-        text: Text to preprocess
-        
-    Returns:
-        Preprocessed text with problematic abbreviations removed
-    """
-    # Common abbreviations that cause timezone warnings
-    # These are insurance/document terms, not timezones
-    problematic_abbreviations = [
-        r'\bETA\b',      # Estimated Time of Arrival
-        r'\bFNOL\b',     # First Notice of Loss
-        r'\bGP\b',       # General Practitioner or other insurance term
-    ]
-    
-    preprocessed = text
-    for pattern in problematic_abbreviations:
-        # Replace with space to maintain word boundaries
-        preprocessed = re.sub(pattern, ' ', preprocessed, flags=re.IGNORECASE)
-    
-    return preprocessed
+# Regex patterns are compiled once at import instead of on every call
+
+# Timestamp candidates, as one alternation so a single scan finds them all.
+# Within each form the longer variants come first. ISO forms are parsed with
+# the C-level datetime.fromisoformat; the others with dateutil, non-fuzzy.
+_MONTH_NAME = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?'
+_TIMESTAMP_RE = re.compile(
+    r'(?P<iso>\d{4}-\d{2}-\d{2}(?:\s+\d{2}:\d{2}(?::\d{2})?)?)'      # YYYY-MM-DD[ HH:MM[:SS]]
+    r'|(?P<other>'
+    r'\d{2}/\d{2}/\d{4}(?:\s+\d{2}:\d{2}(?::\d{2})?)?'               # MM/DD/YYYY[ HH:MM[:SS]]
+    r'|\d{2}-\d{2}-\d{4}(?:\s+\d{2}:\d{2}:\d{2})?'                   # DD-MM-YYYY[ HH:MM:SS]
+    r'|\b\d{1,2}\s+' + _MONTH_NAME + r'\s+\d{4}(?:\s+\d{1,2}:\d{2}(?::\d{2})?)?'   # 03 March 2025[ 08:11[:02]]
+    r'|\b' + _MONTH_NAME + r'\s+\d{1,2},?\s+\d{4}(?:\s+\d{1,2}:\d{2}(?::\d{2})?)?'  # March 3, 2025[ 08:11[:02]]
+    r')',
+    re.IGNORECASE,
+)
+
+# Entity patterns used by extract_entities, fused into one regex with a named
+# group per entity type so a single scan finds all of them
+_ENTITY_RE = re.compile(
+    r'(?P<money>\$\d+(?:\.\d{2})?)'
+    r'|(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<phone>\b\d{3}[-.]?\d{3}[-.]?\d{4}\b)'  # US format
+)
 
 
 def parse_timestamp(text: str) -> Optional[datetime]:
     """
     Parse a timestamp from text.
     
-    Attempts to extract and parse various timestamp formats from text.
-    Uses dateutil.parser for flexible date/time parsing.
+    Finds the first recognizable date/timestamp in the text (ISO, numeric
+    MM/DD/YYYY and DD-MM-YYYY, or textual "03 March 2025" / "March 3, 2025",
+    each optionally followed by a time) and parses it. Text without such a
+    candidate yields None; there is no fuzzy whole-text parse, which turned
+    stray numbers into dates.
     
     Args:
         text: Text containing a timestamp
@@ -61,36 +60,17 @@ def parse_timestamp(text: str) -> Optional[datetime]:
         >>> parse_timestamp("Event occurred on 2024-12-10 at 14:30:00")
         datetime.datetime(2024, 12, 10, 14, 30, 0)
     """
-    # Try to find common timestamp patterns first (more specific, no fuzzy needed)
-    patterns = [
-        r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}',  # YYYY-MM-DD HH:MM:SS
-        r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}',         # YYYY-MM-DD HH:MM
-        r'\d{4}-\d{2}-\d{2}',                       # YYYY-MM-DD
-        r'\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}',   # MM/DD/YYYY HH:MM:SS
-        r'\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}',         # MM/DD/YYYY HH:MM
-        r'\d{2}/\d{2}/\d{4}',                       # MM/DD/YYYY
-        r'\d{2}-\d{2}-\d{4}\s+\d{2}:\d{2}:\d{2}',   # DD-MM-YYYY HH:MM:SS
-        r'\d{2}-\d{2}-\d{4}',                       # DD-MM-YYYY
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            try:
-                # Parse the matched pattern directly (no fuzzy needed for clean patterns)
-                return date_parser.parse(match.group(), fuzzy=False)
-            except (ValueError, date_parser.ParserError):
-                continue
-    
-    # Only use fuzzy parsing as last resort, and preprocess to avoid warnings
-    preprocessed_text = _preprocess_text_for_parsing(text)
-    try:
-        # Suppress warnings during fuzzy parsing since we've preprocessed
-        with warnings.catch_warnings():
-            warnings.filterwarnings('ignore', category=UserWarning, module='dateutil')
-            return date_parser.parse(preprocessed_text, fuzzy=True)
-    except (ValueError, date_parser.ParserError):
-        return None
+    for match in _TIMESTAMP_RE.finditer(text):
+        try:
+            if match.lastgroup == 'iso':
+                # Normalize the date/time separator for fromisoformat
+                return datetime.fromisoformat(' '.join(match.group().split()))
+            # Parse the matched candidate directly (no fuzzy needed for clean patterns)
+            return date_parser.parse(match.group(), fuzzy=False)
+        except (ValueError, OverflowError):
+            # Invalid date (e.g. month 13); try the next candidate
+            continue
+    return None
 
 
 def extract_entities(text: str, entity_types: List[str] = None) -> Dict[str, List[str]]:
@@ -116,21 +96,12 @@ def extract_entities(text: str, entity_types: List[str] = None) -> Dict[str, Lis
     
     entities = {entity_type: [] for entity_type in entity_types}
     
-    # Simple pattern matching (can be enhanced with regex or NLP models)
-    # Money pattern
-    if 'money' in entity_types:
-        money_pattern = r'\$\d+(?:\.\d{2})?'
-        entities['money'] = re.findall(money_pattern, text)
-    
-    # Email pattern
-    if 'email' in entity_types:
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        entities['email'] = re.findall(email_pattern, text)
-    
-    # Phone pattern (US format)
-    if 'phone' in entity_types:
-        phone_pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-        entities['phone'] = re.findall(phone_pattern, text)
+    # Simple pattern matching (can be enhanced with regex or NLP models):
+    # money, email and phone (US format), routed by the matching group
+    for match in _ENTITY_RE.finditer(text):
+        bucket = entities.get(match.lastgroup)
+        if bucket is not None:
+            bucket.append(match.group())
     
     return entities
 
@@ -154,10 +125,9 @@ def normalize_text(text: str) -> str:
         >>> normalize_text("  Hello   world  \\n\\n")
         "Hello world"
     """
-    # Remove extra whitespace and normalize line breaks
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'\n\s*\n', '\n', text)
-    return text.strip()
+    # Collapse every whitespace run (line breaks included) to a single space
+    # and trim, in one C-level split/join pass
+    return ' '.join(text.split())
 
 
 def calculate_overlap_tokens(text1: str, text2: str, tokenizer) -> int:
@@ -172,9 +142,10 @@ def calculate_overlap_tokens(text1: str, text2: str, tokenizer) -> int:
     Returns:
         int: Number of overlapping tokens
     """
+    # Only one side needs hashing into a set; intersection() probes it
+    # directly with the other token list
     tokens1 = set(tokenizer.encode(text1))
-    tokens2 = set(tokenizer.encode(text2))
-    return len(tokens1.intersection(tokens2))
+    return len(tokens1.intersection(tokenizer.encode(text2)))
 
 
 def validate_chunk_size(text: str, min_tokens: int, max_tokens: int, tokenizer) -> bool:
@@ -0,0 +1,46 @@
+"""
+Shared HTTP connection pool for OpenAI API clients.
+
+Agents, retrievers and the judge each construct their own OpenAI client
+wrappers. Passing them one process-wide httpx.Client lets every request
+reuse pooled keep-alive connections instead of opening (and TLS
+handshaking) a new connection per client, which matters once queries run
+concurrently.
+"""
+
+import threading
+from typing import Optional
+
+import httpx
+
+from src.config.settings import config
+
+
+_client: Optional[httpx.Client] = None
+_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get the process-wide pooled HTTP client, creating it on first use.
+    
+    The pool size is controlled by HTTP_MAX_CONNECTIONS from config.
+    httpx.Client is thread-safe, so the same instance is shared by all
+    worker threads.
+    
+    Returns:
+        httpx.Client: Shared HTTP client
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                max_connections = max(1, config.HTTP_MAX_CONNECTIONS)
+                _client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_connections,
+                    ),
+                    timeout=httpx.Timeout(60.0, connect=10.0),
+                )
+    return _client
@@ -3,10 +3,15 @@ Centralized logging configuration.
 
 This module sets up application-wide logging with both file and console handlers.
 Logs are formatted consistently and saved to a log file for debugging and auditing.
+The handlers run on a background listener thread, so logging calls on the
+retrieval path only enqueue records instead of writing to stdout and disk.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from src.config.settings import config
 
@@ -20,6 +25,9 @@ def setup_logger(name: str = "InsuranceClaimSystem", level: str = None) -> loggi
     - File handler (writes to app.log)
     - Consistent formatting with timestamps, log level, and messages
     
+    Both handlers are driven by a QueueListener thread; the logger itself
+    only has a QueueHandler, so callers never block on handler I/O.
+    
     Args:
         name: Name of the logger (default: "InsuranceClaimSystem")
         level: Logging level (default: from config, or INFO)
@@ -56,7 +64,6 @@ def setup_logger(name: str = "InsuranceClaimSystem", level: str = None) -> loggi
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
     
     # File handler (writes to log file)
     # Ensure log directory exists
@@ -65,7 +72,16 @@ def setup_logger(name: str = "InsuranceClaimSystem", level: str = None) -> loggi
     file_handler = logging.FileHandler(config.LOG_FILE, encoding='utf-8')
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
+    
+    # Records are queued by the caller and written by the listener thread;
+    # stopping the listener at exit flushes whatever is still queued
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
     
     return logger
 
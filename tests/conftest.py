@@ -3,13 +3,27 @@ Pytest configuration and shared fixtures for tests.
 """
 
 import pytest
-from typing import Generator, Tuple
+from filelock import FileLock
+from typing import Any, Dict, Generator, Tuple
 from logging import Logger
 
-from src.helpers.agent_helper import init
+from src.config.settings import config
+from src.evaluation import JudgeEvaluator
+from src.helpers.agent_helper import init, run_queries
 from src.agents.orchestrator_system import OrchestratorSystem
 
 
+# tryfirst: the markers must be on the items before -m deselects by them
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items) -> None:
+    """Mark parametrized cases whose EvalCase has smoke=True with pytest.mark.smoke."""
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        test_case = callspec.params.get("test_case") if callspec else None
+        if getattr(test_case, "smoke", False):
+            item.add_marker(pytest.mark.smoke)
+
+
 @pytest.fixture(scope="session")
 def _initialized_system() -> Generator[Tuple[Logger, OrchestratorSystem], None, None]:
     """
@@ -17,8 +31,13 @@ def _initialized_system() -> Generator[Tuple[Logger, OrchestratorSystem], None,
     
     This ensures init() is only called once, and both logger and orchestrator
     fixtures can reuse the same initialization.
+    
+    Under pytest-xdist every worker runs this fixture; the file lock lets the
+    first worker build the indices while the others wait, after which they
+    find the indices up to date and only open them.
     """
-    log, orchestrator_instance = init()
+    with FileLock(str(config.INDICES_DIR / ".init.lock")):
+        log, orchestrator_instance = init()
     yield log, orchestrator_instance
 
 
@@ -52,3 +71,39 @@ def orchestrator(_initialized_system) -> Generator[OrchestratorSystem, None, Non
     _, orchestrator_instance = _initialized_system
     yield orchestrator_instance
 
+
+@pytest.fixture(scope="session")
+def judge() -> JudgeEvaluator:
+    """
+    Pytest fixture that provides the LLM judge shared by all LLM-based tests.
+    
+    Session-scoped, so the judge and its LLM clients are created once per
+    session (per worker under xdist) rather than once per test case.
+    
+    Usage:
+        def test_something(orchestrator, logger, judge, test_case):
+            assert_llm_based_query(orchestrator, test_case, 0.8, logger, evaluator=judge)
+    """
+    return JudgeEvaluator()
+
+
+@pytest.fixture(scope="module")
+def agent_responses(request, orchestrator, logger) -> Dict[str, Dict[str, Any]]:
+    """
+    Pytest fixture that pre-runs the module's selected test queries concurrently.
+    
+    Module-scoped, so each test module (one xdist worker under loadscope) runs
+    its own cases' agent calls in parallel up front instead of one per test.
+    Returns verbose responses by query; queries that failed are left out, so
+    their tests run them again.
+    
+    Usage:
+        def test_something(orchestrator, agent_responses, test_case):
+            response = agent_responses.get(test_case.query)
+    """
+    queries = []
+    for item in request.session.items:
+        callspec = getattr(item, "callspec", None)
+        if item.module is request.module and callspec and "test_case" in callspec.params:
+            queries.append(callspec.params["test_case"].query)
+    return run_queries(orchestrator, queries, logger)
@@ -0,0 +1,40 @@
+"""Unit tests for HierarchicalRetriever time/section reranking."""
+
+from src.retrieval.hierarchical_retriever import HierarchicalRetriever
+
+
+def _rerank(results, time_tokens, section_ids=()):
+    # _rerank_combined uses no instance state, so no collection is needed
+    retriever = HierarchicalRetriever.__new__(HierarchicalRetriever)
+    return retriever._rerank_combined(results, list(time_tokens), list(section_ids))
+
+
+def _row(text, score=0.5, section_id="section_1"):
+    # Hierarchical rows carry the chunk both as the document and as metadata chunk_text
+    return {
+        "text": text,
+        "score": score,
+        "id": text,
+        "metadata": {"chunk_text": text, "section_id": section_id},
+    }
+
+
+def test_single_time_mention_counts_once():
+    """A chunk mentioning the queried time once gets a single +1.0 boost."""
+    (result,) = _rerank([_row("Impact recorded at 08:18:41 on the junction camera.")], ["08:18:41"])
+    assert result["time_match_count"] == 1
+    assert result["time_reranked_score"] == 1.5
+
+
+def test_repeated_time_mentions_count_each_occurrence():
+    """Each occurrence of a queried time in the chunk adds to the boost."""
+    (result,) = _rerank([_row("At 08:18:41 the light changed; by 08:18:41 both cars had stopped.")], ["08:18:41"])
+    assert result["time_match_count"] == 2
+
+
+def test_section_boost_outranks_single_time_mention():
+    """A +2.0 section match ranks above a chunk with one time mention."""
+    time_row = _row("Logged at 08:18:41.", section_id="section_2")
+    section_row = _row("No times here.", section_id="section_3")
+    ranked = _rerank([time_row, section_row], ["08:18:41"], ["section_3"])
+    assert ranked[0] is section_row
@@ -1,6 +1,6 @@
 from src.evaluation.eval_case import EvalCase
 
-TEST_CASES = [
+TEST_CASES = (
     EvalCase(
         query="What is the color of the insured vehicle? please answer only the color name!",
         expected_answer="Alpine White"
@@ -93,5 +93,10 @@ TEST_CASES = [
         query="How many free rooms where in the hospital? please answer only the amountor 'Not found in the provided context'!",
         expected_answer="Not found in the provided context."
     ),
-]
+)
 
+# Parametrize ids (queries truncated to 50 characters), built once at import
+TEST_IDS = tuple(
+    case.query[:50] + "..." if len(case.query) > 50 else case.query
+    for case in TEST_CASES
+)
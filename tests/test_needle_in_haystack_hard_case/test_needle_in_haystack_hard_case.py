@@ -2,11 +2,11 @@
 
 import pytest
 from src.evaluation.eval_case import EvalCase
-from tests.test_needle_in_haystack_hard_case.data import TEST_CASES
+from tests.test_needle_in_haystack_hard_case.data import TEST_CASES, TEST_IDS
 from src.helpers.agent_helper import assert_hard_query
 
 
-@pytest.mark.parametrize("test_case", TEST_CASES, ids=lambda tc: tc.query[:50] + "..." if len(tc.query) > 50 else tc.query)
+@pytest.mark.parametrize("test_case", TEST_CASES, ids=TEST_IDS)
 def test_needle_in_haystack_hard_case(orchestrator, logger, test_case: EvalCase):
     """Test hard cases for NeedleInHaystackAgent.
     
@@ -1,7 +1,12 @@
 from src.evaluation.eval_case import EvalCase
 
 
-TEST_CASES = [
+# Expected-context phrases also used by the summarization cases
+CTX_JUNCTION = "collision occurred at the signal-controlled junction of Euston Road and Judd Street"
+CTX_TOTAL_EXPOSURE = "Total claim exposure amounted to £22,625.20"
+
+
+TEST_CASES = (
     # From eval_cases.py - Precise factual query - Registration number
     EvalCase(
         query="What is the exact registration number of the insured vehicle?",
@@ -11,6 +16,7 @@ TEST_CASES = [
         ],
         category="needle",
         description="Exact value retrieval - registration number",
+        smoke=True,
     ),
     
     # From eval_cases.py - Precise factual query - Amount
@@ -18,10 +24,11 @@ TEST_CASES = [
         query="What was the total claim exposure amount?",
         expected_answer="£22,625.20",
         expected_context=[
-            "Total claim exposure amounted to £22,625.20",
+            CTX_TOTAL_EXPOSURE,
         ],
         category="needle",
         description="Exact value retrieval - monetary amount",
+        smoke=True,
     ),
     
     # From eval_cases.py - Precise factual query - Policy excess
@@ -96,10 +103,11 @@ TEST_CASES = [
         query="At which junction did the collision occur?",
         expected_answer="The collision occurred at the signal-controlled junction of Euston Road and Judd Street, London NW1.",
         expected_context=[
-            "collision occurred at the signal-controlled junction of Euston Road and Judd Street",
+            CTX_JUNCTION,
         ],
         category="needle",
         description="Collision location retrieval",
+        smoke=True,
     ),
     
     # Additional needle case 5 - Vehicle condition
@@ -112,5 +120,10 @@ TEST_CASES = [
         category="needle",
         description="Vehicle condition assessment",
     ),#0.8
-]
+)
 
+# Parametrize ids (queries truncated to 50 characters), built once at import
+TEST_IDS = tuple(
+    case.query[:50] + "..." if len(case.query) > 50 else case.query
+    for case in TEST_CASES
+)
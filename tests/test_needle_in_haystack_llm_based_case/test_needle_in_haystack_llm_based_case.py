@@ -2,12 +2,14 @@
 
 import pytest
 from src.evaluation.eval_case import EvalCase
-from tests.test_needle_in_haystack_llm_based_case.data import TEST_CASES
+from tests.test_needle_in_haystack_llm_based_case.data import TEST_CASES, TEST_IDS
 from src.helpers.agent_helper import assert_llm_based_query
 
+pytestmark = pytest.mark.llm
 
-@pytest.mark.parametrize("test_case", TEST_CASES, ids=lambda tc: tc.query[:50] + "..." if len(tc.query) > 50 else tc.query)
-def test_needle_in_haystack_llm_based_case(orchestrator, logger, test_case: EvalCase):
+
+@pytest.mark.parametrize("test_case", TEST_CASES, ids=TEST_IDS)
+def test_needle_in_haystack_llm_based_case(orchestrator, logger, judge, agent_responses, test_case: EvalCase):
     """Test LLM-based cases for NeedleInHaystackAgent.
     
     Each test case runs as a separate test instance.
@@ -15,7 +17,13 @@ def test_needle_in_haystack_llm_based_case(orchestrator, logger, test_case: Eval
     Args:
         orchestrator: OrchestratorSystem fixture from conftest
         logger: Logger fixture from conftest
+        judge: Shared JudgeEvaluator fixture from conftest
+        agent_responses: Pre-run agent responses by query, from conftest
         test_case: EvalCase object from data.py TEST_CASES
     """
-    assert_llm_based_query(orchestrator, test_case, 0.8, logger)
+    # Needle answers are exact values, so a verbatim match needs no judge call
+    assert_llm_based_query(
+        orchestrator, test_case, 0.8, logger, lexical_match=True,
+        response=agent_responses.get(test_case.query), evaluator=judge,
+    )
 
@@ -1,7 +1,16 @@
 from src.evaluation.eval_case import EvalCase
 
 
-TEST_CASES = [
+# Expected-context phrases shared by several cases
+CTX_INSURED_VEHICLE = "The insured vehicle is a 2022 BMW 320i M Sport, registration LK22 RWT, finished in Alpine White"
+CTX_JUNCTION = "collision occurred at the signal-controlled junction of Euston Road and Judd Street"
+CTX_COMPREHENSIVE_POLICY = "comprehensive private motor insurance policy"
+CTX_OWN_DAMAGE_COVER = "full own-damage protection, third-party liability"
+CTX_TOTAL_EXPOSURE = "Total claim exposure amounted to £22,625.20"
+CTX_EXCESS_650 = "policy excess of £650"
+
+
+TEST_CASES = (
     EvalCase(
         query="What are the details of the insured vehicle in this claim?",
         expected_answer=(
@@ -10,7 +19,7 @@ TEST_CASES = [
             "The vehicle is covered under a comprehensive private motor insurance policy."
         ),
         expected_context=[
-            "The insured vehicle is a 2022 BMW 320i M Sport, registration LK22 RWT, finished in Alpine White",
+            CTX_INSURED_VEHICLE,
             "18,462 miles at the time of loss",
             "in good condition",
         ],
@@ -25,7 +34,7 @@ TEST_CASES = [
             "The collision involved the insured vehicle and a third-party vehicle."
         ),
         expected_context=[
-            "collision occurred at the signal-controlled junction of Euston Road and Judd Street",
+            CTX_JUNCTION,
             "primary impact on the driver-side front quarter",
             "March 3rd at 08:20:05",
         ],
@@ -43,10 +52,11 @@ TEST_CASES = [
         ),
         expected_context=[
             "The policyholder maintains a comprehensive private motor insurance policy",
-            "The insured vehicle is a 2022 BMW 320i M Sport, registration LK22 RWT, finished in Alpine White",
+            CTX_INSURED_VEHICLE,
         ],
         category="summarization",
         description="Section-specific summarization",
+        smoke=True,
     ),
     EvalCase(
         query="What coverage does the policy include?",
@@ -55,8 +65,8 @@ TEST_CASES = [
             "personal injury benefits, and legal expense protection."
         ),
         expected_context=[
-            "comprehensive private motor insurance policy",
-            "full own-damage protection, third-party liability",
+            CTX_COMPREHENSIVE_POLICY,
+            CTX_OWN_DAMAGE_COVER,
         ],
         category="summarization",
         description="Policy coverage summarization",
@@ -70,8 +80,8 @@ TEST_CASES = [
             "time of the incident."
         ),
         expected_context=[
-            "comprehensive private motor insurance policy",
-            "full own-damage protection, third-party liability",
+            CTX_COMPREHENSIVE_POLICY,
+            CTX_OWN_DAMAGE_COVER,
             "uninsured driver coverage, personal injury benefits",
         ],
         category="summarization",
@@ -98,8 +108,8 @@ TEST_CASES = [
             "medical treatment, and recovery costs. The policy excess of £650 remains recoverable from the third-party insurer."
         ),
         expected_context=[
-            "Total claim exposure amounted to £22,625.20",
-            "policy excess of £650",
+            CTX_TOTAL_EXPOSURE,
+            CTX_EXCESS_650,
         ],
         category="summarization",
         description="Financial aspects summarization",
@@ -112,9 +122,9 @@ TEST_CASES = [
             "excess of £650 that remains recoverable from the third-party insurer."
         ),
         expected_context=[
-            "Total claim exposure amounted to £22,625.20",
+            CTX_TOTAL_EXPOSURE,
             "vehicle repairs, hire vehicle charges, medical treatment, and recovery costs",
-            "policy excess of £650",
+            CTX_EXCESS_650,
         ],
         category="summarization",
         description="Cost breakdown and financial summary",
@@ -139,7 +149,7 @@ TEST_CASES = [
             "since liability was accepted by the third party."
         ),
         expected_context=[
-            "policy excess of £650",
+            CTX_EXCESS_650,
             "collision excess under the policy is £650",
             "recoverable from the third-party insurer",
         ],
@@ -160,5 +170,10 @@ TEST_CASES = [
         category="summarization",
         description="Incident classification summarization",
     ),
-]
+)
 
+# Parametrize ids (queries truncated to 50 characters), built once at import
+TEST_IDS = tuple(
+    case.query[:50] + "..." if len(case.query) > 50 else case.query
+    for case in TEST_CASES
+)
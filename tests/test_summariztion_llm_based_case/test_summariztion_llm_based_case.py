@@ -2,12 +2,14 @@
 
 import pytest
 from src.evaluation.eval_case import EvalCase
-from tests.test_summariztion_llm_based_case.data import TEST_CASES
+from tests.test_summariztion_llm_based_case.data import TEST_CASES, TEST_IDS
 from src.helpers.agent_helper import assert_llm_based_query
 
+pytestmark = pytest.mark.llm
 
-@pytest.mark.parametrize("test_case", TEST_CASES, ids=lambda tc: tc.query[:50] + "..." if len(tc.query) > 50 else tc.query)
-def test_summariztion_llm_based_case(orchestrator, logger, test_case: EvalCase):
+
+@pytest.mark.parametrize("test_case", TEST_CASES, ids=TEST_IDS)
+def test_summariztion_llm_based_case(orchestrator, logger, judge, agent_responses, test_case: EvalCase):
     """Test LLM-based cases for SummarizationExpertAgent.
     
     Each test case runs as a separate test instance.
@@ -15,7 +17,12 @@ def test_summariztion_llm_based_case(orchestrator, logger, test_case: EvalCase):
     Args:
         orchestrator: OrchestratorSystem fixture from conftest
         logger: Logger fixture from conftest
+        judge: Shared JudgeEvaluator fixture from conftest
+        agent_responses: Pre-run agent responses by query, from conftest
         test_case: EvalCase object from data.py TEST_CASES
     """
-    assert_llm_based_query(orchestrator, test_case, 0.7, logger)
+    assert_llm_based_query(
+        orchestrator, test_case, 0.7, logger,
+        response=agent_responses.get(test_case.query), evaluator=judge,
+    )
 